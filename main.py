@@ -66,6 +66,11 @@ try:
 except ImportError as e:
     logger.warning(f"Data models not available: {e}")
 
+try:
+    import uvloop  # Faster event loop; installed with uvicorn[standard], not on Windows
+except ImportError:
+    uvloop = None
+
 
 class FilamentMonitorApp:
     """Main application orchestrator."""
@@ -371,6 +376,13 @@ class FilamentMonitorApp:
             logger.warning("No session data to export")
 
 
+def _run_event_loop(coro):
+    """Run a coroutine on uvloop when installed, otherwise on the default asyncio loop."""
+    if uvloop is not None:
+        return uvloop.run(coro)
+    return asyncio.run(coro)
+
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -462,7 +474,7 @@ def main():
         print("\nRunning in limited mode...")
 
     # Run application
-    return asyncio.run(
+    return _run_event_loop(
         app.run(
             enable_api=not args.no_api,
             enable_display=not args.no_display
@@ -17,6 +17,11 @@ from ..lib.api_server import run_server, set_system_status, connection_manager
 from ..lib.config import load_configuration, load_default_configuration, export_configuration
 from ..lib.display import FilamentSensorApp
 
+try:
+    import uvloop  # Installed with uvicorn[standard]; not available on Windows
+except ImportError:
+    uvloop = None
+
 
 logger = structlog.get_logger(__name__)
 
@@ -314,7 +319,7 @@ class FilamentSensorApplication:
             try:
                 # Update sensor 1 (moving)
                 pulse_count_1 += 5
-                demo_reading_1 = SensorReading(
+                demo_reading_1 = SensorReading.from_poll(
                     sensor_id=1,
                     has_filament=True,
                     is_moving=True,
@@ -329,7 +334,7 @@ class FilamentSensorApplication:
                 # Occasionally update sensor 2
                 if pulse_count_1 % 20 == 0:  # Every 4 seconds
                     pulse_count_2 += 2
-                    demo_reading_2 = SensorReading(
+                    demo_reading_2 = SensorReading.from_poll(
                         sensor_id=2,
                         has_filament=True,
                         is_moving=True,
@@ -512,10 +517,17 @@ Examples:
         await app.stop()
 
 
+def _run_event_loop(coro):
+    """Run a coroutine on uvloop when installed, otherwise on the default asyncio loop."""
+    if uvloop is not None:
+        return uvloop.run(coro)
+    return asyncio.run(coro)
+
+
 def main():
     """Main entry point."""
     try:
-        return asyncio.run(main_async())
+        return _run_event_loop(main_async())
     except KeyboardInterrupt:
         return 0
 
@@ -156,26 +156,35 @@ def create_app() -> FastAPI:
                 }
                 sensors.append(sensor_data)
 
-            # Build GPIO status
-            gpio_status = [
-                {"pin": "GP0", "function": "movement", "sensor_id": "sensor_1", "value": False},
-                {"pin": "GP1", "function": "runout", "sensor_id": "sensor_1", "value": False},
-                {"pin": "GP2", "function": "movement", "sensor_id": "sensor_2", "value": False},
-                {"pin": "GP3", "function": "runout", "sensor_id": "sensor_2", "value": False},
-            ]
-
-            # Update GPIO values from current readings
+            # Build GPIO status from the configured pin mapping. Raw pin
+            # states are only attached to readings with debug logging;
+            # otherwise the pins are reported from the movement and filament
+            # states they were decoded into.
+            gpio_status = []
+            configuration = status.configuration
             for sensor_id in [1, 2]:
-                reading = status.get_sensor_reading(sensor_id)
-                if reading and reading.raw_gpio_state:
+                if configuration:
+                    pins = configuration.get_sensor_pins(sensor_id)
+                    movement_pin = f"GP{pins.movement_pin}"
+                    runout_pin = f"GP{pins.runout_pin}"
+                else:
                     movement_pin = f"GP{(sensor_id - 1) * 2}"
                     runout_pin = f"GP{(sensor_id - 1) * 2 + 1}"
 
-                    for gpio in gpio_status:
-                        if gpio["pin"] == movement_pin and gpio["function"] == "movement":
-                            gpio["value"] = reading.raw_gpio_state.get(movement_pin, False)
-                        elif gpio["pin"] == runout_pin and gpio["function"] == "runout":
-                            gpio["value"] = not reading.raw_gpio_state.get(runout_pin, True)  # Inverted logic
+                reading = status.get_sensor_reading(sensor_id)
+                if reading and reading.raw_gpio_state:
+                    movement_value = reading.raw_gpio_state.get(movement_pin, False)
+                    runout_value = not reading.raw_gpio_state.get(runout_pin, True)  # Inverted logic
+                elif reading:
+                    movement_value = reading.is_moving
+                    runout_value = reading.has_filament
+                else:
+                    movement_value = runout_value = False
+
+                gpio_status.append({"pin": movement_pin, "function": "movement",
+                                    "sensor_id": f"sensor_{sensor_id}", "value": movement_value})
+                gpio_status.append({"pin": runout_pin, "function": "runout",
+                                    "sensor_id": f"sensor_{sensor_id}", "value": runout_value})
 
             response_data = {
                 "timestamp": datetime.now(),
@@ -368,7 +377,7 @@ def create_app() -> FastAPI:
             status = get_system_status()
 
             recent_alerts = status.get_recent_alerts(count)
-            alerts_data = [alert.model_dump() for alert in recent_alerts]
+            alerts_data = [alert.export_dict() for alert in recent_alerts]
 
             response_data = {
                 "total_count": len(status.recent_alerts),
@@ -96,6 +96,7 @@ class ConnectionManager:
             return
 
         disconnected = set()
+        payload = json.dumps(message, default=str)  # Serialized once for all clients
 
         for websocket in self.active_connections.copy():
             try:
@@ -106,7 +107,7 @@ class ConnectionManager:
                 if message_type not in subscriptions and message_type != "system":
                     continue
 
-                await websocket.send_text(json.dumps(message, default=str))
+                await websocket.send_text(payload)
             except Exception as e:
                 logger.warning("Error broadcasting to client", error=str(e))
                 disconnected.add(websocket)
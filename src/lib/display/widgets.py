@@ -50,7 +50,8 @@ class SensorStatusWidget(Static):
 
         # Status display with color coding
         status_color = self._get_status_color(reading.filament_status)
-        age_text = f" ({reading.age_seconds:.1f}s)" if reading.age_seconds > 0.5 else ""
+        age = reading.age_seconds
+        age_text = f" ({age:.1f}s)" if age > 0.5 else ""
 
         status_text = f"[{status_color}]{reading.filament_status.upper()}[/{status_color}]{age_text}"
         if reading.is_stale():
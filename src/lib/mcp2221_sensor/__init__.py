@@ -21,7 +21,8 @@ import logging
 import threading
 import time
 from datetime import datetime
-from typing import Dict, Optional, Any, List
+from types import MappingProxyType
+from typing import Dict, Optional, Any, List, Callable, Mapping, Tuple
 from dataclasses import dataclass
 
 try:
@@ -33,15 +34,72 @@ except ImportError:
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# GPIO pins usable for sensor inputs
+_VALID_PINS = frozenset((0, 1, 2, 3))
 
-@dataclass
+# MCP2221A GET_GPIO_VALUES command; the response carries the GP0-GP3 pin
+# values at bytes 2, 4, 6 and 8 (0xEE for pins not configured as GPIO)
+_CMD_GET_GPIO_VALUES = 0x51
+
+# Wall clock minus monotonic clock, captured once at import, used to turn
+# monotonic sample times into datetimes only when they are displayed
+_WALL_OFFSET_NS = time.time_ns() - time.monotonic_ns()
+
+
+# Seconds an enumerate_devices() scan result stays valid
+_ENUM_CACHE_TTL = 0.5
+
+# (time.monotonic() of scan, device list) from the last HID bus scan
+_enum_cache: Optional[Tuple[float, List[Dict[str, Any]]]] = None
+
+
+def _invalidate_enum_cache() -> None:
+    """Force the next enumerate_devices() call to rescan the HID bus."""
+    global _enum_cache
+    _enum_cache = None
+
+
+def _gp_bits_from_report(report) -> int:
+    """Pack the pin values of a GET_GPIO_VALUES response into bits 0-3."""
+    return (report[2] & 1) | (report[4] & 1) << 1 | (report[6] & 1) << 2 | (report[8] & 1) << 3
+
+
+def _wall_clock(monotonic_ns: int) -> datetime:
+    """Convert a time.monotonic_ns() value to a local datetime."""
+    return datetime.fromtimestamp((monotonic_ns + _WALL_OFFSET_NS) / 1e9)
+
+
+@dataclass(slots=True, frozen=True)
 class GPIOState:
-    """Current state of all GPIO pins."""
+    """Current state of all GPIO pins (immutable, one instance per sample)."""
     GP0: bool  # Sensor 1 Movement
     GP1: bool  # Sensor 1 Runout
     GP2: bool  # Sensor 2 Movement
     GP3: bool  # Sensor 2 Runout
-    timestamp: datetime
+    timestamp: Optional[datetime] = None
+    monotonic_ns: int = 0
+
+    @classmethod
+    def now(cls, bits: int) -> "GPIOState":
+        """
+        Create a state from a packed GPIO bitmap stamped with the monotonic clock.
+
+        The wall-clock timestamp is only computed when wall_time() or
+        to_dict() is called.
+        """
+        return cls(
+            bool(bits & 1),
+            bool(bits & 2),
+            bool(bits & 4),
+            bool(bits & 8),
+            monotonic_ns=time.monotonic_ns()
+        )
+
+    def wall_time(self) -> datetime:
+        """Wall-clock time of the sample."""
+        if self.timestamp is not None:
+            return self.timestamp
+        return _wall_clock(self.monotonic_ns)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
@@ -50,7 +108,7 @@ class GPIOState:
             "GP1": self.GP1,
             "GP2": self.GP2,
             "GP3": self.GP3,
-            "timestamp": self.timestamp.isoformat()
+            "timestamp": self.wall_time().isoformat()
         }
 
 
@@ -69,11 +127,32 @@ class MCP2221Manager:
     def __init__(self):
         """Initialize MCP2221 manager."""
         self._device: Optional[Device] = None
-        self._lock = threading.RLock()
+        # Plain Lock: no locked method calls another locked method
+        self._lock = threading.Lock()
+        self._connected = False
         self._is_configured = False
         self._gpio_config: Dict[str, Any] = {}
         self._interrupt_config: Dict[str, str] = {}
 
+        # USB identifiers read once when the device is detected
+        self._vid: Optional[int] = None
+        self._pid: Optional[int] = None
+
+        # Read-only views handed out by the config properties; replaced (not
+        # mutated) on reconfiguration so readers never need a copy
+        self._gpio_config_view: Mapping[str, Any] = MappingProxyType(self._gpio_config)
+        self._interrupt_config_view: Mapping[str, str] = MappingProxyType(self._interrupt_config)
+
+        # Bound GPIO_read() of the configured device (one HID report for GP0-GP3)
+        self._read_fn: Optional[Callable[[], Tuple[Any, ...]]] = None
+
+        # Reused result of read_gpio_states(), overwritten on every read
+        self._state_dict: Dict[str, int] = {"GP0": 0, "GP1": 0, "GP2": 0, "GP3": 0}
+
+        # Raw GET_GPIO_VALUES reader returning the packed bitmap, bound only
+        # for real EasyMCP2221 devices that expose send_cmd()
+        self._read_bits_fn: Optional[Callable[[], int]] = None
+
         logger.info("MCP2221Manager initialized")
 
     def detect_device(self) -> bool:
@@ -89,25 +168,23 @@ class MCP2221Manager:
                     logger.error("EasyMCP2221 library not available")
                     return False
 
-                # Try to connect to device
+                # Device() opens the adapter by the MCP2221A VID/PID and raises
+                # if none is attached, so no further identity check is needed
                 self._device = Device()
 
-                # Verify it's the correct device
-                if (hasattr(self._device, 'VID') and
-                    hasattr(self._device, 'PID') and
-                    self._device.VID == self.VID and
-                    self._device.PID == self.PID):
+                # Read the identifiers once; device_info reuses them
+                self._vid = self._device.VID
+                self._pid = self._device.PID
 
-                    logger.info(f"MCP2221A detected: VID={self._device.VID:04X}, PID={self._device.PID:04X}")
-                    return True
-                else:
-                    logger.warning("Connected device is not MCP2221A")
-                    self._device = None
-                    return False
+                logger.info(f"MCP2221A detected: VID={self._vid:04X}, PID={self._pid:04X}")
+                self._connected = True
+                return True
 
             except Exception as e:
                 logger.error(f"Failed to detect MCP2221A device: {e}")
                 self._device = None
+                self._connected = False
+                _invalidate_enum_cache()
                 return False
 
     def is_connected(self) -> bool:
@@ -118,7 +195,7 @@ class MCP2221Manager:
             bool: True if device is connected and responsive
         """
         with self._lock:
-            if self._device is None:
+            if self._device is None or not self._connected:
                 return False
 
             try:
@@ -169,7 +246,11 @@ class MCP2221Manager:
                     logger.debug(f"Error during disconnect: {e}")
                 finally:
                     self._device = None
+                    self._read_fn = None
+                    self._read_bits_fn = None
+                    self._connected = False
                     self._is_configured = False
+                    _invalidate_enum_cache()
                     logger.info("Device disconnected")
 
     def configure_gpio(self, config: Dict[str, Any]) -> None:
@@ -184,25 +265,24 @@ class MCP2221Manager:
             ValueError: If invalid pin configuration
         """
         with self._lock:
-            if not self.is_connected():
+            if self._device is None:
                 raise ConnectionError("MCP2221A device not connected")
 
             try:
                 # Validate pin numbers
                 self._validate_gpio_config(config)
 
-                # Configure all pins as GPIO inputs with pull-ups
-                self._device.set_pin_function(gp0="GPIO_IN")
-                self._device.set_pin_function(gp1="GPIO_IN")
-                self._device.set_pin_function(gp2="GPIO_IN")
-                self._device.set_pin_function(gp3="GPIO_IN")
+                # Configure all pins as GPIO inputs in a single SRAM write;
+                # GPIO_IN also sets the pin direction, so no per-pin
+                # direction writes are needed
+                self._device.set_pin_function(
+                    gp0="GPIO_IN",
+                    gp1="GPIO_IN",
+                    gp2="GPIO_IN",
+                    gp3="GPIO_IN"
+                )
 
                 # Enable pull-up resistors for all sensor pins
-                self._device.GPIO_0_direction = "input"
-                self._device.GPIO_1_direction = "input"
-                self._device.GPIO_2_direction = "input"
-                self._device.GPIO_3_direction = "input"
-
                 # Note: EasyMCP2221 may not expose pullup properties directly
                 # This is device/library dependent
                 try:
@@ -213,7 +293,10 @@ class MCP2221Manager:
                 except AttributeError:
                     logger.warning("Pull-up configuration not available in this EasyMCP2221 version")
 
-                self._gpio_config = config.copy()
+                self._gpio_config = dict(config)
+                self._gpio_config_view = MappingProxyType(self._gpio_config)
+                self._read_fn = self._device.GPIO_read
+                self._read_bits_fn = self._raw_bits_reader(self._device)
                 self._is_configured = True
 
                 logger.info("GPIO pins configured successfully")
@@ -233,7 +316,18 @@ class MCP2221Manager:
         Raises:
             ValueError: If configuration is invalid
         """
-        valid_pins = {0, 1, 2, 3}
+        pins = [
+            pin
+            for sensor_id, sensor_config in config.items()
+            if sensor_id.startswith('sensor')
+            for pin in (sensor_config.get('movement_pin'), sensor_config.get('runout_pin'))
+        ]
+
+        # Fast path: every pin valid and none used twice
+        if _VALID_PINS.issuperset(pins) and len(pins) == len(set(pins)):
+            return
+
+        # Slow path: walk the sensors again to report which pin is at fault
         used_pins = set()
 
         for sensor_id, sensor_config in config.items():
@@ -242,9 +336,9 @@ class MCP2221Manager:
                 runout_pin = sensor_config.get('runout_pin')
 
                 # Check pin numbers are valid
-                if movement_pin not in valid_pins:
+                if movement_pin not in _VALID_PINS:
                     raise ValueError(f"Invalid GPIO pin {movement_pin} for {sensor_id} movement")
-                if runout_pin not in valid_pins:
+                if runout_pin not in _VALID_PINS:
                     raise ValueError(f"Invalid GPIO pin {runout_pin} for {sensor_id} runout")
 
                 # Check for pin conflicts
@@ -260,6 +354,15 @@ class MCP2221Manager:
         """
         Read current state of all GPIO pins.
 
+        All four pins are fetched with a single GPIO_read() call, which maps
+        to one GET_GPIO_VALUES HID report instead of one per pin. No separate
+        liveness probe is issued; a USB I/O error marks the device as
+        disconnected so the ConnectionManager health check can reconnect.
+
+        The same dict is returned on every call and overwritten in place, so
+        callers that keep a sample beyond the next read must copy() it. Hot
+        loops should prefer read_gpio_bits(), which allocates nothing.
+
         Returns:
             Dict[str, int]: Current pin states (0 or 1)
 
@@ -267,35 +370,101 @@ class MCP2221Manager:
             ConnectionError: If device not connected
         """
         with self._lock:
-            if not self.is_connected():
+            v0, v1, v2, v3 = self._read_gpio_values()
+            states = self._state_dict
+            states["GP0"] = int(v0)
+            states["GP1"] = int(v1)
+            states["GP2"] = int(v2)
+            states["GP3"] = int(v3)
+        return states
+
+    def read_gpio_bits(self) -> int:
+        """
+        Read current state of all GPIO pins as a packed bitmap.
+
+        Bit N holds the state of GPN, so edges between two reads can be found
+        with a single XOR instead of comparing per-pin dicts.
+
+        Returns:
+            int: Pin states packed into bits 0-3
+
+        Raises:
+            ConnectionError: If device not connected
+        """
+        with self._lock:
+            return self._read_gpio_bits_locked()
+
+    def _read_gpio_bits_locked(self) -> int:
+        """Read the packed GPIO bitmap. Caller must hold the lock."""
+        read_bits = self._read_bits_fn
+        if read_bits is not None:
+            return self._usb_read(read_bits)
+
+        v0, v1, v2, v3 = self._read_gpio_values()
+        return int(v0) | int(v1) << 1 | int(v2) << 2 | int(v3) << 3
+
+    def _read_gpio_values(self) -> Tuple[Any, ...]:
+        """Issue one GPIO_read() report. Caller must hold the lock."""
+        # Bound once by configure_gpio(); cleared again by disconnect()
+        read = self._read_fn
+        if read is None:
+            if self._device is None:
                 raise ConnectionError("MCP2221A device not connected")
+            read = self._device.GPIO_read
 
-            try:
-                return {
-                    "GP0": int(self._device.GPIO_0_value),
-                    "GP1": int(self._device.GPIO_1_value),
-                    "GP2": int(self._device.GPIO_2_value),
-                    "GP3": int(self._device.GPIO_3_value)
-                }
-            except Exception as e:
-                logger.error(f"Failed to read GPIO states: {e}")
-                raise
+        return self._usb_read(read)
+
+    @staticmethod
+    def _raw_bits_reader(device: Any) -> Optional[Callable[[], int]]:
+        """
+        Build a packed-bitmap reader that bypasses GPIO_read().
+
+        Sends GET_GPIO_VALUES through the device's send_cmd() and decodes the
+        pin bytes straight into bits, skipping the per-pin tuple that
+        GPIO_read() builds. Only used for genuine EasyMCP2221 devices.
+
+        Args:
+            device: Connected device
+
+        Returns:
+            Optional[Callable[[], int]]: Reader, or None if unsupported
+        """
+        if Device is None or not isinstance(device, Device):
+            return None
+
+        send_cmd = getattr(device, 'send_cmd', None)
+        if send_cmd is None:
+            return None
+
+        command = [_CMD_GET_GPIO_VALUES]
+
+        def read_bits() -> int:
+            return _gp_bits_from_report(send_cmd(command))
+
+        return read_bits
+
+    def _usb_read(self, read: Callable[[], Any]) -> Any:
+        """Run a device read, marking the device disconnected on USB errors."""
+        try:
+            return read()
+        except (OSError, ValueError) as e:
+            # hidapi reports unplugged/closed devices as OSError/ValueError
+            self._connected = False
+            logger.error(f"USB error reading GPIO states: {e}")
+            raise
+        except Exception as e:
+            logger.error(f"Failed to read GPIO states: {e}")
+            raise
 
     def read_gpio_state_object(self) -> GPIOState:
         """
         Read GPIO states as structured object.
 
         Returns:
-            GPIOState: Current pin states with timestamp
+            GPIOState: Current pin states with monotonic sample time
         """
-        states = self.read_gpio_states()
-        return GPIOState(
-            GP0=bool(states["GP0"]),
-            GP1=bool(states["GP1"]),
-            GP2=bool(states["GP2"]),
-            GP3=bool(states["GP3"]),
-            timestamp=datetime.now()
-        )
+        with self._lock:
+            return GPIOState.now(self._read_gpio_bits_locked())
 
     def configure_interrupts(self, interrupt_config: Dict[str, str]) -> None:
         """
@@ -307,7 +476,8 @@ class MCP2221Manager:
         Args:
             interrupt_config: Pin interrupt configuration
         """
-        self._interrupt_config = interrupt_config.copy()
+        self._interrupt_config = dict(interrupt_config)
+        self._interrupt_config_view = MappingProxyType(self._interrupt_config)
         logger.info(f"Interrupt configuration stored: {interrupt_config}")
 
     @property
@@ -317,29 +487,44 @@ class MCP2221Manager:
             return {}
 
         return {
-            "VID": self._device.VID,
-            "PID": self._device.PID,
+            "VID": self._vid,
+            "PID": self._pid,
             "connected": True,
             "configured": self._is_configured
         }
 
     @property
-    def interrupt_config(self) -> Dict[str, str]:
-        """Get current interrupt configuration."""
-        return self._interrupt_config.copy()
+    def gpio_config(self) -> Mapping[str, Any]:
+        """Get current GPIO configuration (read-only view)."""
+        return self._gpio_config_view
+
+    @property
+    def interrupt_config(self) -> Mapping[str, str]:
+        """Get current interrupt configuration (read-only view)."""
+        return self._interrupt_config_view
 
     @staticmethod
     def enumerate_devices() -> List[Dict[str, Any]]:
         """
         Enumerate available MCP2221A devices.
 
+        Scans are cached for _ENUM_CACHE_TTL seconds so repeated calls within
+        one status/poll cycle share a single HID bus walk. The cache is
+        dropped on disconnect and on a failed detect_device().
+
         Returns:
             List[Dict]: List of available device information
         """
+        global _enum_cache
+
+        cached = _enum_cache
+        if cached is not None and time.monotonic() - cached[0] < _ENUM_CACHE_TTL:
+            return list(cached[1])
+
         try:
             import hid
             devices = hid.enumerate(MCP2221Manager.VID, MCP2221Manager.PID)
-            return [
+            result = [
                 {
                     'vendor_id': dev['vendor_id'],
                     'product_id': dev['product_id'],
@@ -348,6 +533,8 @@ class MCP2221Manager:
                 }
                 for dev in devices
             ]
+            _enum_cache = (time.monotonic(), result)
+            return list(result)
         except ImportError:
             logger.warning("hid library not available for device enumeration")
             return []
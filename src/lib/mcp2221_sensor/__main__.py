@@ -6,16 +6,16 @@ interface, including connection testing, GPIO monitoring, and pulse detection.
 """
 
 import argparse
-import json
 import logging
+import queue
 import sys
+import threading
 import time
 from datetime import datetime
-from typing import Dict, Any
+from typing import Optional
 
-from . import MCP2221Manager, GPIOState
-from .pulse_detector import PulseDetector, create_sensor_pulse_detector
-from .connection import ConnectionManager, create_mcp2221_connection_manager, ConnectionState
+# pulse_detector and connection are imported by the commands that use them
+from . import MCP2221Manager
 
 # Configure logging
 logging.basicConfig(
@@ -24,6 +24,83 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Idle backoff for the CLI polling loops
+IDLE_BACKOFF_MS = 500
+MAX_IDLE_INTERVAL_MS = 50
+
+
+# Lines queued by the polling loop and written to stdout by a printer thread,
+# so a slow terminal or pipe never stalls GPIO sampling. None stops the thread.
+_printer_q: "queue.SimpleQueue[Optional[str]]" = queue.SimpleQueue()
+
+
+def _printer_loop() -> None:
+    """Drain queued lines to stdout until the stop sentinel arrives."""
+    while True:
+        line = _printer_q.get()
+        if line is None:
+            break
+        sys.stdout.write(line + "\n")
+        if _printer_q.empty():
+            sys.stdout.flush()
+    sys.stdout.flush()
+
+
+def _start_printer() -> threading.Thread:
+    """Start the stdout printer thread."""
+    thread = threading.Thread(target=_printer_loop, daemon=True, name="GPIOPrinter")
+    thread.start()
+    return thread
+
+
+def _stop_printer(thread: threading.Thread) -> None:
+    """Flush pending lines and stop the printer thread."""
+    _printer_q.put(None)
+    thread.join()
+
+
+def _fmt_time(dt: datetime) -> str:
+    """Format a datetime as HH:MM:SS.mmm."""
+    return f"{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}.{dt.microsecond // 1000:03d}"
+
+
+class _PollScheduler:
+    """
+    Fixed-rate poll timing with idle backoff.
+
+    Sleeps until the next tick rather than a fixed interval after each poll,
+    so the poll period stays at polling_interval_ms regardless of how long the
+    read took. After IDLE_BACKOFF_MS without activity the period doubles up
+    to MAX_IDLE_INTERVAL_MS, and snaps back on the next state change.
+    """
+
+    def __init__(self, polling_interval_ms: int):
+        self.base_period = polling_interval_ms / 1000.0
+        self.max_period = max(self.base_period, MAX_IDLE_INTERVAL_MS / 1000.0)
+        self.period = self.base_period
+        self._last_activity = time.monotonic()
+        self._next_tick = self._last_activity
+
+    def mark_activity(self) -> None:
+        """Record a state change and return to the base polling rate."""
+        self._last_activity = time.monotonic()
+        self.period = self.base_period
+
+    def wait(self) -> None:
+        """Sleep until the next tick."""
+        now = time.monotonic()
+        if now - self._last_activity > IDLE_BACKOFF_MS / 1000.0:
+            self.period = min(self.period * 2, self.max_period)
+
+        self._next_tick += self.period
+        delay = self._next_tick - now
+        if delay < 0:
+            # Overran the tick; resync instead of bursting to catch up
+            self._next_tick = now
+            delay = 0.0
+
+        time.sleep(delay)
+
 
 def test_connection() -> bool:
     """
@@ -95,14 +172,16 @@ def test_connection() -> bool:
     # Test connection manager
     print("4. Testing connection manager...")
     try:
-        conn_manager = create_mcp2221_connection_manager(manager)
-        if conn_manager.connect():
-            print("✅ PASS: Connection manager working")
-            stats = conn_manager.get_stats()
-            print(f"   Connection stats: {stats.success_rate:.2%} success rate")
-        else:
-            print("❌ FAIL: Connection manager failed")
-            return False
+        from .connection import create_mcp2221_connection_manager
+
+        with create_mcp2221_connection_manager(manager) as conn_manager:
+            if conn_manager.connect():
+                print("✅ PASS: Connection manager working")
+                stats = conn_manager.get_stats()
+                print(f"   Connection stats: {stats.success_rate:.2%} success rate")
+            else:
+                print("❌ FAIL: Connection manager failed")
+                return False
     except Exception as e:
         print(f"❌ FAIL: Connection manager error - {e}")
         return False
@@ -112,13 +191,14 @@ def test_connection() -> bool:
     return True
 
 
-def monitor_gpio(duration: int = 30, show_pulses: bool = False) -> None:
+def monitor_gpio(duration: int = 30, show_pulses: bool = False, verbose: bool = True) -> None:
     """
     Monitor GPIO pins for state changes.
 
     Args:
         duration: Monitoring duration in seconds
         show_pulses: Whether to show pulse detection
+        verbose: Print each state change and pulse (summary is always shown)
     """
     print(f"=== GPIO Monitoring ({duration}s) ===")
     print()
@@ -132,7 +212,8 @@ def monitor_gpio(duration: int = 30, show_pulses: bool = False) -> None:
     # Configure for dual sensors
     config = {
         "sensor1": {"movement_pin": 0, "runout_pin": 1, "debounce_ms": 2},
-        "sensor2": {"movement_pin": 2, "runout_pin": 3, "debounce_ms": 2}
+        "sensor2": {"movement_pin": 2, "runout_pin": 3, "debounce_ms": 2},
+        "polling_interval_ms": 10
     }
 
     try:
@@ -146,53 +227,99 @@ def monitor_gpio(duration: int = 30, show_pulses: bool = False) -> None:
         print(f"❌ Configuration failed: {e}")
         return
 
+    from .connection import ConnectionState, create_mcp2221_connection_manager
+    from .pulse_detector import create_sensor_pulse_detector
+
+    # Health monitoring and background reconnection while the device is unplugged
+    conn_manager = create_mcp2221_connection_manager(manager)
+    conn_manager.connect()
+    conn_manager.add_consumer()
+
     # Setup pulse detection if requested
     pulse_detector = None
     if show_pulses:
         pulse_detector = create_sensor_pulse_detector([0, 2], debounce_ms=2)
 
-        def pulse_callback(event):
-            print(f"   PULSE: Pin {event.pin} at {event.timestamp.strftime('%H:%M:%S.%f')[:-3]}")
+        # Quiet mode only needs the statistics, so no per-pulse callback
+        if verbose:
+            def pulse_callback(event):
+                _printer_q.put_nowait(f"   PULSE: Pin {event.pin} at {_fmt_time(event.wall_clock())}")
 
-        pulse_detector.register_pulse_callback(0, pulse_callback)
-        pulse_detector.register_pulse_callback(2, pulse_callback)
+            pulse_detector.register_pulse_callback(0, pulse_callback)
+            pulse_detector.register_pulse_callback(2, pulse_callback)
 
         print("Pulse detection enabled (2ms debouncing)")
         print()
 
     # Monitor GPIO states
-    start_time = time.time()
-    last_states = None
+    scheduler = _PollScheduler(config["polling_interval_ms"])
+    deadline_ns = time.monotonic_ns() + duration * 1_000_000_000
+    last_bits = -1  # Forces the initial state to be printed
     update_count = 0
 
     try:
-        while (time.time() - start_time) < duration:
-            try:
-                # Read current states
-                current_states = manager.read_gpio_states()
-                current_time = datetime.now()
-
-                # Check for changes
-                if current_states != last_states:
-                    print(f"[{current_time.strftime('%H:%M:%S.%f')[:-3]}] "
-                          f"GP0={current_states['GP0']} GP1={current_states['GP1']} "
-                          f"GP2={current_states['GP2']} GP3={current_states['GP3']}")
-
-                    last_states = current_states.copy()
-                    update_count += 1
-
-                # Update pulse detector
-                if pulse_detector:
-                    pulse_detector.update_all_pins(current_states)
-
-                # Brief pause
-                time.sleep(0.01)  # 10ms polling
-
-            except KeyboardInterrupt:
-                break
-            except Exception as e:
-                print(f"❌ Monitoring error: {e}")
-                break
+        printer = _start_printer()
+        try:
+            while time.monotonic_ns() < deadline_ns:
+                try:
+                    # Pause polling until the ConnectionManager has reconnected
+                    if not conn_manager.is_connected():
+                        if conn_manager.get_state() == ConnectionState.FAILED:
+                            _printer_q.put_nowait("❌ Reconnection failed")
+                            break
+                        remaining = (deadline_ns - time.monotonic_ns()) / 1e9
+                        if conn_manager.wait_for_connection(timeout=min(max(remaining, 0), 1.0)):
+                            _printer_q.put_nowait("🔌 Device reconnected")
+                            last_bits = -1
+                        continue
+
+                    # Read current states (bit N = GPN)
+                    try:
+                        cur_bits = manager.read_gpio_bits()
+                    except (OSError, ValueError) as e:
+                        # USB dropped (ConnectionError is an OSError too)
+                        _printer_q.put_nowait(f"⚠️  Device connection lost: {e}")
+                        conn_manager.connection_lost()
+                        continue
+
+                    # Check for changes; the change line (and the wall-clock
+                    # time it shows) is only built when it will be printed
+                    if cur_bits != last_bits:
+                        if verbose:
+                            current_time = datetime.now()
+                            changed = []
+                            diff = (cur_bits ^ last_bits) & 0xF
+                            while diff:
+                                changed.append(f"GP{(diff & -diff).bit_length() - 1}")
+                                diff &= diff - 1
+
+                            _printer_q.put_nowait(
+                                f"[{_fmt_time(current_time)}] "
+                                f"GP0={cur_bits & 1} GP1={cur_bits >> 1 & 1} "
+                                f"GP2={cur_bits >> 2 & 1} GP3={cur_bits >> 3 & 1} "
+                                f"(changed: {' '.join(changed)})"
+                            )
+
+                        last_bits = cur_bits
+                        update_count += 1
+                        scheduler.mark_activity()
+                        conn_manager.notify_activity()
+
+                    # Update pulse detector
+                    if pulse_detector:
+                        pulse_detector.update_bits(cur_bits)
+
+                    scheduler.wait()
+
+                except KeyboardInterrupt:
+                    break
+                except Exception as e:
+                    _printer_q.put_nowait(f"❌ Monitoring error: {e}")
+                    break
+        finally:
+            _stop_printer(printer)
+            conn_manager.remove_consumer()
+            conn_manager.close()
 
         print()
         print(f"Monitoring completed: {update_count} state changes detected")
@@ -268,6 +395,8 @@ def pulse_test(duration: int = 10, pin: int = 0) -> None:
         duration: Test duration in seconds
         pin: GPIO pin to monitor (0-3)
     """
+    from .pulse_detector import PulseDetector
+
     print(f"=== Pulse Detection Test (Pin {pin}, {duration}s) ===")
     print()
 
@@ -283,7 +412,10 @@ def pulse_test(duration: int = 10, pin: int = 0) -> None:
 
     try:
         # Configure GPIO
-        config = {"test_sensor": {"movement_pin": pin, "runout_pin": (pin + 1) % 4}}
+        config = {
+            "test_sensor": {"movement_pin": pin, "runout_pin": (pin + 1) % 4},
+            "polling_interval_ms": 1
+        }
         manager.configure_gpio(config)
 
         # Setup pulse detector
@@ -295,24 +427,25 @@ def pulse_test(duration: int = 10, pin: int = 0) -> None:
         print("Press Ctrl+C to stop")
         print()
 
-        start_time = time.time()
+        scheduler = _PollScheduler(config["polling_interval_ms"])
+        deadline = time.monotonic() + duration
         pulse_count = 0
 
         def pulse_callback(event):
             nonlocal pulse_count
             pulse_count += 1
             print(f"Pulse #{pulse_count}: Pin {event.pin} at "
-                  f"{event.timestamp.strftime('%H:%M:%S.%f')[:-3]} "
+                  f"{_fmt_time(event.wall_clock())} "
                   f"({event.previous_state} -> {event.current_state})")
 
         detector.register_pulse_callback(pin, pulse_callback)
 
         # Monitor for pulses
-        while (time.time() - start_time) < duration:
+        while time.monotonic() < deadline:
             try:
-                states = manager.read_gpio_states()
-                detector.update_all_pins(states)
-                time.sleep(0.001)  # 1ms polling
+                if detector.update_bits(manager.read_gpio_bits()):
+                    scheduler.mark_activity()
+                scheduler.wait()
             except KeyboardInterrupt:
                 break
 
@@ -330,8 +463,8 @@ def pulse_test(duration: int = 10, pin: int = 0) -> None:
         print(f"❌ Pulse test failed: {e}")
 
 
-def main():
-    """Main CLI entry point."""
+def _make_parser() -> argparse.ArgumentParser:
+    """Build the CLI argument parser."""
     parser = argparse.ArgumentParser(
         description="MCP2221A Sensor Library CLI",
         formatter_class=argparse.RawDescriptionHelpFormatter
@@ -364,6 +497,16 @@ def main():
     parser.add_argument('--debug', action='store_true', help='Enable debug logging')
     parser.add_argument('--quiet', '-q', action='store_true', help='Quiet mode')
 
+    return parser
+
+
+# Built once at import rather than on every main() call
+_PARSER = _make_parser()
+
+
+def main():
+    """Main CLI entry point."""
+    parser = _PARSER
     args = parser.parse_args()
 
     # Configure logging level
@@ -378,7 +521,7 @@ def main():
         sys.exit(0 if success else 1)
 
     elif args.command == 'monitor':
-        monitor_gpio(duration=args.duration, show_pulses=args.pulses)
+        monitor_gpio(duration=args.duration, show_pulses=args.pulses, verbose=not args.quiet)
 
     elif args.command == 'info':
         device_info()
@@ -7,15 +7,28 @@ monitoring, and graceful recovery from USB disconnection events.
 
 import asyncio
 import logging
+import random
 import threading
 import time
 from datetime import datetime, timedelta
-from typing import Optional, Callable, Dict, Any
-from dataclasses import dataclass
+from collections import deque
+from typing import Optional, Callable, Dict, Any, Sequence, Tuple
+from dataclasses import dataclass, replace
 from enum import Enum
 
 logger = logging.getLogger(__name__)
 
+# Number of connection attempts kept in ConnectionStats.recent_attempts
+RECENT_ATTEMPTS = 20
+
+# Health check timing: fast while consumers report activity, backing off
+# towards HEALTH_CHECK_IDLE_MAX_S once they go quiet
+HEALTH_CHECK_INTERVAL_S = 5.0
+HEALTH_CHECK_ACTIVE_S = 0.5
+HEALTH_CHECK_IDLE_MAX_S = 30.0
+HEALTH_CHECK_BACKOFF = 1.5
+ACTIVITY_WINDOW_NS = 2_000_000_000
+
 
 class ConnectionState(Enum):
     """Connection state enumeration."""
@@ -26,7 +39,7 @@ class ConnectionState(Enum):
     FAILED = "failed"
 
 
-@dataclass
+@dataclass(slots=True)
 class ConnectionAttempt:
     """Individual connection attempt record."""
     attempt_number: int
@@ -36,7 +49,7 @@ class ConnectionAttempt:
     duration_ms: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ConnectionStats:
     """Connection statistics and health metrics."""
     total_attempts: int = 0
@@ -46,11 +59,11 @@ class ConnectionStats:
     last_successful_connection: Optional[datetime] = None
     last_failure: Optional[datetime] = None
     average_connection_time_ms: float = 0.0
-    recent_attempts: list = None
+    recent_attempts: Optional[Sequence[ConnectionAttempt]] = None
 
     def __post_init__(self):
         if self.recent_attempts is None:
-            self.recent_attempts = []
+            self.recent_attempts = deque(maxlen=RECENT_ATTEMPTS)
 
     @property
     def success_rate(self) -> float:
@@ -107,21 +120,53 @@ class ConnectionManager:
         # Connection state
         self._state = ConnectionState.DISCONNECTED
         self._connection_time: Optional[datetime] = None
+
+        # (state, time.monotonic_ns() when CONNECTED was entered or 0), rebound
+        # as one object so lock-free readers never see a torn state/time pair
+        self._state_snapshot: Tuple[ConnectionState, int] = (ConnectionState.DISCONNECTED, 0)
         self._retry_count = 0
         self._current_retry_delay = initial_retry_delay
 
+        # Set while CONNECTED so pollers can block instead of retrying reads
+        self._connected_event = threading.Event()
+
         # Statistics and monitoring
         self._stats = ConnectionStats()
         self._lock = threading.RLock()
 
-        # Event callbacks
-        self._state_change_callbacks: list[Callable[[ConnectionState], None]] = []
-        self._connection_callbacks: list[Callable[[bool], None]] = []
+        # Snapshot returned by get_stats(), rebuilt only after _stats changes
+        self._cached_stats: Optional[ConnectionStats] = None
+        self._stats_dirty = True
+
+        # Running mean/count of timed successes within recent_attempts
+        self._success_ms_mean = 0.0
+        self._success_ms_count = 0
+
+        # Serialises retry loops; held while backing off so that _lock (and
+        # with it get_stats/is_connected/disconnect) is never held across a wait
+        self._connect_lock = threading.Lock()
+
+        # Set by disconnect() to cancel a pending retry wait immediately
+        self._cancel_retry = threading.Event()
+
+        # Set while a background reconnect thread is running
+        self._reconnecting = threading.Event()
+
+        # Event callbacks; copy-on-write tuples so dispatch needs no lock
+        self._state_change_callbacks: Tuple[Callable[[ConnectionState], None], ...] = ()
+        self._connection_callbacks: Tuple[Callable[[bool], None], ...] = ()
 
         # Background monitoring
         self._monitor_thread: Optional[threading.Thread] = None
         self._stop_monitoring = threading.Event()
 
+        # Health checks only run while someone consumes the connection;
+        # _monitor_wake interrupts the monitor's wait on consumer/activity changes
+        self._active_consumers = 0
+        self._last_activity_ns = 0
+        self._monitor_idle = True
+        self._monitor_wake = threading.Event()
+
         logger.info("ConnectionManager initialized")
 
     def connect(self) -> bool:
@@ -131,18 +176,37 @@ class ConnectionManager:
         Returns:
             bool: True if connection successful
         """
-        with self._lock:
-            if self._state == ConnectionState.CONNECTED:
-                return True
+        with self._connect_lock:
+            with self._lock:
+                if self._state == ConnectionState.CONNECTED:
+                    return True
 
-            self._set_state(ConnectionState.CONNECTING)
-            self._retry_count = 0
-            self._current_retry_delay = self.initial_retry_delay
+                self._set_state(ConnectionState.CONNECTING)
+                self._retry_count = 0
+                self._current_retry_delay = self.initial_retry_delay
+                self._cancel_retry.clear()
 
             return self._attempt_connection_with_retries()
 
+    async def connect_async(self) -> bool:
+        """
+        Attempt to establish connection without blocking the event loop.
+
+        Runs connect() in a worker thread, so retries and backoff waits do not
+        stall other coroutines (e.g. API request handlers).
+
+        Returns:
+            bool: True if connection successful
+        """
+        return await asyncio.to_thread(self.connect)
+
     def _attempt_connection_with_retries(self) -> bool:
-        """Attempt connection with exponential backoff."""
+        """
+        Attempt connection with exponential backoff and full jitter.
+
+        Caller holds _connect_lock but not _lock; _lock is only taken briefly
+        to record each attempt, so waiting for a retry never blocks readers.
+        """
         while self._retry_count < self.max_retry_attempts:
             attempt_start = datetime.now()
 
@@ -161,13 +225,20 @@ class ConnectionManager:
                     duration_ms=duration
                 )
 
-                self._record_attempt(attempt)
-
-                if success:
-                    self._connection_successful()
-                    return True
-                else:
+                if not success:
                     attempt.error_message = "Connection failed"
+
+                with self._lock:
+                    self._record_attempt(attempt)
+
+                    # disconnect() during the attempt wins over a late success
+                    if self._cancel_retry.is_set():
+                        return False
+
+                    if success:
+                        self._connection_successful()
+                        return True
+
                     self._connection_failed(attempt.error_message)
 
             except Exception as e:
@@ -182,15 +253,23 @@ class ConnectionManager:
                     error_message=error_msg
                 )
 
-                self._record_attempt(attempt)
-                self._connection_failed(error_msg)
+                with self._lock:
+                    self._record_attempt(attempt)
+                    if self._cancel_retry.is_set():
+                        return False
+                    self._connection_failed(error_msg)
 
             # Prepare for next retry
             self._retry_count += 1
 
             if self._retry_count < self.max_retry_attempts:
-                logger.warning(f"Connection failed, retrying in {self._current_retry_delay:.1f}s...")
-                time.sleep(self._current_retry_delay)
+                # Full jitter: wait a random time up to the backoff ceiling so
+                # devices that dropped together do not retry in lockstep
+                delay = random.uniform(0, self._current_retry_delay)
+                logger.warning(f"Connection failed, retrying in {delay:.1f}s...")
+                if self._cancel_retry.wait(delay):
+                    logger.info("Connection retry cancelled")
+                    return False
 
                 # Exponential backoff
                 self._current_retry_delay = min(
@@ -199,7 +278,8 @@ class ConnectionManager:
                 )
 
         # All retry attempts exhausted
-        self._set_state(ConnectionState.FAILED)
+        with self._lock:
+            self._set_state(ConnectionState.FAILED)
         logger.error(f"Connection failed after {self.max_retry_attempts} attempts")
         return False
 
@@ -207,35 +287,42 @@ class ConnectionManager:
         """Handle successful connection."""
         self._connection_time = datetime.now()
         self._stats.last_successful_connection = self._connection_time
+        self._stats_dirty = True
         self._retry_count = 0
         self._current_retry_delay = self.initial_retry_delay
 
         self._set_state(ConnectionState.CONNECTED)
         self._trigger_connection_callbacks(True)
 
-        # Start connection monitoring
-        self._start_monitoring()
+        # Start connection monitoring if anyone is listening
+        self._ensure_monitoring()
 
         logger.info("Connection established successfully")
 
     def _connection_failed(self, error_message: str) -> None:
         """Handle connection failure."""
         self._stats.last_failure = datetime.now()
+        self._stats_dirty = True
         self._trigger_connection_callbacks(False)
 
         logger.warning(f"Connection attempt failed: {error_message}")
 
     def disconnect(self) -> None:
-        """Disconnect from device."""
+        """Disconnect from device, cancelling any retry in progress."""
         with self._lock:
+            # Set under _lock so a reconnect() entering concurrently either
+            # clears it before this disconnect or sees it set afterwards
+            self._cancel_retry.set()
+
             if self._state == ConnectionState.DISCONNECTED:
                 return
 
-            self._stop_monitoring_thread()
             self._connection_time = None
             self._set_state(ConnectionState.DISCONNECTED)
 
-            logger.info("Disconnected from device")
+        # Joined outside _lock: the monitor thread may be waiting for it
+        self._stop_monitoring_thread()
+        logger.info("Disconnected from device")
 
     def reconnect(self) -> bool:
         """
@@ -244,18 +331,100 @@ class ConnectionManager:
         Returns:
             bool: True if reconnection successful
         """
+        return self._reconnect(after_loss=False)
+
+    def _reconnect(self, after_loss: bool) -> bool:
+        """
+        Reconnect, clearing any earlier cancellation on entry.
+
+        A disconnect() after entry cancels the reconnection. With after_loss,
+        a disconnect() since connection_lost() (which left the state
+        RECONNECTING) cancels it before it starts.
+        """
         logger.info("Attempting reconnection...")
 
-        with self._lock:
-            self._set_state(ConnectionState.RECONNECTING)
+        with self._connect_lock:
+            with self._lock:
+                if after_loss and self._state != ConnectionState.RECONNECTING:
+                    return False
+                self._set_state(ConnectionState.RECONNECTING)
+                self._cancel_retry.clear()
+
             self._stop_monitoring_thread()
 
-            # Reset retry parameters for reconnection
-            self._retry_count = 0
-            self._current_retry_delay = self.initial_retry_delay
+            with self._lock:
+                if self._cancel_retry.is_set():
+                    return False
+
+                # Reset retry parameters for reconnection
+                self._retry_count = 0
+                self._current_retry_delay = self.initial_retry_delay
 
             return self._attempt_connection_with_retries()
 
+    def connection_lost(self) -> None:
+        """
+        Report that the device stopped responding and reconnect in the background.
+
+        Called by the health monitor and by pollers that hit a USB error, so
+        a dropped device is noticed without waiting for the next health check.
+        Only the first report while connected starts a reconnection, and at
+        most one background reconnect thread exists at a time.
+        """
+        with self._lock:
+            if self._state != ConnectionState.CONNECTED or self._reconnecting.is_set():
+                return
+            self._set_state(ConnectionState.RECONNECTING)
+            self._reconnecting.set()
+
+        threading.Thread(target=self._safe_reconnect, daemon=True, name="ConnectionReconnect").start()
+
+    def _safe_reconnect(self) -> None:
+        """Background reconnect; clears the in-progress flag however it ends."""
+        try:
+            self._reconnect(after_loss=True)
+        except Exception as e:
+            logger.error(f"Background reconnection failed: {e}")
+        finally:
+            self._reconnecting.clear()
+
+    def wait_for_connection(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until the connection is established.
+
+        Args:
+            timeout: Maximum time to wait in seconds (None waits forever)
+
+        Returns:
+            bool: True if connected, False if the timeout expired
+        """
+        return self._connected_event.wait(timeout)
+
+    def add_consumer(self) -> None:
+        """Register an active user of the connection, enabling health checks."""
+        with self._lock:
+            self._active_consumers += 1
+            self._ensure_monitoring()
+        self._monitor_wake.set()
+
+    def remove_consumer(self) -> None:
+        """Unregister a connection user; health checks pause when none remain."""
+        with self._lock:
+            self._active_consumers = max(0, self._active_consumers - 1)
+        self._monitor_wake.set()
+
+    def notify_activity(self) -> None:
+        """
+        Report device activity (e.g. a GPIO edge) from a consumer.
+
+        Recent activity switches health checks to HEALTH_CHECK_ACTIVE_S so a
+        disconnect under load is noticed quickly.
+        """
+        self._last_activity_ns = time.monotonic_ns()
+        if self._monitor_idle:
+            self._monitor_idle = False
+            self._monitor_wake.set()
+
     def is_connected(self) -> bool:
         """Check if currently connected."""
         return self._state == ConnectionState.CONNECTED
@@ -265,60 +434,103 @@ class ConnectionManager:
         return self._state
 
     def get_uptime(self) -> Optional[timedelta]:
-        """Get current connection uptime."""
-        if self._connection_time and self._state == ConnectionState.CONNECTED:
-            return datetime.now() - self._connection_time
+        """Get current connection uptime (lock-free)."""
+        state, connected_ns = self._state_snapshot
+        if state == ConnectionState.CONNECTED:
+            return timedelta(microseconds=(time.monotonic_ns() - connected_ns) // 1000)
         return None
 
     def get_stats(self) -> ConnectionStats:
-        """Get connection statistics."""
+        """
+        Get connection statistics.
+
+        The counters are cached until the next attempt or state change; each
+        call returns a copy with current_uptime filled in, so earlier results
+        never change. The recent_attempts list is shared; treat it as read-only.
+        """
         with self._lock:
-            stats = ConnectionStats(
-                total_attempts=self._stats.total_attempts,
-                successful_connections=self._stats.successful_connections,
-                failed_attempts=self._stats.failed_attempts,
-                last_successful_connection=self._stats.last_successful_connection,
-                last_failure=self._stats.last_failure,
-                average_connection_time_ms=self._stats.average_connection_time_ms,
-                recent_attempts=self._stats.recent_attempts.copy()
-            )
-            stats.current_uptime = self.get_uptime()
-            return stats
+            stats = self._cached_stats
+            if stats is None or self._stats_dirty:
+                stats = ConnectionStats(
+                    total_attempts=self._stats.total_attempts,
+                    successful_connections=self._stats.successful_connections,
+                    failed_attempts=self._stats.failed_attempts,
+                    last_successful_connection=self._stats.last_successful_connection,
+                    last_failure=self._stats.last_failure,
+                    average_connection_time_ms=self._stats.average_connection_time_ms,
+                    recent_attempts=list(self._stats.recent_attempts)
+                )
+                self._cached_stats = stats
+                self._stats_dirty = False
+            return replace(stats, current_uptime=self.get_uptime())
 
     def _record_attempt(self, attempt: ConnectionAttempt) -> None:
         """Record connection attempt in statistics."""
         self._stats.total_attempts += 1
-        self._stats.recent_attempts.append(attempt)
-
-        # Keep only recent attempts (last 20)
-        if len(self._stats.recent_attempts) > 20:
-            self._stats.recent_attempts.pop(0)
+        self._stats_dirty = True
+
+        # Keep only recent attempts; the deque drops the oldest, so take it
+        # out of the running success mean first
+        recent = self._stats.recent_attempts
+        if len(recent) == recent.maxlen:
+            evicted = recent[0]
+            if evicted.success and evicted.duration_ms:
+                n = self._success_ms_count - 1
+                if n:
+                    self._success_ms_mean += (self._success_ms_mean - evicted.duration_ms) / n
+                else:
+                    self._success_ms_mean = 0.0
+                self._success_ms_count = n
+        recent.append(attempt)
 
         if attempt.success:
             self._stats.successful_connections += 1
+            if attempt.duration_ms:
+                # Incremental (Welford) mean update
+                n = self._success_ms_count + 1
+                self._success_ms_mean += (attempt.duration_ms - self._success_ms_mean) / n
+                self._success_ms_count = n
         else:
             self._stats.failed_attempts += 1
 
-        # Update average connection time
-        if attempt.duration_ms is not None:
-            successful_attempts = [a for a in self._stats.recent_attempts if a.success and a.duration_ms]
-            if successful_attempts:
-                total_time = sum(a.duration_ms for a in successful_attempts)
-                self._stats.average_connection_time_ms = total_time / len(successful_attempts)
+        # Update average connection time over recent timed successes
+        if attempt.duration_ms is not None and self._success_ms_count:
+            self._stats.average_connection_time_ms = self._success_ms_mean
 
     def _set_state(self, new_state: ConnectionState) -> None:
         """Set connection state and trigger callbacks."""
         if self._state != new_state:
             old_state = self._state
             self._state = new_state
+            self._state_snapshot = (
+                new_state,
+                time.monotonic_ns() if new_state == ConnectionState.CONNECTED else 0
+            )
+            self._stats_dirty = True
+
+            if new_state == ConnectionState.CONNECTED:
+                self._connected_event.set()
+            else:
+                self._connected_event.clear()
 
-            logger.debug(f"Connection state: {old_state.value} -> {new_state.value}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Connection state: {old_state.value} -> {new_state.value}")
             self._trigger_state_callbacks(new_state)
 
+    def _has_observers(self) -> bool:
+        """Check whether any consumer or callback cares about connection health."""
+        return bool(self._active_consumers or self._state_change_callbacks or self._connection_callbacks)
+
+    def _ensure_monitoring(self) -> None:
+        """Start the monitor thread if connected and observed. Caller holds the lock."""
+        if self._state == ConnectionState.CONNECTED and self._has_observers():
+            self._start_monitoring()
+
     def _start_monitoring(self) -> None:
         """Start background connection monitoring."""
         if self._monitor_thread is None or not self._monitor_thread.is_alive():
             self._stop_monitoring.clear()
+            self._monitor_wake.clear()
             self._monitor_thread = threading.Thread(
                 target=self._monitor_connection,
                 daemon=True,
@@ -331,20 +543,45 @@ class ConnectionManager:
         """Stop background monitoring thread."""
         if self._monitor_thread and self._monitor_thread.is_alive():
             self._stop_monitoring.set()
+            self._monitor_wake.set()
             self._monitor_thread.join(timeout=5.0)
             logger.debug("Connection monitoring stopped")
 
     def _monitor_connection(self) -> None:
-        """Background connection health monitoring."""
-        check_interval = 5.0  # Check every 5 seconds
+        """
+        Background connection health monitoring.
+
+        Sleeps without polling while there are no observers (consumers or
+        callbacks; see _has_observers()). Otherwise checks
+        every HEALTH_CHECK_ACTIVE_S while activity was reported within
+        ACTIVITY_WINDOW_NS, and backs the interval off by HEALTH_CHECK_BACKOFF
+        up to HEALTH_CHECK_IDLE_MAX_S when idle.
+        """
+        check_interval = HEALTH_CHECK_INTERVAL_S
+
+        while not self._stop_monitoring.is_set():
+            if not self._has_observers():
+                self._monitor_wake.wait()
+                self._monitor_wake.clear()
+                continue
+
+            if time.monotonic_ns() - self._last_activity_ns < ACTIVITY_WINDOW_NS:
+                check_interval = HEALTH_CHECK_ACTIVE_S
+            else:
+                self._monitor_idle = True
+                check_interval = min(HEALTH_CHECK_IDLE_MAX_S, check_interval * HEALTH_CHECK_BACKOFF)
+
+            if self._monitor_wake.wait(check_interval):
+                # Woken by stop, a consumer change or new activity: re-evaluate
+                self._monitor_wake.clear()
+                continue
 
-        while not self._stop_monitoring.wait(check_interval):
             try:
                 if self._state == ConnectionState.CONNECTED:
                     # Check connection health
                     if not self.health_checker():
                         logger.warning("Connection health check failed, attempting reconnection")
-                        threading.Thread(target=self.reconnect, daemon=True).start()
+                        self.connection_lost()
                         break
 
             except Exception as e:
@@ -354,12 +591,18 @@ class ConnectionManager:
 
     def register_state_callback(self, callback: Callable[[ConnectionState], None]) -> None:
         """Register callback for state changes."""
-        self._state_change_callbacks.append(callback)
+        with self._lock:
+            self._state_change_callbacks = self._state_change_callbacks + (callback,)
+            self._ensure_monitoring()
+        self._monitor_wake.set()
         logger.debug("State change callback registered")
 
     def register_connection_callback(self, callback: Callable[[bool], None]) -> None:
         """Register callback for connection events."""
-        self._connection_callbacks.append(callback)
+        with self._lock:
+            self._connection_callbacks = self._connection_callbacks + (callback,)
+            self._ensure_monitoring()
+        self._monitor_wake.set()
         logger.debug("Connection event callback registered")
 
     def _trigger_state_callbacks(self, state: ConnectionState) -> None:
@@ -388,12 +631,20 @@ class ConnectionManager:
             f"uptime={uptime_str}, success_rate={self._stats.success_rate:.2%})"
         )
 
-    def __del__(self) -> None:
-        """Cleanup on destruction."""
-        try:
-            self._stop_monitoring_thread()
-        except:
-            pass
+    def close(self) -> None:
+        """
+        Release the manager: cancel retries, stop monitoring and disconnect.
+
+        Safe to call more than once, and used by the context manager protocol.
+        """
+        self.disconnect()
+        self._stop_monitoring_thread()
+
+    def __enter__(self) -> "ConnectionManager":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
 
 
 # Utility functions for common connection patterns
@@ -416,7 +667,8 @@ def create_mcp2221_connection_manager(
         Configured ConnectionManager instance
     """
     def connector() -> bool:
-        return mcp2221_manager.detect_device()
+        # reconnect() re-applies the GPIO configuration after a replug
+        return mcp2221_manager.is_connected() or mcp2221_manager.reconnect()
 
     def health_checker() -> bool:
         return mcp2221_manager.is_connected()
@@ -10,27 +10,45 @@ import logging
 import threading
 import time
 from datetime import datetime, timedelta
-from typing import Dict, Optional, Callable, Any
-from dataclasses import dataclass, field
-from collections import deque
+from typing import Dict, Iterable, List, Optional, Callable, Any, Tuple
+from dataclasses import dataclass
+
+from . import _wall_clock
 
 logger = logging.getLogger(__name__)
 
+# Smoothing factor for the inter-pulse interval average (1/8, as in TCP RTT estimation)
+_RATE_EWMA_ALPHA = 0.125
+
 
-@dataclass
+@dataclass(slots=True)
 class PulseEvent:
-    """Individual pulse detection event."""
+    """
+    Individual pulse detection event.
+
+    The event time is kept as time.monotonic_ns(); the wall-clock datetime is
+    only computed when wall_clock() or timestamp is read.
+    """
     pin: int
-    timestamp: datetime
+    timestamp_ns: int
     previous_state: bool
     current_state: bool
     debounced: bool = True
 
     def __post_init__(self):
         """Validate pulse event data."""
-        if self.pin not in range(4):
+        if not 0 <= self.pin < 4:
             raise ValueError(f"Invalid pin number: {self.pin}")
 
+    def wall_clock(self) -> datetime:
+        """Wall-clock time of the event."""
+        return _wall_clock(self.timestamp_ns)
+
+    @property
+    def timestamp(self) -> datetime:
+        """Wall-clock time of the event."""
+        return _wall_clock(self.timestamp_ns)
+
     @property
     def is_falling_edge(self) -> bool:
         """Check if this is a falling edge (high to low transition)."""
@@ -42,38 +60,49 @@ class PulseEvent:
         return not self.previous_state and self.current_state
 
 
-@dataclass
+@dataclass(slots=True)
 class PulseStats:
-    """Pulse detection statistics for a pin."""
+    """Pulse detection statistics for a pin (times in time.monotonic_ns())."""
     pin: int
     total_pulses: int = 0
     debounced_pulses: int = 0
-    last_pulse_time: Optional[datetime] = None
+    last_pulse_ns: Optional[int] = None
     pulse_rate_hz: float = 0.0
-    recent_pulses: deque = field(default_factory=lambda: deque(maxlen=10))
+    interval_ewma_ns: float = 0.0
 
-    def add_pulse(self, pulse_time: datetime, debounced: bool = True) -> None:
+    def add_pulse(self, pulse_ns: int, debounced: bool = True) -> None:
         """Add a pulse to statistics."""
         self.total_pulses += 1
         if debounced:
             self.debounced_pulses += 1
 
-        self.last_pulse_time = pulse_time
-        self.recent_pulses.append(pulse_time)
+        last_ns = self.last_pulse_ns
+        self.last_pulse_ns = pulse_ns
 
-        # Calculate pulse rate from recent pulses
-        if len(self.recent_pulses) >= 2:
-            time_span = (self.recent_pulses[-1] - self.recent_pulses[0]).total_seconds()
-            if time_span > 0:
-                self.pulse_rate_hz = (len(self.recent_pulses) - 1) / time_span
+        # Pulse rate from an exponentially weighted average of the intervals,
+        # seeded with the first interval
+        if last_ns is not None:
+            interval_ns = pulse_ns - last_ns
+            ewma = self.interval_ewma_ns
+            if ewma:
+                ewma += (interval_ns - ewma) * _RATE_EWMA_ALPHA
             else:
-                self.pulse_rate_hz = 0.0
+                ewma = float(interval_ns)
+            self.interval_ewma_ns = ewma
+            self.pulse_rate_hz = 1e9 / ewma if ewma > 0 else 0.0
+
+    @property
+    def last_pulse_time(self) -> Optional[datetime]:
+        """Wall-clock time of the last pulse."""
+        if self.last_pulse_ns is not None:
+            return _wall_clock(self.last_pulse_ns)
+        return None
 
     @property
     def time_since_last_pulse(self) -> Optional[timedelta]:
         """Time since last pulse."""
-        if self.last_pulse_time:
-            return datetime.now() - self.last_pulse_time
+        if self.last_pulse_ns is not None:
+            return timedelta(microseconds=(time.monotonic_ns() - self.last_pulse_ns) // 1000)
         return None
 
 
@@ -94,18 +123,25 @@ class PulseDetector:
         """
         self.debounce_ms = debounce_ms
         self.debounce_seconds = debounce_ms / 1000.0
+        self._debounce_ns = debounce_ms * 1_000_000
 
-        # Pin state tracking
-        self._pin_states: Dict[int, bool] = {}
-        self._last_change_time: Dict[int, datetime] = {}
+        # Pin state as packed bits (bit N = pin N) plus a mask of registered
+        # pins, and per-pin last change times in time.monotonic_ns()
+        self._state_bits = 0
+        self._pin_mask = 0
+        self._last_change_ns: List[int] = [0] * 4
         self._pulse_stats: Dict[int, PulseStats] = {}
 
         # Thread safety
         self._lock = threading.RLock()
 
-        # Event callbacks
-        self._pulse_callbacks: Dict[int, Callable[[PulseEvent], None]] = {}
-        self._edge_callbacks: Dict[int, Callable[[PulseEvent], None]] = {}
+        # Event callbacks indexed by pin; replaced wholesale on registration
+        # so dispatch reads them without taking the lock
+        self._pulse_callbacks: Tuple[Optional[Callable[[PulseEvent], None]], ...] = (None,) * 4
+        self._edge_callbacks: Tuple[Optional[Callable[[PulseEvent], None]], ...] = (None,) * 4
+
+        # Cached so the edge path skips building debug messages; see refresh_log_level()
+        self._debug = logger.isEnabledFor(logging.DEBUG)
 
         logger.info(f"PulseDetector initialized with {debounce_ms}ms debouncing")
 
@@ -121,8 +157,12 @@ class PulseDetector:
             raise ValueError(f"Invalid pin number: {pin}")
 
         with self._lock:
-            self._pin_states[pin] = initial_state
-            self._last_change_time[pin] = datetime.now()
+            self._last_change_ns[pin] = time.monotonic_ns()
+            self._pin_mask |= 1 << pin
+            if initial_state:
+                self._state_bits |= 1 << pin
+            else:
+                self._state_bits &= ~(1 << pin)
             self._pulse_stats[pin] = PulseStats(pin=pin)
 
         logger.debug(f"Pin {pin} registered with initial state: {initial_state}")
@@ -138,77 +178,171 @@ class PulseDetector:
         Returns:
             PulseEvent if edge detected and debounced, None otherwise
         """
-        if pin not in self._pin_states:
+        if not self._is_registered(pin):
             logger.warning(f"Pin {pin} not registered, ignoring state update")
             return None
 
         with self._lock:
-            current_time = datetime.now()
-            previous_state = self._pin_states[pin]
-
             # Check for state change
-            if new_state == previous_state:
+            if new_state == bool(self._state_bits >> pin & 1):
                 return None
 
-            # Check debouncing
-            time_since_last_change = (current_time - self._last_change_time[pin]).total_seconds()
-            is_debounced = time_since_last_change >= self.debounce_seconds
+            events = self._apply_edges(1 << pin, time.monotonic_ns())
 
-            # Create pulse event
-            pulse_event = PulseEvent(
-                pin=pin,
-                timestamp=current_time,
-                previous_state=previous_state,
-                current_state=new_state,
-                debounced=is_debounced
-            )
+        # Callbacks run outside the lock
+        event = events[pin]
+        if event is not None:
+            self._dispatch(event)
+        return event
 
-            # Update pin state and timing
-            self._pin_states[pin] = new_state
-            self._last_change_time[pin] = current_time
+    def refresh_log_level(self) -> None:
+        """Re-check whether debug logging is enabled after changing log levels."""
+        self._debug = logger.isEnabledFor(logging.DEBUG)
 
-            # Update statistics for debounced falling edges (pulses)
-            if is_debounced and pulse_event.is_falling_edge:
-                self._pulse_stats[pin].add_pulse(current_time, debounced=True)
+    def _is_registered(self, pin: int) -> bool:
+        """Check whether a pin has been registered."""
+        return 0 <= pin < 4 and bool(self._pin_mask >> pin & 1)
 
-            # Trigger callbacks
-            if is_debounced:
-                self._trigger_edge_callbacks(pulse_event)
-                if pulse_event.is_falling_edge:
-                    self._trigger_pulse_callbacks(pulse_event)
+    def _apply_edges(self, diff: int, now_ns: int) -> Dict[int, Optional[PulseEvent]]:
+        """
+        Toggle the pins set in diff and debounce them. Caller must hold the lock.
+
+        Debouncing and state updates are plain integer operations; a
+        PulseEvent is only built for edges that survive debouncing. The
+        caller passes the events to _dispatch() after releasing the lock.
+
+        Returns:
+            Dict mapping each toggled pin to its event (None if a bounce)
+        """
+        last_change_ns = self._last_change_ns
+        debounce_ns = self._debounce_ns
+        self._state_bits ^= diff
+        bits = self._state_bits
+        events = {}
+
+        while diff:
+            pin = (diff & -diff).bit_length() - 1
+            diff &= diff - 1
+
+            since_last_change = now_ns - last_change_ns[pin]
+            last_change_ns[pin] = now_ns
+            if since_last_change < debounce_ns:
+                events[pin] = None
+                if self._debug:
+                    logger.debug(f"Pin {pin}: bounce ignored")
+                continue
 
-            logger.debug(
-                f"Pin {pin}: {previous_state} -> {new_state}, "
-                f"debounced={is_debounced}, falling_edge={pulse_event.is_falling_edge}"
+            new_state = bool(bits >> pin & 1)
+            pulse_event = PulseEvent(
+                pin=pin,
+                timestamp_ns=now_ns,
+                previous_state=not new_state,
+                current_state=new_state
             )
 
-            return pulse_event if is_debounced else None
+            # Update statistics for falling edges (pulses)
+            if not new_state:
+                self._pulse_stats[pin].add_pulse(now_ns, debounced=True)
+
+            if self._debug:
+                logger.debug(f"Pin {pin}: {not new_state} -> {new_state}, falling_edge={not new_state}")
+            events[pin] = pulse_event
+
+        return events
 
     def update_all_pins(self, pin_states: Dict[str, int]) -> Dict[int, Optional[PulseEvent]]:
         """
         Update multiple pin states simultaneously.
 
+        The states are packed into a bitmap and handed to update_bits(), so a
+        sample with no edges returns after one XOR. Pins missing from
+        pin_states keep their current state.
+
         Args:
             pin_states: Dictionary of pin states {"GP0": 1, "GP1": 0, ...}
 
         Returns:
-            Dict mapping pin numbers to pulse events (None if no event)
+            Dict mapping each changed pin to its pulse event (None if debounced away)
         """
-        events = {}
+        get = pin_states.get
+
+        cur = self._state_bits
+        bits = (
+            bool(get("GP0", cur & 1))
+            | bool(get("GP1", cur >> 1 & 1)) << 1
+            | bool(get("GP2", cur >> 2 & 1)) << 2
+            | bool(get("GP3", cur >> 3 & 1)) << 3
+        )
+        return self.update_bits(bits)
+
+    def update_bits(self, bits: int, now_ns: Optional[int] = None) -> Dict[int, Optional[PulseEvent]]:
+        """
+        Update registered pins from a packed GPIO bitmap.
 
-        # Convert GPIO names to pin numbers
-        pin_mapping = {
-            "GP0": 0,
-            "GP1": 1,
-            "GP2": 2,
-            "GP3": 3
-        }
+        Only pins whose bit differs from the last known state are processed,
+        so an unchanged sample costs one XOR.
 
-        for gpio_name, state in pin_states.items():
-            if gpio_name in pin_mapping:
-                pin = pin_mapping[gpio_name]
-                events[pin] = self.update_pin_state(pin, bool(state))
+        Args:
+            bits: Pin states with bit N holding GPN (see MCP2221Manager.read_gpio_bits)
+            now_ns: Sample time from time.monotonic_ns() (read on demand if omitted)
+
+        Returns:
+            Dict mapping each changed pin to its pulse event (None if debounced away)
+        """
+        with self._lock:
+            diff = (bits ^ self._state_bits) & self._pin_mask
+            if not diff:
+                return {}
+
+            if now_ns is None:
+                now_ns = time.monotonic_ns()
+
+            events = self._apply_edges(diff, now_ns)
+
+        # Callbacks run outside the lock
+        for event in events.values():
+            if event is not None:
+                self._dispatch(event)
+        return events
+
+    def update_pin_mask(self, mask: int, timestamp_ns: Optional[int] = None) -> Dict[int, Optional[PulseEvent]]:
+        """
+        Update registered pins from a 4-bit mask, e.g. MCP2221Manager.read_gpio_bits().
+
+        Same as update_bits(); provided for readers that already hold the
+        mask and its sample time.
+        """
+        return self.update_bits(mask, timestamp_ns)
+
+    def update_bits_batch(self, samples: Iterable[Tuple[int, int]]) -> List[PulseEvent]:
+        """
+        Update registered pins from a batch of timestamped bitmap samples.
+
+        The whole batch is processed under one lock acquisition; samples
+        without edges cost one XOR each. Callbacks fire after the batch, in
+        sample order.
 
+        Args:
+            samples: (bits, time.monotonic_ns()) pairs in chronological order
+
+        Returns:
+            List of debounced pulse events across the batch
+        """
+        events: List[PulseEvent] = []
+
+        with self._lock:
+            pin_mask = self._pin_mask
+            for bits, now_ns in samples:
+                diff = (bits ^ self._state_bits) & pin_mask
+                if diff:
+                    events.extend(
+                        event for event in self._apply_edges(diff, now_ns).values()
+                        if event is not None
+                    )
+
+        # Callbacks run outside the lock
+        for event in events:
+            self._dispatch(event)
         return events
 
     def register_pulse_callback(self, pin: int, callback: Callable[[PulseEvent], None]) -> None:
@@ -219,7 +353,13 @@ class PulseDetector:
             pin: GPIO pin number
             callback: Function to call when pulse detected
         """
-        self._pulse_callbacks[pin] = callback
+        if pin not in range(4):
+            raise ValueError(f"Invalid pin number: {pin}")
+
+        with self._lock:
+            callbacks = list(self._pulse_callbacks)
+            callbacks[pin] = callback
+            self._pulse_callbacks = tuple(callbacks)
         logger.debug(f"Pulse callback registered for pin {pin}")
 
     def register_edge_callback(self, pin: int, callback: Callable[[PulseEvent], None]) -> None:
@@ -230,12 +370,24 @@ class PulseDetector:
             pin: GPIO pin number
             callback: Function to call when edge detected
         """
-        self._edge_callbacks[pin] = callback
+        if pin not in range(4):
+            raise ValueError(f"Invalid pin number: {pin}")
+
+        with self._lock:
+            callbacks = list(self._edge_callbacks)
+            callbacks[pin] = callback
+            self._edge_callbacks = tuple(callbacks)
         logger.debug(f"Edge callback registered for pin {pin}")
 
+    def _dispatch(self, event: PulseEvent) -> None:
+        """Trigger edge and (for falling edges) pulse callbacks for a debounced event."""
+        self._trigger_edge_callbacks(event)
+        if event.is_falling_edge:
+            self._trigger_pulse_callbacks(event)
+
     def _trigger_pulse_callbacks(self, event: PulseEvent) -> None:
         """Trigger pulse callbacks for an event."""
-        callback = self._pulse_callbacks.get(event.pin)
+        callback = self._pulse_callbacks[event.pin]
         if callback:
             try:
                 callback(event)
@@ -244,7 +396,7 @@ class PulseDetector:
 
     def _trigger_edge_callbacks(self, event: PulseEvent) -> None:
         """Trigger edge callbacks for an event."""
-        callback = self._edge_callbacks.get(event.pin)
+        callback = self._edge_callbacks[event.pin]
         if callback:
             try:
                 callback(event)
@@ -268,7 +420,9 @@ class PulseDetector:
     def get_pin_state(self, pin: int) -> Optional[bool]:
         """Get current state of a pin."""
         with self._lock:
-            return self._pin_states.get(pin)
+            if not self._is_registered(pin):
+                return None
+            return bool(self._state_bits >> pin & 1)
 
     def get_time_since_last_pulse(self, pin: int) -> Optional[timedelta]:
         """Get time since last pulse on a pin."""
@@ -314,12 +468,13 @@ class PulseDetector:
 
         self.debounce_ms = value
         self.debounce_seconds = value / 1000.0
+        self._debounce_ns = value * 1_000_000
         logger.info(f"Debounce time updated to {value}ms")
 
     def __str__(self) -> str:
         """String representation of detector state."""
         with self._lock:
-            registered_pins = list(self._pin_states.keys())
+            registered_pins = [pin for pin in range(4) if self._pin_mask >> pin & 1]
             total_pulses = sum(stats.debounced_pulses for stats in self._pulse_stats.values())
 
             return (
@@ -1,9 +1,10 @@
 """AlertEvent data model for system notifications and events."""
 
+import copy
 from datetime import datetime
 from enum import Enum
-from typing import Optional, Dict, Any
-from pydantic import BaseModel, Field, field_validator
+from typing import Optional, Dict, Any, List, Literal, Union
+from pydantic import BaseModel, Field, PrivateAttr, TypeAdapter, field_validator
 
 
 class AlertType(str, Enum):
@@ -16,6 +17,7 @@ class AlertType(str, Enum):
     MOVEMENT_STOPPED = "movement_stopped"
     SENSOR_DISCONNECTED = "sensor_disconnected"
     SENSOR_RECONNECTED = "sensor_reconnected"
+    HIGH_FEED_RATE = "high_feed_rate"
 
     # System events
     SYSTEM_STARTED = "system_started"
@@ -24,6 +26,7 @@ class AlertType(str, Enum):
     HARDWARE_ERROR = "hardware_error"
     POLLING_ERROR = "polling_error"
     API_ERROR = "api_error"
+    DISTANCE_MILESTONE = "distance_milestone"
 
     # Performance events
     HIGH_POLL_TIME = "high_poll_time"
@@ -41,11 +44,34 @@ class AlertSeverity(str, Enum):
     CRITICAL = "critical"
 
 
+# Field types for validation: checking a Literal is a plain string lookup,
+# where an Enum field constructs the member first. Built from the enums so
+# the two cannot drift apart.
+AlertTypeLiteral = Literal[tuple(t.value for t in AlertType)]
+AlertSeverityLiteral = Literal[tuple(s.value for s in AlertSeverity)]
+
+# Upper-case severity labels for log and display strings
+_SEVERITY_UPPER: Dict[str, str] = {s.value: s.value.upper() for s in AlertSeverity}
+
+# Alert types that must carry a sensor_id
+_SENSOR_ALERT_TYPES = frozenset((
+    AlertType.RUNOUT_DETECTED,
+    AlertType.FILAMENT_LOADED,
+    AlertType.MOVEMENT_STARTED,
+    AlertType.MOVEMENT_STOPPED,
+    AlertType.SENSOR_DISCONNECTED,
+    AlertType.SENSOR_RECONNECTED,
+    AlertType.HIGH_FEED_RATE
+))
+
+# Severities that need the user's attention until acknowledged
+_ATTENTION_SEVERITIES = frozenset((AlertSeverity.ERROR, AlertSeverity.CRITICAL))
+
+
 class AlertEvent(BaseModel):
     """Individual alert event with validation and metadata."""
 
     model_config = {
-        "json_encoders": {datetime: lambda v: v.isoformat()},
         "validate_assignment": True,
         "extra": "forbid",
         "use_enum_values": True
@@ -53,8 +79,8 @@ class AlertEvent(BaseModel):
 
     # Core event data
     timestamp: datetime = Field(default_factory=datetime.now)
-    alert_type: AlertType = Field(description="Type of alert event")
-    severity: AlertSeverity = Field(description="Alert severity level")
+    alert_type: AlertTypeLiteral = Field(description="Type of alert event")
+    severity: AlertSeverityLiteral = Field(description="Alert severity level")
     message: str = Field(min_length=1, max_length=500, description="Alert message")
 
     # Optional context
@@ -76,35 +102,34 @@ class AlertEvent(BaseModel):
         description="When alert was acknowledged"
     )
 
+    # Whether the severity calls for attention; kept in step with severity
+    _attention_eligible: bool = PrivateAttr(default=False)
+
+    # model_dump() output for export_dict; cleared whenever a field is assigned
+    _dump_cache: Optional[Dict[str, Any]] = PrivateAttr(default=None)
+
     @field_validator('message')
     @classmethod
     def validate_message(cls, v: str) -> str:
         """Validate and clean message text."""
         return v.strip()
 
-    @field_validator('sensor_id')
-    @classmethod
-    def validate_sensor_id(cls, v: Optional[int]) -> Optional[int]:
-        """Validate sensor ID if provided."""
-        if v is not None and v not in [1, 2]:
-            raise ValueError("sensor_id must be 1 or 2 if provided")
-        return v
-
     def model_post_init(self, __context: Any) -> None:
         """Post-init validation."""
         # Sensor-related alerts should have sensor_id
-        sensor_alerts = {
-            AlertType.RUNOUT_DETECTED,
-            AlertType.FILAMENT_LOADED,
-            AlertType.MOVEMENT_STARTED,
-            AlertType.MOVEMENT_STOPPED,
-            AlertType.SENSOR_DISCONNECTED,
-            AlertType.SENSOR_RECONNECTED
-        }
-
-        if self.alert_type in sensor_alerts and self.sensor_id is None:
+        if self.alert_type in _SENSOR_ALERT_TYPES and self.sensor_id is None:
             raise ValueError(f"{self.alert_type} requires sensor_id")
 
+        self._attention_eligible = self.severity in _ATTENTION_SEVERITIES
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name[0] == "_":
+            return
+        self._dump_cache = None
+        if name == "severity":
+            self._attention_eligible = self.severity in _ATTENTION_SEVERITIES
+
     @property
     def age_seconds(self) -> float:
         """Age of this alert in seconds."""
@@ -113,15 +138,12 @@ class AlertEvent(BaseModel):
     @property
     def is_recent(self) -> bool:
         """Check if alert occurred in the last 60 seconds."""
-        return self.age_seconds < 60.0
+        return (datetime.now() - self.timestamp).total_seconds() < 60.0
 
     @property
     def requires_attention(self) -> bool:
         """Check if alert requires user attention."""
-        return (
-            self.severity in [AlertSeverity.ERROR, AlertSeverity.CRITICAL] and
-            not self.acknowledged
-        )
+        return self._attention_eligible and not self.acknowledged
 
     def acknowledge(self) -> None:
         """Mark alert as acknowledged."""
@@ -129,6 +151,45 @@ class AlertEvent(BaseModel):
             self.acknowledged = True
             self.acknowledged_at = datetime.now()
 
+    def export_dict(self) -> Dict[str, Any]:
+        """
+        Export the alert as a dictionary for API responses.
+
+        The model_dump() result is cached until a field is assigned (for
+        example by acknowledge()); each call returns a copy, with its own
+        copy of details, so callers cannot change the cached export.
+        """
+        dump = self._dump_cache
+        if dump is None:
+            dump = self._dump_cache = self.model_dump()
+        details = dump["details"]
+        if details is None:
+            return dict(dump)
+        return {**dump, "details": copy.deepcopy(details)}
+
+    @classmethod
+    def _construct_trusted(
+        cls,
+        alert_type: AlertType,
+        severity: AlertSeverity,
+        message: str,
+        sensor_id: Optional[int] = None,
+        details: Optional[Dict[str, Any]] = None
+    ) -> "AlertEvent":
+        """
+        Build an alert from values already known to be valid, skipping validation.
+
+        Enum members are stored by value, matching what validation produces.
+        """
+        return cls.model_construct(
+            timestamp=datetime.now(),
+            alert_type=alert_type.value,
+            severity=severity.value,
+            message=message,
+            sensor_id=sensor_id,
+            details=details
+        )
+
     @classmethod
     def create_runout_alert(
         cls,
@@ -136,7 +197,10 @@ class AlertEvent(BaseModel):
         details: Optional[Dict[str, Any]] = None
     ) -> "AlertEvent":
         """Create a filament runout alert."""
-        return cls(
+        if sensor_id not in (1, 2):
+            raise ValueError("sensor_id must be 1 or 2 if provided")
+
+        return cls._construct_trusted(
             alert_type=AlertType.RUNOUT_DETECTED,
             severity=AlertSeverity.WARNING,
             message=f"Filament runout detected on sensor {sensor_id}",
@@ -161,12 +225,45 @@ class AlertEvent(BaseModel):
     @classmethod
     def create_system_startup(cls) -> "AlertEvent":
         """Create a system startup alert."""
-        return cls(
+        return cls._construct_trusted(
             alert_type=AlertType.SYSTEM_STARTED,
             severity=AlertSeverity.INFO,
             message="Filament sensor monitoring system started"
         )
 
+    @classmethod
+    def create_system_shutdown(cls) -> "AlertEvent":
+        """Create a system shutdown alert."""
+        return cls._construct_trusted(
+            alert_type=AlertType.SYSTEM_STOPPED,
+            severity=AlertSeverity.INFO,
+            message="Filament sensor monitoring system stopped"
+        )
+
+    @classmethod
+    def create_hardware_disconnected(cls) -> "AlertEvent":
+        """Create the hardware error alert raised when the MCP2221A disconnects."""
+        return cls._construct_trusted(
+            alert_type=AlertType.HARDWARE_ERROR,
+            severity=AlertSeverity.ERROR,
+            message="Hardware error: MCP2221A disconnected",
+            details={}
+        )
+
+    @classmethod
+    def create_sensor_reconnected(cls, sensor_id: int) -> "AlertEvent":
+        """Create the alert raised for a sensor when the MCP2221A comes back."""
+        if sensor_id not in (1, 2):
+            raise ValueError("sensor_id must be 1 or 2 if provided")
+
+        return cls._construct_trusted(
+            alert_type=AlertType.SENSOR_RECONNECTED,
+            severity=AlertSeverity.INFO,
+            message=f"Sensor {sensor_id} reconnected with MCP2221A hardware",
+            sensor_id=sensor_id,
+            details={}
+        )
+
     @classmethod
     def create_configuration_change(
         cls,
@@ -202,11 +299,25 @@ class AlertEvent(BaseModel):
     def to_log_entry(self) -> str:
         """Convert alert to structured log entry."""
         sensor_info = f" [Sensor {self.sensor_id}]" if self.sensor_id else ""
-        return f"[{self.severity.upper()}]{sensor_info} {self.alert_type}: {self.message}"
+        return f"[{_SEVERITY_UPPER[self.severity]}]{sensor_info} {self.alert_type}: {self.message}"
+
+    @classmethod
+    def validate_json_bulk(cls, data: Union[str, bytes]) -> List["AlertEvent"]:
+        """
+        Decode a JSON list of alerts, such as an exported alert history.
+
+        Every alert is fully validated, including the sensor_id check for
+        sensor alert types.
+        """
+        return _ALERT_EVENT_LIST_ADAPTER.validate_json(data)
 
     def __str__(self) -> str:
         """String representation for display."""
         timestamp_str = self.timestamp.strftime("%H:%M:%S")
         sensor_info = f" (Sensor {self.sensor_id})" if self.sensor_id else ""
         ack_info = " [ACK]" if self.acknowledged else ""
-        return f"{timestamp_str} {self.severity.upper()}{sensor_info}: {self.message}{ack_info}"
\ No newline at end of file
+        return f"{timestamp_str} {_SEVERITY_UPPER[self.severity]}{sensor_info}: {self.message}{ack_info}"
+
+
+# Validator for lists of alerts, used by validate_json_bulk
+_ALERT_EVENT_LIST_ADAPTER = TypeAdapter(List[AlertEvent])
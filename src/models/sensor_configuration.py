@@ -1,23 +1,28 @@
 """SensorConfiguration data model for hardware and calibration settings."""
 
-from typing import Dict, Any
-from pydantic import BaseModel, Field, field_validator, computed_field
+from typing import Annotated, Dict, Any
+from pydantic import AfterValidator, BaseModel, Field, PrivateAttr, computed_field
+
+
+def _round_mm_per_pulse(v: float) -> float:
+    """Round mm_per_pulse to 4 decimal places."""
+    return round(v, 4)
+
+
+# Millimeters of filament per pulse: bounds checked by pydantic-core, then rounded
+MmPerPulse = Annotated[float, Field(gt=0.0, le=100.0), AfterValidator(_round_mm_per_pulse)]
 
 
 class GPIOMapping(BaseModel):
     """GPIO pin mapping for a single sensor."""
 
+    # Frozen so SensorConfiguration's pin map cache cannot go stale; assign
+    # a new mapping (or use model_copy(update=...)) to change pins
+    model_config = {"frozen": True}
+
     movement_pin: int = Field(ge=0, le=3, description="GPIO pin for movement detection")
     runout_pin: int = Field(ge=0, le=3, description="GPIO pin for runout detection")
 
-    @field_validator('movement_pin', 'runout_pin')
-    @classmethod
-    def validate_gpio_pin(cls, v: int) -> int:
-        """Validate GPIO pin is 0-3 (MCP2221A has 4 GPIO pins)."""
-        if v not in range(4):
-            raise ValueError("GPIO pin must be 0-3")
-        return v
-
     def model_post_init(self, __context: Any) -> None:
         """Validate pins are not the same."""
         if self.movement_pin == self.runout_pin:
@@ -27,10 +32,8 @@ class GPIOMapping(BaseModel):
 class CalibrationSettings(BaseModel):
     """Calibration settings for distance calculations."""
 
-    mm_per_pulse: float = Field(
+    mm_per_pulse: MmPerPulse = Field(
         default=2.88,
-        gt=0.0,
-        le=100.0,
         description="Millimeters of filament per pulse"
     )
     debounce_ms: int = Field(
@@ -46,12 +49,6 @@ class CalibrationSettings(BaseModel):
         description="Time without movement to trigger runout (ms)"
     )
 
-    @field_validator('mm_per_pulse')
-    @classmethod
-    def validate_mm_per_pulse(cls, v: float) -> float:
-        """Validate and round mm_per_pulse."""
-        return round(v, 4)
-
 
 class PollingSettings(BaseModel):
     """Polling and timing configuration."""
@@ -82,20 +79,23 @@ class PollingSettings(BaseModel):
         return 1000.0 / self.polling_interval_ms
 
 
+def _add_schema_example(schema: Dict[str, Any]) -> None:
+    """Add the configuration example, built only when a JSON schema is generated."""
+    schema["example"] = {
+        "sensor1_gpio": {"movement_pin": 0, "runout_pin": 1},
+        "sensor2_gpio": {"movement_pin": 2, "runout_pin": 3},
+        "calibration": {"mm_per_pulse": 2.88, "debounce_ms": 10},
+        "polling": {"polling_interval_ms": 100}
+    }
+
+
 class SensorConfiguration(BaseModel):
     """Complete sensor system configuration."""
 
     model_config = {
         "validate_assignment": True,
         "extra": "forbid",
-        "json_schema_extra": {
-            "example": {
-                "sensor1_gpio": {"movement_pin": 0, "runout_pin": 1},
-                "sensor2_gpio": {"movement_pin": 2, "runout_pin": 3},
-                "calibration": {"mm_per_pulse": 2.88, "debounce_ms": 10},
-                "polling": {"polling_interval_ms": 100}
-            }
-        }
+        "json_schema_extra": _add_schema_example
     }
 
     # GPIO configuration
@@ -132,6 +132,9 @@ class SensorConfiguration(BaseModel):
         description="HTTP API server port"
     )
 
+    # Pin map cache, rebuilt whenever a (frozen) GPIO mapping is reassigned
+    _gpio_pin_map: Dict[int, str] = PrivateAttr(default_factory=dict)
+
     def model_post_init(self, __context: Any) -> None:
         """Validate GPIO pin assignments don't conflict."""
         used_pins = {
@@ -144,17 +147,28 @@ class SensorConfiguration(BaseModel):
         if len(used_pins) != 4:
             raise ValueError("All GPIO pins must be unique")
 
-    @computed_field
-    @property
-    def gpio_pin_map(self) -> Dict[int, str]:
-        """Map GPIO pins to their functions."""
-        return {
+        self._build_gpio_pin_map()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in ("sensor1_gpio", "sensor2_gpio"):
+            self._build_gpio_pin_map()
+
+    def _build_gpio_pin_map(self) -> None:
+        """Rebuild the cached pin-to-function map."""
+        self._gpio_pin_map = {
             self.sensor1_gpio.movement_pin: "sensor1_movement",
             self.sensor1_gpio.runout_pin: "sensor1_runout",
             self.sensor2_gpio.movement_pin: "sensor2_movement",
             self.sensor2_gpio.runout_pin: "sensor2_runout"
         }
 
+    @computed_field
+    @property
+    def gpio_pin_map(self) -> Dict[int, str]:
+        """Map GPIO pins to their functions (shared; do not mutate)."""
+        return self._gpio_pin_map
+
     def get_sensor_pins(self, sensor_id: int) -> GPIOMapping:
         """Get GPIO mapping for specific sensor."""
         if sensor_id == 1:
@@ -165,5 +179,10 @@ class SensorConfiguration(BaseModel):
             raise ValueError("sensor_id must be 1 or 2")
 
     def export_dict(self) -> Dict[str, Any]:
-        """Export configuration as dictionary for JSON serialization."""
-        return self.model_dump(mode='json')
\ No newline at end of file
+        """
+        Export configuration as dictionary for JSON serialization.
+
+        Every field is already a JSON-compatible scalar, so the cheaper
+        python-mode dump is used.
+        """
+        return self.model_dump(mode='python')
\ No newline at end of file
@@ -1,16 +1,25 @@
 """SensorReading data model for individual sensor measurements."""
 
 from datetime import datetime
-from typing import Optional
-from pydantic import BaseModel, Field, field_validator, computed_field
+from typing import Annotated, Any, List, Optional, Union
+from pydantic import AfterValidator, BaseModel, Field, TypeAdapter, computed_field, model_validator
+
+def _round_distance(v: float) -> float:
+    """Round a distance to 3 decimal places."""
+    return round(v, 3)
+
+
+# Distance in millimeters: cumulative since start, so only bounded below;
+# checked by pydantic-core, then rounded
+DistanceMm = Annotated[float, Field(ge=0.0), AfterValidator(_round_distance)]
 
 
 class SensorReading(BaseModel):
     """Individual sensor reading with validation and computed properties."""
 
+    # Readings are immutable; derive a changed reading with model_copy(update=...)
     model_config = {
-        "json_encoders": {datetime: lambda v: v.isoformat()},
-        "validate_assignment": True,
+        "frozen": True,
         "extra": "forbid"
     }
 
@@ -20,7 +29,7 @@ class SensorReading(BaseModel):
     has_filament: bool = Field(description="True if filament detected")
     is_moving: bool = Field(description="True if filament movement detected")
     pulse_count: int = Field(ge=0, description="Total pulse count since start")
-    distance_mm: float = Field(ge=0.0, description="Calculated distance in millimeters")
+    distance_mm: DistanceMm = Field(description="Calculated distance in millimeters")
 
     # Optional metadata
     raw_gpio_state: Optional[dict[str, bool]] = Field(
@@ -28,23 +37,13 @@ class SensorReading(BaseModel):
         description="Raw GPIO pin states for debugging"
     )
 
-    @field_validator('sensor_id')
-    @classmethod
-    def validate_sensor_id(cls, v: int) -> int:
-        """Validate sensor ID is 1 or 2."""
-        if v not in [1, 2]:
-            raise ValueError("sensor_id must be 1 or 2")
-        return v
-
-    @field_validator('distance_mm')
+    @model_validator(mode="before")
     @classmethod
-    def validate_distance(cls, v: float) -> float:
-        """Validate distance is non-negative and reasonable."""
-        if v < 0:
-            raise ValueError("distance_mm cannot be negative")
-        if v > 10000:  # 10 meters seems reasonable max
-            raise ValueError("distance_mm exceeds reasonable maximum (10000mm)")
-        return round(v, 3)  # Round to 3 decimal places
+    def _drop_computed_fields(cls, data: Any) -> Any:
+        """Accept model_dump() output, which includes filament_status."""
+        if isinstance(data, dict) and "filament_status" in data:
+            data = {k: v for k, v in data.items() if k != "filament_status"}
+        return data
 
     @computed_field
     @property
@@ -57,19 +56,67 @@ class SensorReading(BaseModel):
         else:
             return "present"
 
-    @computed_field
     @property
     def age_seconds(self) -> float:
-        """Age of this reading in seconds."""
+        """Age of this reading in seconds (not serialized; it changes with time)."""
         return (datetime.now() - self.timestamp).total_seconds()
 
     def is_stale(self, max_age_seconds: float = 1.0) -> bool:
         """Check if reading is stale based on age."""
         return self.age_seconds > max_age_seconds
 
+    @classmethod
+    def from_poll(
+        cls,
+        sensor_id: int,
+        has_filament: bool,
+        is_moving: bool,
+        pulse_count: int,
+        distance_mm: float,
+        raw_gpio_state: Optional[dict[str, bool]] = None,
+        timestamp: Optional[datetime] = None
+    ) -> "SensorReading":
+        """
+        Build a reading from values produced by the polling loop.
+
+        The arguments are already typed by the caller, so this skips model
+        validation and only repeats the range checks.
+
+        Raises:
+            ValueError: If sensor_id, pulse_count or distance_mm is out of range
+        """
+        if sensor_id not in (1, 2):
+            raise ValueError("sensor_id must be 1 or 2")
+        if pulse_count < 0:
+            raise ValueError("pulse_count cannot be negative")
+        if distance_mm < 0.0:
+            raise ValueError("distance_mm cannot be negative")
+        return cls.model_construct(
+            timestamp=timestamp or datetime.now(),
+            sensor_id=sensor_id,
+            has_filament=has_filament,
+            is_moving=is_moving,
+            pulse_count=pulse_count,
+            distance_mm=_round_distance(distance_mm),
+            raw_gpio_state=raw_gpio_state
+        )
+
+    @classmethod
+    def validate_json_bulk(cls, data: Union[str, bytes]) -> List["SensorReading"]:
+        """
+        Decode a JSON array of readings straight into models, with no intermediate dicts.
+
+        Accepts model_dump_json() output; the computed filament_status is ignored.
+        """
+        return _SENSOR_READING_LIST_ADAPTER.validate_json(data)
+
     def __str__(self) -> str:
         """String representation for logging."""
         return (
             f"Sensor{self.sensor_id}: {self.filament_status} "
             f"({self.pulse_count}p, {self.distance_mm:.1f}mm)"
-        )
\ No newline at end of file
+        )
+
+
+# List validator for validate_json_bulk; compiled once here rather than per call
+_SENSOR_READING_LIST_ADAPTER = TypeAdapter(List[SensorReading])
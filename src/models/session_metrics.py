@@ -1,15 +1,16 @@
 """SessionMetrics data model for tracking usage statistics and calculations."""
 
 from datetime import datetime, timedelta
-from typing import Dict, Optional
-from pydantic import BaseModel, Field, computed_field
+from typing import Dict, Optional, Tuple
+from pydantic import BaseModel, Field, computed_field, field_serializer
 
 
 class SensorMetrics(BaseModel):
     """Metrics for a single sensor during the session."""
 
+    # Written on every poll; SessionMetrics keeps the values in bounds
     model_config = {
-        "validate_assignment": True,
+        "validate_assignment": False,
         "extra": "forbid"
     }
 
@@ -20,6 +21,13 @@ class SensorMetrics(BaseModel):
     feeding_time_seconds: float = Field(default=0.0, ge=0.0, description="Active feeding time")
     last_activity: Optional[datetime] = Field(default=None, description="Last movement detected")
 
+    # Statistics over the recent readings, written by DataAggregator
+    movement_events: int = Field(default=0, ge=0, description="Moving readings in the last hour")
+    activity_periods: int = Field(default=0, ge=0, description="Movement periods in the last hour")
+    average_speed_mm_s: float = Field(default=0.0, ge=0.0, description="Average speed while moving")
+    usage_rate_mm_h: float = Field(default=0.0, ge=0.0, description="Distance per hour of readings")
+    last_movement: Optional[datetime] = Field(default=None, description="Latest moving reading")
+
     @computed_field
     @property
     def total_distance_m(self) -> float:
@@ -51,18 +59,27 @@ class SensorMetrics(BaseModel):
 class SystemPerformance(BaseModel):
     """System performance metrics."""
 
+    # Written on every poll; SessionMetrics keeps the values in bounds
     model_config = {
-        "validate_assignment": True,
+        "validate_assignment": False,
         "extra": "forbid"
     }
 
     polling_cycles: int = Field(default=0, ge=0, description="Total polling cycles")
     missed_polls: int = Field(default=0, ge=0, description="Missed polling cycles")
-    average_poll_time_ms: float = Field(default=0.0, ge=0.0, description="Average poll time")
+    total_poll_time_us: int = Field(default=0, ge=0, description="Summed poll time in microseconds")
     max_poll_time_ms: float = Field(default=0.0, ge=0.0, description="Maximum poll time")
     api_requests: int = Field(default=0, ge=0, description="Total API requests served")
     errors_count: int = Field(default=0, ge=0, description="Total error count")
 
+    @computed_field
+    @property
+    def average_poll_time_ms(self) -> float:
+        """Average poll time in milliseconds."""
+        if self.polling_cycles == 0:
+            return 0.0
+        return self.total_poll_time_us / 1000.0 / self.polling_cycles
+
     @computed_field
     @property
     def poll_success_rate(self) -> float:
@@ -87,10 +104,6 @@ class SessionMetrics(BaseModel):
     """Complete session metrics and calculations."""
 
     model_config = {
-        "json_encoders": {
-            datetime: lambda v: v.isoformat(),
-            timedelta: lambda v: v.total_seconds()
-        },
         "validate_assignment": True,
         "extra": "forbid"
     }
@@ -121,6 +134,11 @@ class SessionMetrics(BaseModel):
         """Total session duration."""
         return datetime.now() - self.session_start
 
+    @field_serializer('session_duration', when_used='json')
+    def _serialize_session_duration(self, value: timedelta) -> float:
+        """Serialize the session duration to JSON as seconds."""
+        return value.total_seconds()
+
     @computed_field
     @property
     def session_duration_hours(self) -> float:
@@ -149,25 +167,47 @@ class SessionMetrics(BaseModel):
     @property
     def active_sensors(self) -> int:
         """Number of currently active sensors."""
-        active_count = 0
-        if self.sensor1.is_active():
-            active_count += 1
-        if self.sensor2.is_active():
-            active_count += 1
-        return active_count
+        return self._activity_status(datetime.now(), self.performance.is_healthy)[0]
 
     @computed_field
     @property
     def system_status(self) -> str:
         """Overall system status."""
-        if not self.performance.is_healthy:
-            return "error"
-        elif self.active_sensors == 0:
-            return "idle"
-        elif self.active_sensors == 1:
-            return "single"
+        return self._activity_status(datetime.now(), self.performance.is_healthy)[1]
+
+    def _activity_status(
+        self,
+        now: datetime,
+        healthy: bool,
+        timeout_seconds: float = 300.0
+    ) -> Tuple[int, str]:
+        """
+        Count active sensors as of now and derive the system status.
+
+        Args:
+            now: Current time, read once by the caller
+            healthy: Result of performance.is_healthy
+            timeout_seconds: Inactivity period after which a sensor is idle
+
+        Returns:
+            Tuple of (active sensor count, system status)
+        """
+        active_count = 0
+        for sensor in (self.sensor1, self.sensor2):
+            last_activity = sensor.last_activity
+            if last_activity is not None and (now - last_activity).total_seconds() < timeout_seconds:
+                active_count += 1
+
+        if not healthy:
+            status = "error"
+        elif active_count == 0:
+            status = "idle"
+        elif active_count == 1:
+            status = "single"
         else:
-            return "dual"
+            status = "dual"
+
+        return active_count, status
 
     def get_sensor_metrics(self, sensor_id: int) -> SensorMetrics:
         """Get metrics for specific sensor."""
@@ -186,12 +226,18 @@ class SessionMetrics(BaseModel):
         feeding_time_delta: float = 0.0,
         runout_occurred: bool = False
     ) -> None:
-        """Update metrics for a specific sensor."""
+        """
+        Update metrics for a specific sensor.
+
+        SensorMetrics does not validate assignments; only positive deltas are
+        applied, which keeps its fields within bounds.
+        """
         sensor = self.get_sensor_metrics(sensor_id)
+        now = datetime.now()
 
         if pulses_delta > 0:
             sensor.total_pulses += pulses_delta
-            sensor.last_activity = datetime.now()
+            sensor.last_activity = now
 
         if distance_delta_mm > 0.0:
             sensor.total_distance_mm += distance_delta_mm
@@ -202,7 +248,7 @@ class SessionMetrics(BaseModel):
         if runout_occurred:
             sensor.runout_events += 1
 
-        self.last_updated = datetime.now()
+        self.last_updated = now
 
     def update_performance(
         self,
@@ -211,41 +257,58 @@ class SessionMetrics(BaseModel):
         api_request: bool = False,
         error_occurred: bool = False
     ) -> None:
-        """Update system performance metrics."""
-        self.performance.polling_cycles += 1
+        """
+        Update system performance metrics.
+
+        Raises:
+            ValueError: If poll_time_ms is negative
+        """
+        if poll_time_ms < 0:
+            raise ValueError("poll_time_ms cannot be negative")
+
+        performance = self.performance
+        performance.polling_cycles += 1
 
         if missed_poll:
-            self.performance.missed_polls += 1
+            performance.missed_polls += 1
 
         if api_request:
-            self.performance.api_requests += 1
+            performance.api_requests += 1
 
         if error_occurred:
-            self.performance.errors_count += 1
+            performance.errors_count += 1
 
-        # Update average poll time
-        current_avg = self.performance.average_poll_time_ms
-        total_cycles = self.performance.polling_cycles
-        self.performance.average_poll_time_ms = (
-            (current_avg * (total_cycles - 1) + poll_time_ms) / total_cycles
-        )
+        # Average poll time is derived from the running total
+        performance.total_poll_time_us += round(poll_time_ms * 1000)
 
         # Update max poll time
-        if poll_time_ms > self.performance.max_poll_time_ms:
-            self.performance.max_poll_time_ms = poll_time_ms
+        if poll_time_ms > performance.max_poll_time_ms:
+            performance.max_poll_time_ms = poll_time_ms
 
         self.last_updated = datetime.now()
 
     def export_summary(self) -> Dict[str, any]:
-        """Export session summary for reporting."""
+        """
+        Export session summary for reporting.
+
+        Reads the clock once and derives every value from local copies
+        instead of going through the computed properties.
+        """
+        now = datetime.now()
+        performance = self.performance
+        healthy = performance.is_healthy
+        active_sensors, system_status = self._activity_status(now, healthy)
+        sensor1_mm = self.sensor1.total_distance_mm
+        sensor2_mm = self.sensor2.total_distance_mm
+
         return {
-            "session_hours": self.session_duration_hours,
-            "total_distance_m": self.total_distance_m,
-            "total_pulses": self.total_pulses,
-            "active_sensors": self.active_sensors,
-            "system_status": self.system_status,
-            "sensor1_distance_m": self.sensor1.total_distance_m,
-            "sensor2_distance_m": self.sensor2.total_distance_m,
-            "poll_success_rate": self.performance.poll_success_rate,
-            "system_healthy": self.performance.is_healthy
+            "session_hours": round((now - self.session_start).total_seconds() / 3600.0, 2),
+            "total_distance_m": round((sensor1_mm + sensor2_mm) / 1000.0, 3),
+            "total_pulses": self.sensor1.total_pulses + self.sensor2.total_pulses,
+            "active_sensors": active_sensors,
+            "system_status": system_status,
+            "sensor1_distance_m": round(sensor1_mm / 1000.0, 3),
+            "sensor2_distance_m": round(sensor2_mm / 1000.0, 3),
+            "poll_success_rate": performance.poll_success_rate,
+            "system_healthy": healthy
         }
\ No newline at end of file
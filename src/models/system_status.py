@@ -1,14 +1,28 @@
 """SystemStatus singleton for overall system state management."""
 
+import time
+from collections import deque
 from datetime import datetime
-from typing import Optional, Dict, Any, List
+from itertools import islice
+from typing import ClassVar, Optional, Dict, Any, Deque, List, Tuple
 from threading import Lock
-from pydantic import BaseModel, Field, computed_field
+from pydantic import BaseModel, Field, PrivateAttr, computed_field
+from pydantic_core import to_json
 
 from .sensor_reading import SensorReading
 from .sensor_configuration import SensorConfiguration
 from .session_metrics import SessionMetrics
-from .alert_event import AlertEvent, AlertType, AlertSeverity
+from .alert_event import AlertEvent, AlertSeverity
+
+# Number of alerts kept in SystemStatus.recent_alerts
+MAX_RECENT_ALERTS = 100
+
+# Alert severities counted as errors in SystemHealth
+_ERROR_SEVERITIES = frozenset((AlertSeverity.ERROR, AlertSeverity.CRITICAL))
+
+# Writes a model field without validate_assignment; used for the trusted,
+# already-typed values set by the update methods below
+_set_field = object.__setattr__
 
 
 class SystemHealth(BaseModel):
@@ -31,10 +45,58 @@ class SystemHealth(BaseModel):
     error_count_24h: int = Field(default=0, ge=0, description="Errors in last 24 hours")
     uptime_seconds: float = Field(default=0.0, ge=0.0, description="System uptime")
 
+    # Cached (overall_health, responsive_sensor_count); cleared on field
+    # assignment and by the record/mark methods (sensors_responding is
+    # mutated in place). Derived values on these models are cached in private
+    # attributes rather than with functools.cached_property: a cached_property
+    # stores its value in the instance __dict__, which pydantic treats as field
+    # storage, so the value can show up in dumps and copies and is never
+    # cleared by assignment.
+    _health_cache: Optional[Tuple[str, int]] = PrivateAttr(default=None)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name[0] != "_":
+            self._health_cache = None
+
+    def mark_sensor_responding(self, sensor_id: int, responding: bool = True) -> None:
+        """Record whether a sensor is responding."""
+        if self.sensors_responding.get(sensor_id) is not responding:
+            self.sensors_responding[sensor_id] = responding
+            self._health_cache = None
+
+    def record_hardware_check(self, connected: bool) -> None:
+        """Record the result of a hardware connectivity check."""
+        _set_field(self, "hardware_connected", connected)
+        _set_field(self, "last_hardware_check", datetime.now())
+        self._health_cache = None
+
+    def record_error(self) -> None:
+        """Count an error towards the 24 hour total."""
+        _set_field(self, "error_count_24h", self.error_count_24h + 1)
+        self._health_cache = None
+
     @computed_field
     @property
     def overall_health(self) -> str:
         """Overall system health status."""
+        return self._health_values()[0]
+
+    @computed_field
+    @property
+    def responsive_sensor_count(self) -> int:
+        """Number of responsive sensors."""
+        return self._health_values()[1]
+
+    def _health_values(self) -> Tuple[str, int]:
+        """Return the cached health values, deriving them if needed."""
+        values = self._health_cache
+        if values is None:
+            values = self._health_cache = (self._compute_health(), sum(self.sensors_responding.values()))
+        return values
+
+    def _compute_health(self) -> str:
+        """Derive the overall health status from the current fields."""
         if not self.hardware_connected:
             return "disconnected"
         elif self.error_count_24h > 10:
@@ -46,18 +108,11 @@ class SystemHealth(BaseModel):
         else:
             return "partial"
 
-    @computed_field
-    @property
-    def responsive_sensor_count(self) -> int:
-        """Number of responsive sensors."""
-        return sum(self.sensors_responding.values())
-
 
 class SystemStatus(BaseModel):
     """Singleton system status manager."""
 
     model_config = {
-        "json_encoders": {datetime: lambda v: v.isoformat()},
         "validate_assignment": True,
         "extra": "forbid"
     }
@@ -89,30 +144,58 @@ class SystemStatus(BaseModel):
         description="System health status"
     )
 
-    # Recent alerts (keep last 100)
-    recent_alerts: List[AlertEvent] = Field(
-        default_factory=list,
+    # Recent alerts; the deque drops the oldest beyond MAX_RECENT_ALERTS
+    recent_alerts: Deque[AlertEvent] = Field(
+        default_factory=lambda: deque(maxlen=MAX_RECENT_ALERTS),
         description="Recent alert events"
     )
 
-    # Class-level singleton management
-    _instance: Optional['SystemStatus'] = None
-    _lock: Lock = Lock()
+    # Unacknowledged alerts in recent_alerts, maintained by add_alert and
+    # acknowledge_all_alerts
+    _unacknowledged_count: int = PrivateAttr(default=0)
+
+    # State-derived part of system_summary (running, health, active sensors,
+    # unacknowledged alerts, last update); cleared by _update_timestamp
+    _summary_cache: Optional[Tuple[bool, str, int, int, str]] = PrivateAttr(default=None)
+
+    # time.monotonic_ns() at start_system, so uptime is integer arithmetic
+    _started_monotonic_ns: Optional[int] = PrivateAttr(default=None)
+
+    # model_dump() results reused by get_system_diagnostics while a model's
+    # field values are unchanged: key -> (field values, dump)
+    _diagnostics_dumps: Dict[str, Tuple[Tuple[Any, ...], Dict[str, Any]]] = PrivateAttr(
+        default_factory=dict
+    )
 
-    def __new__(cls) -> 'SystemStatus':
-        """Ensure singleton pattern."""
-        if cls._instance is None:
-            with cls._lock:
-                if cls._instance is None:
-                    cls._instance = super().__new__(cls)
-        return cls._instance
+    # Class-level singleton management (ClassVar keeps them out of the model's
+    # private attributes)
+    _instance: ClassVar[Optional['SystemStatus']] = None
+    _lock: ClassVar[Lock] = Lock()
+
+    def __new__(cls, **data: Any) -> 'SystemStatus':
+        """Ensure singleton pattern; the lock is only taken before first creation."""
+        instance = cls._instance
+        if instance is not None:
+            return instance
+
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = super().__new__(cls)
+            return cls._instance
+
+    def __init__(self, **data: Any) -> None:
+        """Initialize the shared instance once; later constructor calls are no-ops."""
+        if hasattr(self, "__pydantic_fields_set__"):
+            return
+        super().__init__(**data)
 
     @classmethod
     def get_instance(cls) -> 'SystemStatus':
         """Get the singleton instance."""
-        if cls._instance is None:
-            cls._instance = cls()
-        return cls._instance
+        instance = cls._instance
+        if instance is None:
+            instance = cls()
+        return instance
 
     @classmethod
     def reset_instance(cls) -> None:
@@ -124,6 +207,9 @@ class SystemStatus(BaseModel):
     @property
     def uptime_seconds(self) -> float:
         """Current system uptime in seconds."""
+        started_ns = self._started_monotonic_ns
+        if started_ns is not None:
+            return (time.monotonic_ns() - started_ns) / 1e9
         if self.started_at is None:
             return 0.0
         return (datetime.now() - self.started_at).total_seconds()
@@ -137,64 +223,89 @@ class SystemStatus(BaseModel):
     @computed_field
     @property
     def system_summary(self) -> Dict[str, Any]:
-        """System summary for API responses."""
+        """System summary for API responses.
+
+        Uptime and distance change without going through SystemStatus, so
+        only the remaining values are cached between state changes.
+        """
+        cached = self._summary_cache
+        if cached is None:
+            health = self.health
+            cached = self._summary_cache = (
+                self.is_running,
+                health.overall_health,
+                health.responsive_sensor_count,
+                self._unacknowledged_count,
+                self.last_update.isoformat()
+            )
+        running, health_status, sensors_active, unacknowledged, last_update = cached
         return {
-            "running": self.is_running,
+            "running": running,
             "uptime_hours": self.uptime_hours,
-            "health": self.health.overall_health,
-            "sensors_active": self.health.responsive_sensor_count,
+            "health": health_status,
+            "sensors_active": sensors_active,
             "total_distance_m": self.metrics.total_distance_m,
-            "unacknowledged_alerts": self.get_unacknowledged_alert_count(),
-            "last_update": self.last_update.isoformat()
+            "unacknowledged_alerts": unacknowledged,
+            "last_update": last_update
         }
 
     def start_system(self, config: SensorConfiguration) -> None:
         """Start the monitoring system."""
-        self.is_running = True
-        self.started_at = datetime.now()
-        self.configuration = config
-        self.metrics = SessionMetrics()  # Reset metrics
+        _set_field(self, "is_running", True)
+        _set_field(self, "started_at", datetime.now())
+        self._started_monotonic_ns = time.monotonic_ns()
+        _set_field(self, "configuration", config)
+        _set_field(self, "metrics", SessionMetrics())  # Reset metrics
         self.add_alert(AlertEvent.create_system_startup())
         self._update_timestamp()
 
     def stop_system(self) -> None:
         """Stop the monitoring system."""
         if self.is_running:
-            self.add_alert(AlertEvent(
-                alert_type=AlertType.SYSTEM_STOPPED,
-                severity=AlertSeverity.INFO,
-                message="Filament sensor monitoring system stopped"
-            ))
-        self.is_running = False
+            self.add_alert(AlertEvent.create_system_shutdown())
+        _set_field(self, "is_running", False)
         self._update_timestamp()
 
     def update_sensor_reading(self, reading: SensorReading) -> None:
-        """Update current sensor reading."""
-        self.current_readings[reading.sensor_id] = reading
-        self.health.sensors_responding[reading.sensor_id] = True
-        self._update_timestamp()
+        """
+        Update current sensor reading.
+
+        Called for every poll, so it writes the reading dict and timestamp
+        directly; the health model is only touched when the sensor was not
+        already marked responding.
+        """
+        sensor_id = reading.sensor_id
+        self.current_readings[sensor_id] = reading
+        health = self.health
+        if not health.sensors_responding.get(sensor_id):
+            health.mark_sensor_responding(sensor_id)
+        _set_field(self, "last_update", datetime.now())
+        self._summary_cache = None
 
     def update_hardware_status(self, connected: bool) -> None:
-        """Update hardware connection status."""
-        was_connected = self.health.hardware_connected
-        self.health.hardware_connected = connected
-        self.health.last_hardware_check = datetime.now()
+        """
+        Update hardware connection status.
+
+        Reconnection is reported per sensor (SENSOR_RECONNECTED carries a
+        sensor_id), and only after an earlier check, not on the first connect.
+        """
+        health = self.health
+        was_connected = health.hardware_connected
+        checked_before = health.last_hardware_check is not None
+        health.record_hardware_check(connected)
 
         if was_connected and not connected:
-            self.add_alert(AlertEvent.create_hardware_error("MCP2221A disconnected"))
-        elif not was_connected and connected:
-            self.add_alert(AlertEvent(
-                alert_type=AlertType.SENSOR_RECONNECTED,
-                severity=AlertSeverity.INFO,
-                message="MCP2221A hardware reconnected"
-            ))
+            self.add_alert(AlertEvent.create_hardware_disconnected())
+        elif not was_connected and connected and checked_before:
+            for sensor_id in (1, 2):
+                self.add_alert(AlertEvent.create_sensor_reconnected(sensor_id))
 
         self._update_timestamp()
 
     def update_configuration(self, config: SensorConfiguration) -> None:
         """Update system configuration."""
         old_config = self.configuration
-        self.configuration = config
+        _set_field(self, "configuration", config)
 
         if old_config is not None:
             self.add_alert(AlertEvent.create_configuration_change(
@@ -205,16 +316,22 @@ class SystemStatus(BaseModel):
         self._update_timestamp()
 
     def add_alert(self, alert: AlertEvent) -> None:
-        """Add a new alert to the system."""
-        self.recent_alerts.append(alert)
-
-        # Keep only last 100 alerts
-        if len(self.recent_alerts) > 100:
-            self.recent_alerts = self.recent_alerts[-100:]
+        """
+        Add a new alert to the system.
+
+        Called on the event loop thread only, so no lock is taken: the
+        bounded deque drops the oldest alert in the same append.
+        """
+        alerts = self.recent_alerts
+        if len(alerts) == alerts.maxlen and not alerts[0].acknowledged:
+            self._unacknowledged_count -= 1
+        alerts.append(alert)
+        if not alert.acknowledged:
+            self._unacknowledged_count += 1
 
         # Update error count for health tracking
-        if alert.severity in [AlertSeverity.ERROR, AlertSeverity.CRITICAL]:
-            self.health.error_count_24h += 1
+        if alert.severity in _ERROR_SEVERITIES:
+            self.health.record_error()
 
         self._update_timestamp()
 
@@ -226,7 +343,7 @@ class SystemStatus(BaseModel):
 
     def get_recent_alerts(self, count: int = 10) -> List[AlertEvent]:
         """Get recent alerts, most recent first."""
-        return list(reversed(self.recent_alerts[-count:]))
+        return list(islice(reversed(self.recent_alerts), count))
 
     def get_unacknowledged_alerts(self) -> List[AlertEvent]:
         """Get all unacknowledged alerts."""
@@ -234,7 +351,7 @@ class SystemStatus(BaseModel):
 
     def get_unacknowledged_alert_count(self) -> int:
         """Count of unacknowledged alerts."""
-        return len(self.get_unacknowledged_alerts())
+        return self._unacknowledged_count
 
     def acknowledge_all_alerts(self) -> int:
         """Acknowledge all unacknowledged alerts."""
@@ -244,6 +361,7 @@ class SystemStatus(BaseModel):
                 alert.acknowledge()
                 count += 1
 
+        self._unacknowledged_count = 0
         if count > 0:
             self._update_timestamp()
 
@@ -253,6 +371,12 @@ class SystemStatus(BaseModel):
         """Get detailed system diagnostics."""
         sensor1_reading = self.get_sensor_reading(1)
         sensor2_reading = self.get_sensor_reading(2)
+        sensor1_metrics = self._dump_unchanged("sensor1", self.metrics.sensor1)
+        sensor2_metrics = self._dump_unchanged("sensor2", self.metrics.sensor2)
+
+        # Depends on the clock rather than the fields, so refresh it
+        sensor1_metrics["time_since_activity"] = self.metrics.sensor1.time_since_activity
+        sensor2_metrics["time_since_activity"] = self.metrics.sensor2.time_since_activity
 
         return {
             "system": {
@@ -266,26 +390,41 @@ class SystemStatus(BaseModel):
                 "sensor1": {
                     "responding": self.health.sensors_responding[1],
                     "current_reading": sensor1_reading.model_dump() if sensor1_reading else None,
-                    "metrics": self.metrics.sensor1.model_dump()
+                    "metrics": sensor1_metrics
                 },
                 "sensor2": {
                     "responding": self.health.sensors_responding[2],
                     "current_reading": sensor2_reading.model_dump() if sensor2_reading else None,
-                    "metrics": self.metrics.sensor2.model_dump()
+                    "metrics": sensor2_metrics
                 }
             },
-            "performance": self.metrics.performance.model_dump(),
+            "performance": self._dump_unchanged("performance", self.metrics.performance),
             "alerts": {
                 "total_count": len(self.recent_alerts),
                 "unacknowledged_count": self.get_unacknowledged_alert_count(),
-                "recent_alerts": [alert.model_dump() for alert in self.get_recent_alerts(5)]
+                "recent_alerts": [alert.export_dict() for alert in self.get_recent_alerts(5)]
             },
             "configuration": self.configuration.model_dump() if self.configuration else None
         }
 
+    def _dump_unchanged(self, key: str, model: BaseModel) -> Dict[str, Any]:
+        """
+        Return model.model_dump(), reusing the previous dump for key if the
+        model's field values have not changed since.
+
+        Only suitable for models with scalar fields: the copy returned is
+        shallow.
+        """
+        values = tuple(model.__dict__.values())
+        cached = self._diagnostics_dumps.get(key)
+        if cached is None or cached[0] != values:
+            cached = self._diagnostics_dumps[key] = (values, model.model_dump())
+        return dict(cached[1])
+
     def _update_timestamp(self) -> None:
-        """Update the last update timestamp."""
-        self.last_update = datetime.now()
+        """Update the last update timestamp and drop the cached summary."""
+        _set_field(self, "last_update", datetime.now())
+        self._summary_cache = None
 
     def export_status(self) -> Dict[str, Any]:
         """Export complete status for API responses."""
@@ -297,5 +436,22 @@ class SystemStatus(BaseModel):
             },
             "session_metrics": self.metrics.export_summary(),
             "health": self.health.model_dump(),
-            "recent_alerts": [alert.model_dump() for alert in self.get_recent_alerts()]
-        }
\ No newline at end of file
+            "recent_alerts": [alert.export_dict() for alert in self.get_recent_alerts()]
+        }
+
+    def export_status_json(self, indent: Optional[int] = None) -> bytes:
+        """
+        Export the export_status() shape directly as JSON bytes.
+
+        Readings, health and alerts are passed to the serializer as models,
+        so no intermediate dictionaries are built for them.
+        """
+        return to_json({
+            "system_summary": self.system_summary,
+            "current_readings": {
+                str(k): v for k, v in self.current_readings.items()
+            },
+            "session_metrics": self.metrics.export_summary(),
+            "health": self.health,
+            "recent_alerts": self.get_recent_alerts()
+        }, indent=indent)
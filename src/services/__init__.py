@@ -1,12 +1,14 @@
 """Core services for the filament sensor monitoring system."""
 
 from .sensor_monitor import SensorMonitor
-from .data_aggregator import DataAggregator, SensorDataWindow
+from .data_aggregator import DataAggregator, SensorDataWindow, WindowMetrics, WindowView
 from .session_storage import SessionStorage
 
 __all__ = [
     "SensorMonitor",
     "DataAggregator",
     "SensorDataWindow",
+    "WindowMetrics",
+    "WindowView",
     "SessionStorage"
 ]
\ No newline at end of file
@@ -1,11 +1,13 @@
 """DataAggregator service for calculating metrics and aggregating sensor data."""
 
 import asyncio
+import bisect
+import time
+from array import array
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Tuple
-import statistics
-from collections import deque
+from typing import Dict, Iterator, List, NamedTuple, Optional, Any, Tuple
 import threading
+from dataclasses import dataclass
 
 import structlog
 
@@ -17,55 +19,301 @@ from ..models import (
     AlertType,
     AlertSeverity
 )
+from ..models.session_metrics import SensorMetrics
 
 
 logger = structlog.get_logger(__name__)
 
 
-class SensorDataWindow:
-    """Rolling window of sensor data for statistical analysis."""
+# Readings per second a window is sized for (10 Hz polling with 2x headroom)
+_MAX_READINGS_PER_SECOND = 20
+
+# Sensor ids in the order used for the per-sensor tuples below
+_SENSOR_IDS = (1, 2)
+
+# Metric alert thresholds
+_HIGH_SPEED_MM_S = 50.0  # 50 mm/s = 3 m/min
+_INACTIVE_ALERT_AFTER = timedelta(hours=2)
+_DISTANCE_MILESTONE_M = 1000.0  # 1km
+
+# Bits packed into SensorDataWindow's flags column
+FLAG_MOVING = 0b01
+FLAG_FILAMENT = 0b10
+
+
+def _timestamp_ns(timestamp: datetime) -> int:
+    """Convert a reading timestamp to integer nanoseconds since the epoch."""
+    return round(timestamp.timestamp() * 1e9)
+
+
+class WindowView:
+    """
+    Readings start..end of a SensorDataWindow, read in place.
+
+    The view holds the window's column objects and two indices instead of
+    copies. The window only appends to these objects; compaction replaces
+    them with new ones, so the viewed range stays valid while readings
+    continue to arrive.
+    """
+
+    __slots__ = ("_ts_ns", "_flags", "_readings", "start", "end")
+
+    def __init__(self, ts_ns: array, flags: array, readings: List[SensorReading],
+                 start: int, end: int):
+        self._ts_ns = ts_ns
+        self._flags = flags
+        self._readings = readings
+        self.start = start
+        self.end = end
+
+    def __len__(self) -> int:
+        """Number of readings in the view."""
+        return self.end - self.start
+
+    @property
+    def earliest(self) -> Optional[SensorReading]:
+        """Oldest reading in the view."""
+        return self._readings[self.start] if self.end > self.start else None
+
+    @property
+    def latest(self) -> Optional[SensorReading]:
+        """Newest reading in the view."""
+        return self._readings[self.end - 1] if self.end > self.start else None
+
+    def time_span_ns(self) -> int:
+        """Time between the oldest and newest reading in the view."""
+        return self._ts_ns[self.end - 1] - self._ts_ns[self.start] if self.end > self.start else 0
 
-    def __init__(self, window_minutes: int = 60):
-        """Initialize data window."""
+    def flagged_readings(self) -> Iterator[Tuple[int, SensorReading]]:
+        """Iterate (flags, reading) pairs, oldest first."""
+        flags = self._flags
+        readings = self._readings
+        for i in range(self.start, self.end):
+            yield flags[i], readings[i]
+
+    def readings(self) -> List[SensorReading]:
+        """Copy the viewed readings into a list."""
+        return self._readings[self.start:self.end]
+
+
+class _WindowState(NamedTuple):
+    """Columns and live range of a SensorDataWindow as of its last write."""
+
+    ts_ns: array
+    flags: array
+    readings: List[SensorReading]
+    moving_total: array
+    runout_total: array
+    period_total: array
+    speed_total: array
+    speed_samples: array
+    start: int
+    end: int
+
+
+@dataclass(slots=True)
+class WindowMetrics:
+    """Statistics over one time range of a SensorDataWindow."""
+
+    reading_count: int = 0
+    latest_reading: Optional[SensorReading] = None
+    movement_events: int = 0
+    runout_events: int = 0
+    last_movement: Optional[datetime] = None
+    activity_periods: int = 0
+    average_speed_mm_s: float = 0.0
+
+
+class SensorDataWindow:
+    """
+    Rolling window of sensor data for statistical analysis.
+
+    Readings are stored column-wise (timestamp, distance, pulse count and a
+    flags byte per reading) in arrival order, so scans touch flat arrays of
+    numbers instead of model attributes. Readings must be added in timestamp
+    order, which lets window boundaries be found by bisection. The reading
+    objects themselves are kept alongside for callers that need them.
+
+    Expired readings are not removed one by one: a start index moves past
+    them, and the dead prefix is dropped once it makes up half the buffer.
+    The window also holds at most max_readings entries.
+
+    Running totals (moving readings, runout readings, movement period
+    starts, and speed samples between consecutive moving readings) are kept
+    as prefix columns with one more entry than there are readings: entry i
+    is the total before reading i. Statistics over any time range are then
+    differences of two entries, so compute_metrics does not scan readings.
+
+    Readers do not lock. After each write the window publishes a _WindowState
+    holding the current column objects and live range in a single attribute
+    store, and readers work only from the state they loaded. Columns are
+    only appended to past a published end, and compaction replaces them
+    with new objects, so a loaded state never changes under a reader.
+    Writers still serialize on a lock, which is uncontended with the usual
+    single producer.
+    """
+
+    def __init__(self, window_minutes: int = 60, max_readings: Optional[int] = None):
+        """
+        Initialize data window.
+
+        Args:
+            window_minutes: Length of the window in minutes
+            max_readings: Capacity; defaults to the window length at
+                _MAX_READINGS_PER_SECOND
+        """
         self.window_minutes = window_minutes
-        self.readings: deque = deque()
-        self._lock = threading.Lock()
+        self.max_readings = max_readings or window_minutes * 60 * _MAX_READINGS_PER_SECOND
+        self._window_ns = window_minutes * 60 * 1_000_000_000
+
+        self._ts_ns = array('q')
+        self._distance_mm = array('d')
+        self._pulse_count = array('q')
+        self._flags = array('B')
+        self._readings: List[SensorReading] = []
+        self._start = 0
+        self._write_lock = threading.Lock()
+
+        # Prefix totals, see the class docstring
+        self._moving_total = array('q', [0])
+        self._runout_total = array('q', [0])
+        self._period_total = array('q', [0])
+        self._speed_total = array('d', [0.0])
+        self._speed_samples = array('q', [0])
+
+        # Newest moving reading, the start point of the next speed sample
+        self._last_moving_ts_ns: Optional[int] = None
+        self._last_moving_distance = 0.0
+
+        self._state = self._snapshot()
+
+    def _snapshot(self) -> _WindowState:
+        """Capture the current columns and live range (caller holds the write lock)."""
+        return _WindowState(
+            self._ts_ns,
+            self._flags,
+            self._readings,
+            self._moving_total,
+            self._runout_total,
+            self._period_total,
+            self._speed_total,
+            self._speed_samples,
+            self._start,
+            len(self._ts_ns)
+        )
+
+    def __len__(self) -> int:
+        """Number of readings currently in the window."""
+        state = self._state
+        return state.end - state.start
 
     def add_reading(self, reading: SensorReading) -> None:
         """Add a new sensor reading to the window."""
-        with self._lock:
-            self.readings.append(reading)
-            self._cleanup_old_readings()
-
-    def _cleanup_old_readings(self) -> None:
-        """Remove readings older than the window."""
-        cutoff_time = datetime.now() - timedelta(minutes=self.window_minutes)
-
-        while self.readings and self.readings[0].timestamp < cutoff_time:
-            self.readings.popleft()
+        ts_ns = _timestamp_ns(reading.timestamp)
+        flags = (FLAG_MOVING if reading.is_moving else 0) | (FLAG_FILAMENT if reading.has_filament else 0)
+
+        with self._write_lock:
+            self._append_totals(ts_ns, reading.distance_mm, flags)
+            self._ts_ns.append(ts_ns)
+            self._distance_mm.append(reading.distance_mm)
+            self._pulse_count.append(reading.pulse_count)
+            self._flags.append(flags)
+            self._readings.append(reading)
+            self._cleanup_old_readings(ts_ns)
+            # Publish last: readers see either the previous state or this one
+            self._state = self._snapshot()
+
+    def _append_totals(self, ts_ns: int, distance_mm: float, flags: int) -> None:
+        """Extend the prefix totals by one reading (caller holds the write lock)."""
+        moving = flags & FLAG_MOVING
+        period_start = moving and not (self._flags and self._flags[-1] & FLAG_MOVING)
+        speed = 0.0
+        speed_sample = 0
+        if moving:
+            # Speed since the previous moving reading
+            if self._last_moving_ts_ns is not None:
+                time_diff_ns = ts_ns - self._last_moving_ts_ns
+                distance_diff = distance_mm - self._last_moving_distance
+                if time_diff_ns > 0 and distance_diff > 0:
+                    speed = distance_diff * 1e9 / time_diff_ns
+                    speed_sample = 1
+            self._last_moving_ts_ns = ts_ns
+            self._last_moving_distance = distance_mm
+
+        self._moving_total.append(self._moving_total[-1] + (1 if moving else 0))
+        self._runout_total.append(self._runout_total[-1] + (0 if flags & FLAG_FILAMENT else 1))
+        self._period_total.append(self._period_total[-1] + (1 if period_start else 0))
+        self._speed_total.append(self._speed_total[-1] + speed)
+        self._speed_samples.append(self._speed_samples[-1] + speed_sample)
+
+    def _cleanup_old_readings(self, newest_ns: int) -> None:
+        """Expire readings older than the window, measured from the newest reading."""
+        ts_ns = self._ts_ns
+        start = self._start
+        cutoff_ns = newest_ns - self._window_ns
+        if ts_ns[start] < cutoff_ns:
+            start = bisect.bisect_left(ts_ns, cutoff_ns, start)
+        start = max(start, len(ts_ns) - self.max_readings)
+
+        # Compact once the expired prefix is half the buffer (amortized O(1)).
+        # Columns are replaced rather than trimmed in place so that published
+        # states and WindowViews keep reading the objects they were taken from.
+        if start * 2 >= len(ts_ns) and start:
+            self._ts_ns = ts_ns[start:]
+            self._distance_mm = self._distance_mm[start:]
+            self._pulse_count = self._pulse_count[start:]
+            self._flags = self._flags[start:]
+            self._readings = self._readings[start:]
+            # Prefix entry start (the totals before the new first reading) stays
+            self._moving_total = self._moving_total[start:]
+            self._runout_total = self._runout_total[start:]
+            self._period_total = self._period_total[start:]
+            self._speed_total = self._speed_total[start:]
+            self._speed_samples = self._speed_samples[start:]
+            start = 0
+        self._start = start
+
+    @staticmethod
+    def _start_index(state: _WindowState, minutes: Optional[int]) -> int:
+        """Index of the first reading of state within the last minutes."""
+        if not minutes:
+            return state.start
+        cutoff_ns = time.time_ns() - minutes * 60 * 1_000_000_000
+        return bisect.bisect_left(state.ts_ns, cutoff_ns, state.start, state.end)
+
+    def view(self, minutes: Optional[int] = None) -> WindowView:
+        """Get a view of the specified time window without copying readings."""
+        state = self._state
+        return WindowView(
+            state.ts_ns,
+            state.flags,
+            state.readings,
+            self._start_index(state, minutes),
+            state.end
+        )
+
+    def time_span_ns(self) -> int:
+        """Time between the oldest and newest reading in the window."""
+        state = self._state
+        if state.end == state.start:
+            return 0
+        return state.ts_ns[state.end - 1] - state.ts_ns[state.start]
 
     def get_readings(self, minutes: Optional[int] = None) -> List[SensorReading]:
         """Get readings from the specified time window."""
-        with self._lock:
-            if not minutes:
-                return list(self.readings)
-
-            cutoff_time = datetime.now() - timedelta(minutes=minutes)
-            return [r for r in self.readings if r.timestamp >= cutoff_time]
+        state = self._state
+        return state.readings[self._start_index(state, minutes):state.end]
 
     def get_movement_periods(self, minutes: int = 60) -> List[Tuple[datetime, datetime]]:
         """Get periods of continuous movement within the time window."""
-        readings = self.get_readings(minutes)
-        if not readings:
-            return []
-
         periods = []
         current_start = None
 
-        for reading in readings:
-            if reading.is_moving and current_start is None:
-                current_start = reading.timestamp
-            elif not reading.is_moving and current_start is not None:
+        for flags, reading in self.view(minutes).flagged_readings():
+            if flags & FLAG_MOVING:
+                if current_start is None:
+                    current_start = reading.timestamp
+            elif current_start is not None:
                 periods.append((current_start, reading.timestamp))
                 current_start = None
 
@@ -77,26 +325,58 @@ class SensorDataWindow:
 
     def calculate_average_speed(self, minutes: int = 60) -> float:
         """Calculate average movement speed over the time window."""
-        readings = self.get_readings(minutes)
-        moving_readings = [r for r in readings if r.is_moving]
-
-        if len(moving_readings) < 2:
-            return 0.0
-
-        # Calculate speed between consecutive moving readings
-        speeds = []
-        for i in range(1, len(moving_readings)):
-            curr = moving_readings[i]
-            prev = moving_readings[i - 1]
-
-            time_diff = (curr.timestamp - prev.timestamp).total_seconds()
-            distance_diff = curr.distance_mm - prev.distance_mm
+        return self.compute_metrics(minutes).average_speed_mm_s
+
+    def compute_metrics(self, minutes: int = 60) -> WindowMetrics:
+        """
+        Compute the window statistics used for sensor metrics.
+
+        Each statistic is the difference of two prefix totals; the first
+        moving reading in the range is located by bisection so that the
+        period and speed counted across the range boundary can be taken out.
+
+        Args:
+            minutes: How far back to look
+
+        Returns:
+            WindowMetrics for the readings in the time window
+        """
+        state = self._state
+        start = self._start_index(state, minutes)
+        end = state.end
+        metrics = WindowMetrics(reading_count=end - start)
+        if start == end:
+            return metrics
 
-            if time_diff > 0 and distance_diff > 0:
-                speed_mm_s = distance_diff / time_diff
-                speeds.append(speed_mm_s)
+        moving_total = state.moving_total
+        moving_before = moving_total[start]
+        moving_through = moving_total[end]
+        metrics.latest_reading = state.readings[end - 1]
+        metrics.movement_events = moving_through - moving_before
+        metrics.runout_events = state.runout_total[end] - state.runout_total[start]
+        if not metrics.movement_events:
+            return metrics
 
-        return statistics.mean(speeds) if speeds else 0.0
+        # Readings first and last reaching a new moving total are the
+        # first and last moving readings in the range
+        first = bisect.bisect_left(moving_total, moving_before + 1, start + 1, end + 1) - 1
+        last = bisect.bisect_left(moving_total, moving_through, first + 1, end + 1) - 1
+        metrics.last_movement = state.readings[last].timestamp
+
+        # A period already running at the range start begins at its first reading
+        period_total = state.period_total
+        periods = period_total[end] - period_total[start]
+        if first == start and period_total[start + 1] == period_total[start]:
+            periods += 1
+        metrics.activity_periods = periods
+
+        # The first moving reading's sample pairs it with a reading outside the range
+        speed_samples = state.speed_samples[end] - state.speed_samples[first + 1]
+        if speed_samples:
+            metrics.average_speed_mm_s = (
+                (state.speed_total[end] - state.speed_total[first + 1]) / speed_samples
+            )
+        return metrics
 
 
 class DataAggregator:
@@ -111,6 +391,7 @@ class DataAggregator:
             1: SensorDataWindow(window_minutes=120),  # 2-hour window
             2: SensorDataWindow(window_minutes=120)
         }
+        self._sensor_window_list = [self.sensor_windows[sensor_id] for sensor_id in _SENSOR_IDS]
 
         # Aggregation state
         self.is_running = False
@@ -121,6 +402,11 @@ class DataAggregator:
         self.last_aggregation_duration_ms = 0.0
         self.aggregation_count = 0
 
+        # Alert state: bit (sensor_id - 1) is set when that sensor has new
+        # readings since the last metric alert check
+        self._alerts_dirty_mask = 0
+        self._distance_milestone_reached = False
+
     async def start_aggregation(self) -> None:
         """Start the data aggregation service."""
         if self.is_running:
@@ -159,6 +445,7 @@ class DataAggregator:
         """Add a new sensor reading to the aggregation windows."""
         if reading.sensor_id in self.sensor_windows:
             self.sensor_windows[reading.sensor_id].add_reading(reading)
+            self._alerts_dirty_mask |= 1 << (reading.sensor_id - 1)
 
     def calculate_session_metrics(self) -> SessionMetrics:
         """Calculate current session metrics."""
@@ -166,15 +453,11 @@ class DataAggregator:
             # Get current metrics object
             metrics = self.system_status.metrics
 
-            # Update sensor-specific metrics
-            for sensor_id in [1, 2]:
-                self._update_sensor_metrics(sensor_id)
-
-            # Update performance metrics
-            self._update_performance_metrics()
-
-            # Update system-wide metrics
-            self._update_system_metrics()
+            # Update sensor-specific metrics; the totals, runout count and
+            # performance figures are kept by the sensor monitor
+            for sensor_id, window, sensor in zip(_SENSOR_IDS, self._sensor_window_list,
+                                                 (metrics.sensor1, metrics.sensor2)):
+                self._update_sensor_metrics(sensor_id, window, sensor)
 
             return metrics
 
@@ -182,94 +465,39 @@ class DataAggregator:
             logger.error("Error calculating session metrics", error=str(e))
             return SessionMetrics()
 
-    def _update_sensor_metrics(self, sensor_id: int) -> None:
-        """Update metrics for a specific sensor."""
+    def _update_sensor_metrics(self, sensor_id: int, window: SensorDataWindow,
+                               sensor_metrics: SensorMetrics) -> None:
+        """Update the windowed statistics for a specific sensor."""
         try:
-            sensor_metrics = getattr(self.system_status.metrics, f"sensor{sensor_id}")
-            window = self.sensor_windows[sensor_id]
+            # Summarize the recent window in one pass
+            recent = window.compute_metrics(minutes=60)
 
-            # Get recent readings
-            recent_readings = window.get_readings(minutes=60)
-            all_readings = window.get_readings()
-
-            if not recent_readings:
+            if not recent.reading_count:
                 return
 
-            # Update basic statistics
-            latest_reading = max(recent_readings, key=lambda r: r.timestamp)
-            sensor_metrics.total_distance_mm = latest_reading.distance_mm
-            sensor_metrics.total_pulses = latest_reading.pulse_count
-
-            # Count events in recent window
-            sensor_metrics.movement_events = len([r for r in recent_readings if r.is_moving])
-            sensor_metrics.runout_events = len([r for r in recent_readings if not r.has_filament])
+            # Count moving readings in recent window
+            sensor_metrics.movement_events = recent.movement_events
 
             # Update last movement time
-            moving_readings = [r for r in recent_readings if r.is_moving]
-            if moving_readings:
-                sensor_metrics.last_movement = max(moving_readings, key=lambda r: r.timestamp).timestamp
+            if recent.last_movement is not None:
+                sensor_metrics.last_movement = recent.last_movement
 
-            # Calculate activity periods
-            movement_periods = window.get_movement_periods(minutes=60)
-            sensor_metrics.activity_periods = len(movement_periods)
-
-            # Calculate average speed
-            sensor_metrics.average_speed_mm_s = window.calculate_average_speed(minutes=60)
+            # Activity periods and average speed
+            sensor_metrics.activity_periods = recent.activity_periods
+            sensor_metrics.average_speed_mm_s = recent.average_speed_mm_s
 
             # Update usage rate (mm per hour)
-            if len(all_readings) >= 2:
-                earliest = min(all_readings, key=lambda r: r.timestamp)
-                time_hours = (latest_reading.timestamp - earliest.timestamp).total_seconds() / 3600.0
-                if time_hours > 0:
-                    sensor_metrics.usage_rate_mm_h = latest_reading.distance_mm / time_hours
+            time_hours = window.time_span_ns() / 3.6e12
+            if time_hours > 0:
+                sensor_metrics.usage_rate_mm_h = recent.latest_reading.distance_mm / time_hours
 
         except Exception as e:
             logger.error("Error updating sensor metrics", sensor_id=sensor_id, error=str(e))
 
-    def _update_performance_metrics(self) -> None:
-        """Update system performance metrics."""
-        try:
-            performance = self.system_status.metrics.performance
-
-            # Update aggregation performance
-            performance.last_aggregation_ms = self.last_aggregation_duration_ms
-            performance.aggregation_count = self.aggregation_count
-
-            # Calculate memory usage (simplified estimation)
-            total_readings = sum(len(window.readings) for window in self.sensor_windows.values())
-            estimated_memory_mb = (total_readings * 0.001) + 10  # Base overhead
-            performance.estimated_memory_mb = estimated_memory_mb
-
-            # Update data processing metrics
-            performance.total_readings_processed = sum(
-                getattr(self.system_status.metrics, f"sensor{i}").total_pulses
-                for i in [1, 2]
-            )
-
-        except Exception as e:
-            logger.error("Error updating performance metrics", error=str(e))
-
-    def _update_system_metrics(self) -> None:
-        """Update system-wide aggregated metrics."""
-        try:
-            # Calculate total system distance
-            total_distance_mm = sum(
-                getattr(self.system_status.metrics, f"sensor{i}").total_distance_mm
-                for i in [1, 2]
-            )
-
-            # Update system metrics
-            self.system_status.metrics.total_distance_m = total_distance_mm / 1000.0
-            self.system_status.metrics.session_duration_hours = self.system_status.uptime_hours
-
-            # Calculate efficiency metrics
-            if self.system_status.uptime_hours > 0:
-                self.system_status.metrics.avg_usage_rate_mm_h = (
-                    total_distance_mm / self.system_status.uptime_hours
-                )
-
-        except Exception as e:
-            logger.error("Error updating system metrics", error=str(e))
+    def _estimated_memory_mb(self) -> float:
+        """Estimate the memory held by the data windows (simplified)."""
+        total_readings = sum(len(window) for window in self._sensor_window_list)
+        return (total_readings * 0.001) + 10  # Base overhead
 
     async def _aggregation_loop(self) -> None:
         """Main aggregation loop."""
@@ -277,14 +505,13 @@ class DataAggregator:
 
         while self.is_running:
             try:
-                start_time = datetime.now()
+                start_ns = time.monotonic_ns()
 
                 # Perform aggregation
                 await self._perform_aggregation()
 
                 # Track performance
-                duration = (datetime.now() - start_time).total_seconds() * 1000
-                self.last_aggregation_duration_ms = duration
+                self.last_aggregation_duration_ms = (time.monotonic_ns() - start_ns) / 1e6
                 self.aggregation_count += 1
 
                 # Sleep until next aggregation
@@ -320,45 +547,55 @@ class DataAggregator:
     async def _check_metric_alerts(self) -> None:
         """Check metrics for alert conditions."""
         try:
+            metrics = self.system_status.metrics
+            current_readings = self.system_status.current_readings
+            now = datetime.now()
+            inactive_before = now - _INACTIVE_ALERT_AFTER
+            dirty_mask = self._alerts_dirty_mask
+            self._alerts_dirty_mask = 0
+
             # Check for high usage rates
-            for sensor_id in [1, 2]:
-                sensor_metrics = getattr(self.system_status.metrics, f"sensor{sensor_id}")
+            for sensor_id, sensor_metrics in zip(_SENSOR_IDS, (metrics.sensor1, metrics.sensor2)):
 
-                # Alert on very high speed (potential issue)
-                if sensor_metrics.average_speed_mm_s > 50.0:  # 50 mm/s = 180 mm/min
+                # Alert on very high speed (potential issue); the speed only
+                # changes when the sensor has new readings
+                if (dirty_mask >> (sensor_id - 1) & 1 and
+                        sensor_metrics.average_speed_mm_s > _HIGH_SPEED_MM_S):
                     self.system_status.add_alert(AlertEvent(
-                        alert_type=AlertType.SENSOR_MOVEMENT,
+                        alert_type=AlertType.HIGH_FEED_RATE,
                         severity=AlertSeverity.WARNING,
                         message=f"High filament speed detected on sensor {sensor_id}: "
                                f"{sensor_metrics.average_speed_mm_s:.1f} mm/s",
                         sensor_id=sensor_id,
-                        metadata={"speed_mm_s": sensor_metrics.average_speed_mm_s}
+                        details={"speed_mm_s": sensor_metrics.average_speed_mm_s}
                     ))
 
                 # Alert on no movement for extended period (if filament present)
-                current_reading = self.system_status.get_sensor_reading(sensor_id)
+                last_movement = sensor_metrics.last_movement
+                if last_movement is None or last_movement >= inactive_before:
+                    continue
+                current_reading = current_readings.get(sensor_id)
                 if (current_reading and
                     current_reading.has_filament and
-                    not current_reading.is_moving and
-                    sensor_metrics.last_movement and
-                    datetime.now() - sensor_metrics.last_movement > timedelta(hours=2)):
+                    not current_reading.is_moving):
 
                     self.system_status.add_alert(AlertEvent(
-                        alert_type=AlertType.SENSOR_INACTIVE,
+                        alert_type=AlertType.MOVEMENT_STOPPED,
                         severity=AlertSeverity.WARNING,
-                        message=f"Sensor {sensor_id} inactive for {datetime.now() - sensor_metrics.last_movement}",
+                        message=f"Sensor {sensor_id} inactive for {now - last_movement}",
                         sensor_id=sensor_id
                     ))
 
             # Check system-wide metrics
-            if self.system_status.metrics.total_distance_m > 1000.0:  # 1km
-                if not hasattr(self, '_distance_milestone_1km'):
-                    self._distance_milestone_1km = True
+            if not self._distance_milestone_reached:
+                total_distance_m = metrics.total_distance_m
+                if total_distance_m > _DISTANCE_MILESTONE_M:
+                    self._distance_milestone_reached = True
                     self.system_status.add_alert(AlertEvent(
-                        alert_type=AlertType.SYSTEM_MILESTONE,
+                        alert_type=AlertType.DISTANCE_MILESTONE,
                         severity=AlertSeverity.INFO,
-                        message=f"Milestone reached: {self.system_status.metrics.total_distance_m:.1f}m total filament processed",
-                        metadata={"milestone_type": "distance", "value": self.system_status.metrics.total_distance_m}
+                        message=f"Milestone reached: {total_distance_m:.1f}m total filament processed",
+                        details={"milestone_type": "distance", "value": total_distance_m}
                     ))
 
         except Exception as e:
@@ -372,10 +609,10 @@ class DataAggregator:
             "last_aggregation_duration_ms": self.last_aggregation_duration_ms,
             "aggregation_count": self.aggregation_count,
             "sensor_windows": {
-                sensor_id: len(window.readings)
+                sensor_id: len(window)
                 for sensor_id, window in self.sensor_windows.items()
             },
-            "estimated_memory_mb": self.system_status.metrics.performance.estimated_memory_mb
+            "estimated_memory_mb": self._estimated_memory_mb()
         }
 
     def export_historical_data(self, sensor_id: Optional[int] = None,
@@ -409,4 +646,4 @@ class DataAggregator:
 
 
 # Export the main component
-__all__ = ["DataAggregator", "SensorDataWindow"]
\ No newline at end of file
+__all__ = ["DataAggregator", "SensorDataWindow", "WindowMetrics", "WindowView"]
\ No newline at end of file
@@ -1,9 +1,12 @@
 """SensorMonitor service for polling filament sensors and managing readings."""
 
 import asyncio
+import inspect
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Callable, Any
-import threading
+from typing import Dict, List, Optional, Callable, Any, Tuple
 import weakref
 
 import structlog
@@ -16,82 +19,199 @@ from ..models import (
     AlertType,
     AlertSeverity
 )
-from ..lib.mcp2221_sensor import MCP2221Connection, PulseDetector
+from ..models.session_metrics import SensorMetrics, SessionMetrics
+from ..lib.mcp2221_sensor import MCP2221Manager
+from ..lib.mcp2221_sensor.connection import (
+    ConnectionManager,
+    ConnectionState,
+    create_mcp2221_connection_manager
+)
+from ..lib.mcp2221_sensor.pulse_detector import PulseDetector, PulseStats
 
 
 logger = structlog.get_logger(__name__)
 
+# Idle time after which renewed movement on a sensor raises an alert
+_MOVEMENT_RESUMED_AFTER = timedelta(minutes=10)
+
+# Error backoff: doubles from the base delay per consecutive failure up to
+# the cap, plus up to _BACKOFF_JITTER_S of random jitter
+_BACKOFF_BASE_S = 0.5
+_BACKOFF_MAX_S = 30.0
+_BACKOFF_JITTER_S = 0.25
+
+# Connection states in which the ConnectionManager is already working on
+# the link, so the monitor waits instead of starting another attempt
+_CONNECTING_STATES = frozenset((ConnectionState.CONNECTING, ConnectionState.RECONNECTING))
+
+
+def _backoff_delay(failures: int) -> float:
+    """Seconds to wait after the given number of consecutive failures."""
+    return min(_BACKOFF_MAX_S, _BACKOFF_BASE_S * (2 ** failures)) + random.uniform(0, _BACKOFF_JITTER_S)
+
+
+class _SensorChannel:
+    """GPIO pins, pulse statistics and debounced runout state of one sensor."""
+
+    __slots__ = (
+        "sensor_id", "movement_name", "runout_name", "movement_bit", "runout_bit",
+        "stats", "has_filament", "runout_pending_ns", "last_pulse_count", "last_poll_ns"
+    )
+
+    def __init__(self, sensor_id: int, movement_pin: int, runout_pin: int, stats: PulseStats):
+        self.sensor_id = sensor_id
+
+        # GPIO names for diagnostics and masks into the packed bitmap
+        self.movement_name = f"GP{movement_pin}"
+        self.runout_name = f"GP{runout_pin}"
+        self.movement_bit = 1 << movement_pin
+        self.runout_bit = 1 << runout_pin
+
+        # Pulse statistics of the movement pin, owned by the pulse detector
+        self.stats = stats
+
+        # Accepted filament state (None until the first sample) and the
+        # time.monotonic_ns() since which the runout pin has disagreed with it
+        self.has_filament: Optional[bool] = None
+        self.runout_pending_ns = 0
+
+        # Pulse count and sample time of the previous poll, for metric deltas
+        self.last_pulse_count = 0
+        self.last_poll_ns = 0
+
 
 class SensorMonitor:
     """Main sensor monitoring service for polling and managing sensor readings."""
 
     def __init__(self,
                  system_status: Optional[SystemStatus] = None,
-                 hardware_connection: Optional[MCP2221Connection] = None):
+                 hardware_connection: Optional[MCP2221Manager] = None):
         """Initialize the sensor monitor."""
         self.system_status = system_status or SystemStatus.get_instance()
         self.hardware_connection = hardware_connection
 
+        # Retry, health checking and background reconnection for the
+        # hardware, created when monitoring starts
+        self._connection_manager: Optional[ConnectionManager] = None
+
         # Monitoring state
         self.is_running = False
         self._monitor_task: Optional[asyncio.Task] = None
-        self._lock = threading.Lock()
+        # Serializes start/stop; both only run on the event loop, so an
+        # asyncio lock is enough and never blocks the loop thread
+        self._start_lock = asyncio.Lock()
+
+        # Event loop running the monitor, captured in start_monitoring
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        # Single thread for blocking MCP2221A calls, so they run in order and
+        # do not queue behind other work on the loop's default executor
+        self._hw_executor: Optional[ThreadPoolExecutor] = None
+
+        # Pulse detector for the movement pins of all sensors, fed the packed
+        # GPIO bitmap once per poll
+        self.pulse_detector: Optional[PulseDetector] = None
+
+        # Per-sensor pins and state, keyed by sensor_id
+        self._channels: Dict[int, _SensorChannel] = {}
 
-        # Sensor pulse detectors
-        self.pulse_detectors: Dict[int, PulseDetector] = {}
+        # Attach raw pin states to readings; diagnostic only, enabled with
+        # SensorConfiguration.enable_debug_logging
+        self._debug_gpio = False
+
+        # Filament and movement state of each sensor's previous reading, so
+        # alerts fire on transitions rather than on every poll
+        self._last_filament_state: Dict[int, bool] = {}
+        self._last_moving_state: Dict[int, bool] = {}
 
         # Monitoring configuration
         self.polling_interval_ms = 100  # Default
         self.movement_timeout_ms = 5000  # Default
         self.runout_debounce_ms = 500  # Default
+        self._mm_per_pulse = 2.88  # Default
 
-        # Callback for external notifications (like WebSocket)
-        self.update_callbacks: weakref.WeakSet = weakref.WeakSet()
+        # Weak references to the callbacks for external notifications (like
+        # WebSocket), split by whether they must be awaited. Each tuple is
+        # replaced when a callback is added or removed so notifying iterates
+        # it without copying; references whose callback has died are skipped
+        # when notifying and dropped on the next change
+        self._sync_snapshot: Tuple[weakref.ref, ...] = ()
+        self._async_snapshot: Tuple[weakref.ref, ...] = ()
 
         # Performance tracking
         self.last_poll_duration_ms = 0.0
         self.poll_count = 0
         self.error_count = 0
 
+        # Consecutive monitor loop errors and failed reconnects, and the
+        # loop time before which no reconnect is attempted
+        self._consecutive_errors = 0
+        self._reconnect_failures = 0
+        self._next_reconnect_at = 0.0
+
     def add_update_callback(self, callback: Callable[[SensorReading], None]) -> None:
-        """Add callback to be notified of sensor updates."""
-        self.update_callbacks.add(callback)
+        """Add callback to be notified of sensor updates.
+
+        Only a weak reference is kept, so the owner of the callback must keep
+        it (or, for a bound method, its instance) alive.
+        """
+        # A bound method is created afresh on each attribute access, so a
+        # plain weak reference to it would die immediately
+        ref = weakref.WeakMethod(callback) if inspect.ismethod(callback) else weakref.ref(callback)
+        if asyncio.iscoroutinefunction(callback):
+            self._async_snapshot = self._without_callback(self._async_snapshot, callback) + (ref,)
+        else:
+            self._sync_snapshot = self._without_callback(self._sync_snapshot, callback) + (ref,)
 
     def remove_update_callback(self, callback: Callable[[SensorReading], None]) -> None:
         """Remove update callback."""
-        self.update_callbacks.discard(callback)
+        self._sync_snapshot = self._without_callback(self._sync_snapshot, callback)
+        self._async_snapshot = self._without_callback(self._async_snapshot, callback)
+
+    @staticmethod
+    def _without_callback(refs: Tuple[weakref.ref, ...],
+                          callback: Callable[[SensorReading], None]) -> Tuple[weakref.ref, ...]:
+        """Return the live references other than the one to callback."""
+        return tuple(ref for ref in refs if ref() is not None and ref() != callback)
 
     async def start_monitoring(self, configuration: SensorConfiguration) -> None:
         """Start the sensor monitoring service."""
-        with self._lock:
+        async with self._start_lock:
             if self.is_running:
                 logger.warning("Sensor monitor already running")
                 return
 
             logger.info("Starting sensor monitor")
 
+            self._loop = asyncio.get_running_loop()
+            self._hw_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="mcp2221")
+
             # Update configuration
-            self.polling_interval_ms = configuration.polling.polling_interval_ms
-            self.movement_timeout_ms = configuration.detection.movement_timeout_ms
-            self.runout_debounce_ms = configuration.detection.runout_debounce_ms
+            self._apply_timing(configuration)
 
-            # Initialize hardware connection if not provided
-            if self.hardware_connection is None:
-                try:
-                    self.hardware_connection = MCP2221Connection()
-                    await self._async_hardware_connect()
-                except Exception as e:
-                    logger.error("Failed to initialize hardware connection", error=str(e))
-                    self.system_status.update_hardware_status(False)
-                    self.system_status.add_alert(AlertEvent.create_hardware_error(
-                        f"Failed to connect to MCP2221A: {str(e)}"
-                    ))
-                    return
-
-            # Initialize pulse detectors for enabled sensors
-            await self._initialize_pulse_detectors(configuration)
-
-            # Start monitoring task
+            # Connect and configure the hardware
+            try:
+                if self.hardware_connection is None:
+                    self.hardware_connection = MCP2221Manager()
+                await self._async_hardware_connect(configuration)
+            except Exception as e:
+                logger.error("Failed to initialize hardware connection", error=str(e))
+                self.system_status.update_hardware_status(False)
+                self.system_status.add_alert(AlertEvent.create_hardware_error(
+                    f"Failed to connect to MCP2221A: {str(e)}"
+                ))
+                self._close_connection_manager()
+                self._hw_executor.shutdown(wait=False)
+                self._hw_executor = None
+                return
+
+            # Initialize pulse detection for both sensors
+            self._initialize_pulse_detectors(configuration)
+
+            # Start monitoring task with a clean error backoff
+            self._consecutive_errors = 0
+            self._reconnect_failures = 0
+            self._next_reconnect_at = 0.0
             self.is_running = True
             self._monitor_task = asyncio.create_task(self._monitor_loop())
 
@@ -105,11 +225,11 @@ class SensorMonitor:
 
             logger.info("Sensor monitor started",
                        polling_interval_ms=self.polling_interval_ms,
-                       enabled_sensors=len(self.pulse_detectors))
+                       enabled_sensors=len(self._channels))
 
     async def stop_monitoring(self) -> None:
         """Stop the sensor monitoring service."""
-        with self._lock:
+        async with self._start_lock:
             if not self.is_running:
                 logger.warning("Sensor monitor not running")
                 return
@@ -127,8 +247,13 @@ class SensorMonitor:
                     pass
                 self._monitor_task = None
 
-            # Clean up pulse detectors
-            self.pulse_detectors.clear()
+            # Clean up pulse detection and the hardware thread
+            self.pulse_detector = None
+            self._channels.clear()
+            self._close_connection_manager()
+            self._hw_executor.shutdown(wait=False)
+            self._hw_executor = None
+            self._loop = None
 
             # Update system status
             self.system_status.add_alert(AlertEvent(
@@ -145,12 +270,14 @@ class SensorMonitor:
 
         # Update polling interval
         old_interval = self.polling_interval_ms
-        self.polling_interval_ms = configuration.polling.polling_interval_ms
-        self.movement_timeout_ms = configuration.detection.movement_timeout_ms
-        self.runout_debounce_ms = configuration.detection.runout_debounce_ms
+        self._apply_timing(configuration)
 
-        # Reinitialize pulse detectors if sensor configuration changed
-        await self._initialize_pulse_detectors(configuration)
+        # Apply the pin mapping to the hardware, then rebuild pulse detection
+        if self.is_running:
+            await self._loop.run_in_executor(
+                self._hw_executor, self.hardware_connection.configure_gpio, self._gpio_config(configuration)
+            )
+        self._initialize_pulse_detectors(configuration)
 
         # Log configuration change
         self.system_status.add_alert(AlertEvent.create_configuration_change(
@@ -178,70 +305,113 @@ class SensorMonitor:
             "last_poll_duration_ms": self.last_poll_duration_ms,
             "poll_count": self.poll_count,
             "error_count": self.error_count,
-            "enabled_sensors": len(self.pulse_detectors),
+            "enabled_sensors": len(self._channels),
             "hardware_connected": self.system_status.health.hardware_connected
         }
 
-    async def _async_hardware_connect(self) -> None:
-        """Connect to hardware in async context."""
-        def connect():
-            return self.hardware_connection.connect()
-
-        # Run hardware connection in thread pool
-        loop = asyncio.get_event_loop()
-        await loop.run_in_executor(None, connect)
-
-    async def _initialize_pulse_detectors(self, configuration: SensorConfiguration) -> None:
-        """Initialize pulse detectors for enabled sensors."""
-        self.pulse_detectors.clear()
-
-        for sensor_config in configuration.sensors:
-            if sensor_config.enabled:
-                try:
-                    # Create pulse detector
-                    detector = PulseDetector(
-                        sensor_id=sensor_config.id,
-                        mm_per_pulse=configuration.calibration.mm_per_pulse,
-                        movement_timeout_ms=self.movement_timeout_ms,
-                        runout_debounce_ms=self.runout_debounce_ms
-                    )
+    def _apply_timing(self, configuration: SensorConfiguration) -> None:
+        """Take the polling and detection timings from the configuration."""
+        self.polling_interval_ms = configuration.polling.polling_interval_ms
+        self.runout_debounce_ms = configuration.calibration.runout_threshold_ms
+        self._mm_per_pulse = configuration.calibration.mm_per_pulse
 
-                    self.pulse_detectors[sensor_config.id] = detector
+    @staticmethod
+    def _gpio_config(configuration: SensorConfiguration) -> Dict[str, Dict[str, int]]:
+        """Pin mapping in the form MCP2221Manager.configure_gpio() expects."""
+        return {
+            f"sensor{sensor_id}": configuration.get_sensor_pins(sensor_id).model_dump()
+            for sensor_id in (1, 2)
+        }
 
-                    logger.info("Initialized pulse detector",
-                               sensor_id=sensor_config.id,
-                               sensor_name=sensor_config.name)
+    async def _async_hardware_connect(self, configuration: SensorConfiguration) -> None:
+        """
+        Detect and configure the MCP2221A, then bring up its ConnectionManager.
+
+        Raises:
+            ConnectionError: If no device is detected
+        """
+        manager = self.hardware_connection
+        gpio_config = self._gpio_config(configuration)
+
+        def connect() -> ConnectionManager:
+            if not manager.is_connected() and not manager.detect_device():
+                raise ConnectionError("MCP2221A device not detected")
+            manager.configure_gpio(gpio_config)
+
+            connection = create_mcp2221_connection_manager(manager)
+            connection.connect()
+            connection.add_consumer()
+            return connection
+
+        # Run hardware connection on the hardware thread
+        self._connection_manager = await self._loop.run_in_executor(self._hw_executor, connect)
+
+    def _close_connection_manager(self) -> None:
+        """Stop health checks and reconnection for the hardware."""
+        connection = self._connection_manager
+        if connection is not None:
+            self._connection_manager = None
+            connection.remove_consumer()
+            connection.close()
+
+    def _initialize_pulse_detectors(self, configuration: SensorConfiguration) -> None:
+        """Initialize pulse detection for both sensors."""
+        self._channels.clear()
+        self._last_filament_state.clear()
+        self._last_moving_state.clear()
+        self._debug_gpio = configuration.enable_debug_logging
+
+        detector = PulseDetector(debounce_ms=configuration.calibration.debounce_ms)
+        for sensor_id in (1, 2):
+            pins = configuration.get_sensor_pins(sensor_id)
+            detector.register_pin(pins.movement_pin)  # Pull-up default
+            self._channels[sensor_id] = _SensorChannel(
+                sensor_id, pins.movement_pin, pins.runout_pin,
+                detector.get_statistics(pins.movement_pin)
+            )
+
+            logger.info("Initialized pulse detection",
+                       sensor_id=sensor_id,
+                       movement_pin=pins.movement_pin,
+                       runout_pin=pins.runout_pin)
 
-                except Exception as e:
-                    logger.error("Failed to initialize pulse detector",
-                               sensor_id=sensor_config.id,
-                               error=str(e))
+        self.pulse_detector = detector
 
     async def _monitor_loop(self) -> None:
         """Main monitoring loop."""
         logger.info("Sensor monitor loop started")
 
+        # Polls are scheduled against fixed deadlines so that time spent
+        # polling and waking up does not accumulate as drift
+        loop = self._loop
+        next_deadline = loop.time()
+
         while self.is_running:
             try:
-                start_time = datetime.now()
+                start_time = time.monotonic()
 
                 # Poll all sensors
                 await self._poll_sensors()
 
                 # Track performance
-                poll_duration = (datetime.now() - start_time).total_seconds() * 1000
+                poll_duration = (time.monotonic() - start_time) * 1000.0
                 self.last_poll_duration_ms = poll_duration
                 self.poll_count += 1
 
                 # Update performance metrics
-                self.system_status.metrics.performance.update_polling_metrics(
-                    poll_duration_ms=poll_duration,
-                    sensor_count=len(self.pulse_detectors)
-                )
+                self.system_status.metrics.update_performance(poll_time_ms=poll_duration)
+                self._consecutive_errors = 0
 
                 # Sleep until next poll
-                sleep_ms = max(1, self.polling_interval_ms - poll_duration)
-                await asyncio.sleep(sleep_ms / 1000.0)
+                next_deadline += self.polling_interval_ms / 1000.0
+                sleep_s = next_deadline - loop.time()
+                if sleep_s > 0:
+                    await asyncio.sleep(sleep_s)
+                else:
+                    # Overran the interval: restart the schedule instead of
+                    # polling back to back to catch up, but still yield
+                    next_deadline = loop.time()
+                    await asyncio.sleep(0)
 
             except asyncio.CancelledError:
                 break
@@ -254,171 +424,252 @@ class SensorMonitor:
                     f"Sensor monitoring error: {str(e)}"
                 ))
 
-                # Back off on errors
-                await asyncio.sleep(1.0)
+                # Back off exponentially while errors persist
+                backoff = _backoff_delay(self._consecutive_errors)
+                self._consecutive_errors += 1
+                await asyncio.sleep(backoff)
+                next_deadline = loop.time()
 
         logger.info("Sensor monitor loop stopped")
 
     async def _poll_sensors(self) -> None:
-        """Poll all enabled sensors for readings."""
-        if not self.hardware_connection or not self.hardware_connection.is_connected:
-            # Try to reconnect
+        """Poll all sensors for readings."""
+        connection = self._connection_manager
+        if connection is None or not connection.is_connected():
+            # Wait for, or retry, the reconnection
             await self._check_hardware_connection()
             return
 
-        # Read GPIO states
-        gpio_states = await self._read_gpio_states()
+        # Read GPIO states as one packed bitmap (bit N = GPN)
+        gpio_bits = await self._read_gpio_bits()
+        if gpio_bits is None:
+            return
+        now_ns = time.monotonic_ns()
+
+        if not self.system_status.health.hardware_connected:
+            # Reconnected in the background since the last poll
+            self.system_status.update_hardware_status(True)
+
+        # Count movement pulses for all sensors at once
+        self.pulse_detector.update_bits(gpio_bits, now_ns)
 
         # Process readings for each sensor
-        for sensor_id, detector in self.pulse_detectors.items():
+        readings: List[SensorReading] = []
+        session_metrics = self.system_status.metrics
+        for sensor_id, channel in self._channels.items():
             try:
-                # Update pulse detector with GPIO states
-                reading = await self._process_sensor_reading(sensor_id, detector, gpio_states)
+                reading = self._process_sensor_reading(channel, gpio_bits, now_ns)
 
-                if reading:
-                    # Update system status
-                    self.system_status.update_sensor_reading(reading)
+                # Update system status; the reading is published to the
+                # callbacks even if the bookkeeping below fails
+                self.system_status.update_sensor_reading(reading)
+                readings.append(reading)
 
-                    # Update session metrics
-                    await self._update_session_metrics(reading)
+                # Check for alerts against the metrics as they were
+                # before this reading
+                sensor_metrics = session_metrics.get_sensor_metrics(sensor_id)
+                runout_started = self._check_sensor_alerts(reading, sensor_metrics)
 
-                    # Check for alerts
-                    await self._check_sensor_alerts(reading)
-
-                    # Notify callbacks
-                    await self._notify_callbacks(reading)
+                # Update session metrics
+                self._update_session_metrics(session_metrics, channel, reading, now_ns, runout_started)
 
             except Exception as e:
+                # Single handler for the per-sensor hot path
                 logger.error("Error processing sensor reading",
                            sensor_id=sensor_id,
                            error=str(e))
 
-    async def _read_gpio_states(self) -> Dict[str, bool]:
-        """Read current GPIO states from hardware."""
-        try:
-            def read_gpio():
-                return self.hardware_connection.read_gpio_states()
+        # Notify callbacks once for the whole poll
+        if readings:
+            await self._notify_callbacks_batch(readings)
 
-            loop = asyncio.get_event_loop()
-            gpio_states = await loop.run_in_executor(None, read_gpio)
-            return gpio_states
+    async def _read_gpio_bits(self) -> Optional[int]:
+        """
+        Read current GPIO states from hardware as a packed bitmap.
 
-        except Exception as e:
-            logger.error("Failed to read GPIO states", error=str(e))
-            return {}
-
-    async def _process_sensor_reading(self,
-                                    sensor_id: int,
-                                    detector: PulseDetector,
-                                    gpio_states: Dict[str, bool]) -> Optional[SensorReading]:
-        """Process GPIO states into sensor reading."""
+        Returns:
+            Optional[int]: Pin states packed into bits 0-3, or None if the
+            read failed and the ConnectionManager was told the link is lost
+        """
         try:
-            # Determine GPIO pins for this sensor
-            movement_pin = f"GP{(sensor_id - 1) * 2}"      # GP0 for sensor 1, GP2 for sensor 2
-            runout_pin = f"GP{(sensor_id - 1) * 2 + 1}"    # GP1 for sensor 1, GP3 for sensor 2
-
-            # Get pin states
-            movement_state = gpio_states.get(movement_pin, False)
-            runout_state = gpio_states.get(runout_pin, False)
-
-            # Update detector
-            reading = detector.process_gpio_states(movement_state, not runout_state)  # Invert runout logic
+            return await self._loop.run_in_executor(
+                self._hw_executor, self.hardware_connection.read_gpio_bits
+            )
 
-            if reading:
-                # Add GPIO state for debugging
-                reading.raw_gpio_state = {
-                    movement_pin: movement_state,
-                    runout_pin: runout_state
-                }
-
-            return reading
-
-        except Exception as e:
-            logger.error("Error processing sensor reading",
-                       sensor_id=sensor_id,
-                       error=str(e))
+        except (OSError, ValueError, RuntimeError) as e:
+            # USB faults only (hidapi reports closed devices as ValueError);
+            # anything else is a bug and propagates to the monitor loop
+            logger.error("Failed to read GPIO states", error=str(e))
+            self._connection_manager.connection_lost()
             return None
 
-    async def _update_session_metrics(self, reading: SensorReading) -> None:
-        """Update session metrics with new reading."""
-        try:
-            sensor_metrics = getattr(self.system_status.metrics, f"sensor{reading.sensor_id}")
-            sensor_metrics.update_from_reading(reading)
-        except Exception as e:
-            logger.error("Error updating session metrics", error=str(e))
-
-    async def _check_sensor_alerts(self, reading: SensorReading) -> None:
-        """Check for sensor-related alerts."""
-        try:
-            current_time = datetime.now()
+    def _process_sensor_reading(self,
+                              channel: _SensorChannel,
+                              gpio_bits: int,
+                              now_ns: int) -> SensorReading:
+        """Turn one sensor's share of a GPIO sample into a reading."""
+        # Runout pin is low while filament is present (inverted logic); a
+        # change is only accepted once it has held for runout_debounce_ms
+        runout_state = bool(gpio_bits & channel.runout_bit)
+        has_filament = not runout_state
+        if channel.has_filament is None or has_filament == channel.has_filament:
+            channel.has_filament = has_filament
+            channel.runout_pending_ns = 0
+        elif not channel.runout_pending_ns:
+            channel.runout_pending_ns = now_ns
+        elif now_ns - channel.runout_pending_ns >= self.runout_debounce_ms * 1_000_000:
+            channel.has_filament = has_filament
+            channel.runout_pending_ns = 0
+
+        # Moving while pulses keep arriving within movement_timeout_ms
+        stats = channel.stats
+        last_pulse_ns = stats.last_pulse_ns
+        is_moving = (last_pulse_ns is not None and
+                     now_ns - last_pulse_ns < self.movement_timeout_ms * 1_000_000)
+        pulse_count = stats.debounced_pulses
+
+        raw_gpio_state = None
+        if self._debug_gpio:
+            # Add GPIO state for debugging
+            raw_gpio_state = {
+                channel.movement_name: bool(gpio_bits & channel.movement_bit),
+                channel.runout_name: runout_state
+            }
 
-            # Check for runout condition
-            if not reading.has_filament:
-                self.system_status.add_alert(AlertEvent.create_filament_runout(
-                    sensor_id=reading.sensor_id,
-                    message=f"Filament runout detected on sensor {reading.sensor_id}"
-                ))
+        return SensorReading.from_poll(
+            sensor_id=channel.sensor_id,
+            has_filament=channel.has_filament,
+            is_moving=is_moving,
+            pulse_count=pulse_count,
+            distance_mm=pulse_count * self._mm_per_pulse,
+            raw_gpio_state=raw_gpio_state
+        )
+
+    def _update_session_metrics(self,
+                                session_metrics: SessionMetrics,
+                                channel: _SensorChannel,
+                                reading: SensorReading,
+                                now_ns: int,
+                                runout_started: bool) -> None:
+        """Add the pulses, distance and feeding time since the last poll."""
+        pulses_delta = reading.pulse_count - channel.last_pulse_count
+        feeding_time_delta = 0.0
+        if reading.is_moving and channel.last_poll_ns:
+            feeding_time_delta = (now_ns - channel.last_poll_ns) / 1e9
+        channel.last_pulse_count = reading.pulse_count
+        channel.last_poll_ns = now_ns
+
+        session_metrics.update_sensor_metrics(
+            channel.sensor_id,
+            pulses_delta=pulses_delta,
+            distance_delta_mm=pulses_delta * self._mm_per_pulse,
+            feeding_time_delta=feeding_time_delta,
+            runout_occurred=runout_started
+        )
+
+    def _check_sensor_alerts(self, reading: SensorReading, sensor_metrics: SensorMetrics) -> bool:
+        """
+        Check for sensor-related alerts on state transitions.
+
+        Returns:
+            bool: True if this reading started a runout
+        """
+        sensor_id = reading.sensor_id
+
+        # Check for runout condition (filament present -> absent)
+        had_filament = self._last_filament_state.get(sensor_id, True)
+        self._last_filament_state[sensor_id] = reading.has_filament
+        runout_started = had_filament and not reading.has_filament
+        if runout_started:
+            self.system_status.add_alert(AlertEvent.create_runout_alert(sensor_id))
+
+        # Check for movement starting after long inactivity
+        was_moving = self._last_moving_state.get(sensor_id, False)
+        self._last_moving_state[sensor_id] = reading.is_moving
+        last_activity = sensor_metrics.last_activity
+        if (reading.is_moving and not was_moving and
+            last_activity is not None and
+            datetime.now() - last_activity > _MOVEMENT_RESUMED_AFTER):
 
-            # Check for movement after long inactivity
-            sensor_metrics = getattr(self.system_status.metrics, f"sensor{reading.sensor_id}")
-            if (reading.is_moving and
-                sensor_metrics.last_movement and
-                current_time - sensor_metrics.last_movement > timedelta(minutes=10)):
-
-                self.system_status.add_alert(AlertEvent(
-                    alert_type=AlertType.SENSOR_MOVEMENT,
-                    severity=AlertSeverity.INFO,
-                    message=f"Sensor {reading.sensor_id} movement resumed after inactivity",
-                    sensor_id=reading.sensor_id
-                ))
+            self.system_status.add_alert(AlertEvent(
+                alert_type=AlertType.MOVEMENT_STARTED,
+                severity=AlertSeverity.INFO,
+                message=f"Sensor {sensor_id} movement resumed after inactivity",
+                sensor_id=sensor_id
+            ))
 
-        except Exception as e:
-            logger.error("Error checking sensor alerts", error=str(e))
+        return runout_started
 
-    async def _notify_callbacks(self, reading: SensorReading) -> None:
-        """Notify registered callbacks of sensor updates."""
+    async def _notify_callbacks_batch(self, readings: List[SensorReading]) -> None:
+        """Notify registered callbacks of the sensor updates from one poll."""
         try:
-            # Create a copy of the weak set to avoid modification during iteration
-            callbacks = list(self.update_callbacks)
-
-            for callback in callbacks:
-                try:
-                    if asyncio.iscoroutinefunction(callback):
-                        await callback(reading)
-                    else:
+            # The snapshots are immutable, so callbacks may add or remove
+            # callbacks while being notified
+            sync_snapshot = self._sync_snapshot
+            for reading in readings:
+                for ref in sync_snapshot:
+                    callback = ref()
+                    if callback is None:
+                        continue
+                    try:
                         callback(reading)
-                except Exception as e:
-                    logger.warning("Error in update callback", error=str(e))
+                    except Exception as e:
+                        logger.warning("Error in update callback", error=str(e))
+
+            # Run async callbacks concurrently so one slow callback does not
+            # hold up the others (or the next poll)
+            async_callbacks = [callback for callback in (ref() for ref in self._async_snapshot)
+                               if callback is not None]
+            if async_callbacks:
+                results = await asyncio.gather(
+                    *(callback(reading) for reading in readings for callback in async_callbacks),
+                    return_exceptions=True
+                )
+                for result in results:
+                    if isinstance(result, Exception):
+                        logger.warning("Error in update callback", error=str(result))
 
         except Exception as e:
             logger.error("Error notifying callbacks", error=str(e))
 
     async def _check_hardware_connection(self) -> None:
-        """Check and attempt to restore hardware connection."""
+        """Report connection changes and retry a connection that gave up."""
+        connection = self._connection_manager
         try:
-            if self.hardware_connection:
-                was_connected = self.hardware_connection.is_connected
+            if connection is None:
+                return
+
+            state = connection.get_state()
+            if self.system_status.health.hardware_connected and state != ConnectionState.CONNECTED:
+                self.system_status.update_hardware_status(False)
+                logger.warning("Hardware connection lost")
 
-                # Try to reconnect
-                def reconnect():
-                    return self.hardware_connection.connect()
+            # Background reconnection in progress
+            if state in _CONNECTING_STATES:
+                return
 
-                loop = asyncio.get_event_loop()
-                is_connected = await loop.run_in_executor(None, reconnect)
+            # Space out attempts while the hardware stays unavailable
+            now = self._loop.time()
+            if now < self._next_reconnect_at:
+                return
 
-                # Update status if connection state changed
-                if was_connected != is_connected:
-                    self.system_status.update_hardware_status(is_connected)
+            is_connected = await self._loop.run_in_executor(self._hw_executor, connection.connect)
 
-                    if is_connected:
-                        logger.info("Hardware connection restored")
-                    else:
-                        logger.warning("Hardware connection lost")
+            if is_connected:
+                self._reconnect_failures = 0
+                self._next_reconnect_at = 0.0
+                self.system_status.update_hardware_status(True)
+                logger.info("Hardware connection restored")
+            else:
+                self._next_reconnect_at = now + _backoff_delay(self._reconnect_failures)
+                self._reconnect_failures += 1
 
         except Exception as e:
             logger.error("Error checking hardware connection", error=str(e))
+            self._next_reconnect_at = self._loop.time() + _backoff_delay(self._reconnect_failures)
+            self._reconnect_failures += 1
             self.system_status.update_hardware_status(False)
 
 
 # Export the main component
-__all__ = ["SensorMonitor"]
\ No newline at end of file
+__all__ = ["SensorMonitor"]
@@ -99,14 +99,10 @@ class TestMCP2221Connection:
             # Configure GPIO pins for sensors
             manager.configure_gpio(sensor_config)
 
-            # Verify all pins configured as inputs
-            assert mock_device.set_pin_function.call_count == 4
-
-            # Check specific pin configurations
-            mock_device.set_pin_function.assert_any_call(gp0="GPIO_IN")
-            mock_device.set_pin_function.assert_any_call(gp1="GPIO_IN")
-            mock_device.set_pin_function.assert_any_call(gp2="GPIO_IN")
-            mock_device.set_pin_function.assert_any_call(gp3="GPIO_IN")
+            # Verify all pins configured as inputs in a single SRAM write
+            mock_device.set_pin_function.assert_called_once_with(
+                gp0="GPIO_IN", gp1="GPIO_IN", gp2="GPIO_IN", gp3="GPIO_IN"
+            )
 
     def test_gpio_input_pullup_configuration(self, mock_device, sensor_config):
         """Test GPIO input pullup resistor configuration."""
@@ -0,0 +1,213 @@
+"""Unit tests for the DataAggregator service and its sensor data windows."""
+
+import random
+import statistics
+from datetime import datetime, timedelta
+
+import pytest
+from structlog.testing import capture_logs
+
+from src.models import AlertType, SensorReading, SystemStatus
+from src.services.data_aggregator import DataAggregator, SensorDataWindow
+
+
+def make_reading(seconds_ago: float, distance_mm: float = 0.0, is_moving: bool = False,
+                 has_filament: bool = True, sensor_id: int = 1) -> SensorReading:
+    """Reading timestamped the given number of seconds before now."""
+    return SensorReading.from_poll(
+        sensor_id=sensor_id, has_filament=has_filament, is_moving=is_moving,
+        pulse_count=round(distance_mm / 2.88), distance_mm=distance_mm,
+        timestamp=datetime.now() - timedelta(seconds=seconds_ago)
+    )
+
+
+def make_history(count: int, spacing_s: float = 9.7, seed: int = 1) -> list:
+    """Random readings for sensor 1, oldest first, the newest 0.5s old."""
+    rng = random.Random(seed)
+    distance = 0.0
+    readings = []
+    for i in range(count):
+        moving = rng.random() < 0.6
+        if moving:
+            distance += rng.choice((0.0, 2.88, 5.76, 8.64))
+        readings.append(make_reading((count - 1 - i) * spacing_s + 0.5, distance, moving,
+                                     has_filament=rng.random() < 0.9))
+    return readings
+
+
+def recent(readings: list, minutes: int) -> list:
+    """Baseline list filter: readings at most minutes old."""
+    cutoff = datetime.now() - timedelta(minutes=minutes)
+    return [r for r in readings if r.timestamp >= cutoff]
+
+
+def baseline_periods(readings: list) -> list:
+    """Baseline movement period scan; an ongoing period ends at None."""
+    periods = []
+    current_start = None
+    for reading in readings:
+        if reading.is_moving and current_start is None:
+            current_start = reading.timestamp
+        elif not reading.is_moving and current_start is not None:
+            periods.append((current_start, reading.timestamp))
+            current_start = None
+    if current_start is not None:
+        periods.append((current_start, None))
+    return periods
+
+
+def baseline_speed(readings: list) -> float:
+    """Baseline mean speed between consecutive moving readings."""
+    moving = [r for r in readings if r.is_moving]
+    speeds = []
+    for prev, curr in zip(moving, moving[1:]):
+        time_diff = (curr.timestamp - prev.timestamp).total_seconds()
+        distance_diff = curr.distance_mm - prev.distance_mm
+        if time_diff > 0 and distance_diff > 0:
+            speeds.append(distance_diff / time_diff)
+    return statistics.mean(speeds) if speeds else 0.0
+
+
+class TestSensorDataWindow:
+    """Tests comparing SensorDataWindow with the list-based computations."""
+
+    @pytest.mark.parametrize("seed", [1, 2, 3])
+    def test_matches_list_based_results(self, seed):
+        """Readings, periods, speed and compute_metrics match a list scan."""
+        history = make_history(600, seed=seed)
+        window = SensorDataWindow(window_minutes=60)
+        for reading in history:
+            window.add_reading(reading)
+        kept = [r for r in history if r.timestamp >= history[-1].timestamp - timedelta(minutes=60)]
+
+        assert window.get_readings() == kept
+        for minutes in (1, 7, 30, 60):
+            expected = recent(kept, minutes)
+            assert window.get_readings(minutes) == expected
+
+            periods = window.get_movement_periods(minutes)
+            expected_periods = baseline_periods(expected)
+            assert [start for start, _ in periods] == [start for start, _ in expected_periods]
+            assert [end for _, end in periods[:-1]] == [end for _, end in expected_periods[:-1]]
+            if expected_periods and expected_periods[-1][1] is not None:
+                assert periods[-1][1] == expected_periods[-1][1]
+
+            speed = baseline_speed(expected)
+            assert window.calculate_average_speed(minutes) == pytest.approx(speed)
+
+            metrics = window.compute_metrics(minutes)
+            moving = [r for r in expected if r.is_moving]
+            assert metrics.reading_count == len(expected)
+            assert metrics.latest_reading is expected[-1]
+            assert metrics.movement_events == len(moving)
+            assert metrics.runout_events == sum(1 for r in expected if not r.has_filament)
+            assert metrics.last_movement == (moving[-1].timestamp if moving else None)
+            assert metrics.activity_periods == len(expected_periods)
+            assert metrics.average_speed_mm_s == pytest.approx(speed)
+
+    def test_empty_range(self):
+        """A range without readings yields empty results."""
+        window = SensorDataWindow(window_minutes=60)
+        window.add_reading(make_reading(120))
+
+        metrics = window.compute_metrics(1)
+
+        assert metrics.reading_count == 0
+        assert metrics.latest_reading is None
+        assert window.get_readings(1) == []
+        assert window.get_movement_periods(1) == []
+        assert window.calculate_average_speed(1) == 0.0
+
+    def test_expiry_and_compaction(self):
+        """Old readings expire and compaction keeps earlier views intact."""
+        history = make_history(400, spacing_s=31.0)
+        window = SensorDataWindow(window_minutes=60)
+        for reading in history[:150]:
+            window.add_reading(reading)
+        view = window.view()
+        before = view.readings()
+
+        for reading in history[150:]:
+            window.add_reading(reading)
+
+        kept = [r for r in history if r.timestamp >= history[-1].timestamp - timedelta(minutes=60)]
+        assert len(window) == len(kept)
+        assert window.get_readings() == kept
+        assert len(history) - len(kept) > len(kept)
+        assert len(window._ts_ns) < 2 * len(kept)
+        assert view.readings() == before
+        assert view.latest is history[149]
+
+    def test_capacity_bound(self):
+        """The window never holds more than max_readings entries."""
+        history = make_history(200, spacing_s=1.0)
+        window = SensorDataWindow(window_minutes=60, max_readings=50)
+        for reading in history:
+            window.add_reading(reading)
+            assert len(window) <= 50
+
+        assert window.get_readings() == history[-50:]
+        metrics = window.compute_metrics(60)
+        assert metrics.movement_events == sum(1 for r in history[-50:] if r.is_moving)
+        assert metrics.activity_periods == len(baseline_periods(history[-50:]))
+        assert metrics.average_speed_mm_s == pytest.approx(baseline_speed(history[-50:]))
+
+
+class TestDataAggregator:
+    """Tests for DataAggregator metrics and alerts."""
+
+    def test_session_metrics_from_windows(self):
+        """Window statistics land on the sensor metrics without errors."""
+        status = SystemStatus.get_instance()
+        aggregator = DataAggregator(status)
+        # Idle, then moving at 10 mm/s for 3s, then idle again
+        for seconds_ago, distance, moving in ((10, 0.0, False), (8, 0.0, True), (7, 10.0, True),
+                                              (6, 20.0, True), (5, 30.0, True), (4, 30.0, False)):
+            aggregator.add_sensor_reading(make_reading(seconds_ago, distance, moving))
+        status.metrics.sensor1.total_pulses = 7
+
+        with capture_logs() as logs:
+            metrics = aggregator.calculate_session_metrics()
+
+        assert not [log for log in logs if log["log_level"] == "error"]
+        sensor = metrics.sensor1
+        assert sensor.movement_events == 4
+        assert sensor.activity_periods == 1
+        assert sensor.average_speed_mm_s == pytest.approx(10.0, rel=1e-3)
+        assert sensor.last_movement == aggregator.sensor_windows[1].get_readings()[4].timestamp
+        assert sensor.usage_rate_mm_h == pytest.approx(30.0 * 3600 / 6, rel=1e-3)
+        # Totals are kept by the sensor monitor
+        assert sensor.total_pulses == 7
+        assert sensor.runout_events == 0
+        assert metrics.sensor2.movement_events == 0
+
+    def test_aggregation_stats(self):
+        """Stats report the window sizes and estimated memory."""
+        aggregator = DataAggregator(SystemStatus.get_instance())
+        aggregator.add_sensor_reading(make_reading(1))
+        aggregator.add_sensor_reading(make_reading(1, sensor_id=2))
+
+        stats = aggregator.get_aggregation_stats()
+
+        assert stats["sensor_windows"] == {1: 1, 2: 1}
+        assert stats["estimated_memory_mb"] == pytest.approx(10.002)
+
+    @pytest.mark.asyncio
+    async def test_metric_alerts(self):
+        """High speed, long inactivity and the distance milestone raise alerts."""
+        status = SystemStatus.get_instance()
+        aggregator = DataAggregator(status)
+        aggregator.add_sensor_reading(make_reading(2, 0.0, True))
+        aggregator.add_sensor_reading(make_reading(1, 100.0, True))
+        status.update_sensor_reading(make_reading(0, sensor_id=2))
+        aggregator.calculate_session_metrics()
+        status.metrics.sensor2.last_movement = datetime.now() - timedelta(hours=3)
+        status.metrics.sensor1.total_distance_mm = 1_000_001_000.0
+
+        await aggregator._check_metric_alerts()
+        await aggregator._check_metric_alerts()
+
+        alerts = [(a.alert_type, a.sensor_id) for a in status.recent_alerts]
+        assert alerts.count((AlertType.HIGH_FEED_RATE, 1)) == 1
+        assert alerts.count((AlertType.MOVEMENT_STOPPED, 2)) == 2
+        assert alerts.count((AlertType.DISTANCE_MILESTONE, None)) == 1
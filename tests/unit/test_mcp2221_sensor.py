@@ -0,0 +1,421 @@
+"""Unit tests for the MCP2221 sensor library using a mocked USB device."""
+
+import threading
+import time
+from datetime import datetime, timedelta
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from src.lib.mcp2221_sensor import MCP2221Manager, GPIOState, _gp_bits_from_report
+from src.lib.mcp2221_sensor.connection import ConnectionAttempt, ConnectionManager, ConnectionState
+from src.lib.mcp2221_sensor.pulse_detector import PulseDetector, PulseStats
+
+
+SENSOR_CONFIG = {
+    "sensor1": {"movement_pin": 0, "runout_pin": 1},
+    "sensor2": {"movement_pin": 2, "runout_pin": 3}
+}
+
+
+@pytest.fixture
+def mock_device():
+    """Mock EasyMCP2221 device."""
+    device = MagicMock()
+    device.VID = MCP2221Manager.VID
+    device.PID = MCP2221Manager.PID
+    device.GPIO_read.return_value = (1, 0, 1, 1)
+    return device
+
+
+@pytest.fixture
+def manager(mock_device):
+    """Manager bound to the mocked device and configured for dual sensors."""
+    manager = MCP2221Manager()
+    manager._device = mock_device
+    manager._connected = True
+    manager.configure_gpio(SENSOR_CONFIG)
+    return manager
+
+
+class TestMCP2221Manager:
+    """Tests for MCP2221Manager GPIO access."""
+
+    def test_detect_device_reads_identifiers_once(self, mock_device):
+        """VID/PID are read once at detection and reused by device_info."""
+        manager = MCP2221Manager()
+
+        module_globals = MCP2221Manager.detect_device.__globals__
+        with patch.dict(module_globals, {"Device": MagicMock(return_value=mock_device)}):
+            assert manager.detect_device()
+
+        mock_device.VID = 0
+        assert manager.device_info["VID"] == MCP2221Manager.VID
+        assert manager.device_info["PID"] == MCP2221Manager.PID
+
+    def test_configure_gpio_single_pin_function_write(self, manager, mock_device):
+        """All four pins are configured with one set_pin_function() call."""
+        mock_device.set_pin_function.assert_called_once_with(
+            gp0="GPIO_IN", gp1="GPIO_IN", gp2="GPIO_IN", gp3="GPIO_IN"
+        )
+
+    def test_config_properties_are_read_only_views(self, manager):
+        """Config accessors return the same immutable view on every read."""
+        manager.configure_interrupts({"GP0": "falling_edge"})
+
+        assert manager.interrupt_config is manager.interrupt_config
+        assert manager.gpio_config["sensor1"]["movement_pin"] == 0
+        with pytest.raises(TypeError):
+            manager.interrupt_config["GP0"] = "rising_edge"
+
+    def test_configure_gpio_rejects_invalid_pin(self, manager):
+        """An out-of-range pin is reported against its sensor."""
+        config = {"sensor1": {"movement_pin": 0, "runout_pin": 4}}
+
+        with pytest.raises(ValueError, match="Invalid GPIO pin 4 for sensor1 runout"):
+            manager.configure_gpio(config)
+
+    def test_configure_gpio_rejects_pin_conflict(self, manager):
+        """A pin shared between sensors is rejected."""
+        config = {
+            "sensor1": {"movement_pin": 0, "runout_pin": 1},
+            "sensor2": {"movement_pin": 1, "runout_pin": 3}
+        }
+
+        with pytest.raises(ValueError, match="GPIO pin 1 already in use"):
+            manager.configure_gpio(config)
+
+    def test_read_gpio_states_single_report(self, manager, mock_device):
+        """All four pins are read with one GPIO_read() call."""
+        mock_device.GPIO_read.reset_mock()
+
+        states = manager.read_gpio_states()
+
+        assert states == {"GP0": 1, "GP1": 0, "GP2": 1, "GP3": 1}
+        mock_device.GPIO_read.assert_called_once_with()
+
+    def test_read_gpio_states_reuses_result_dict(self, manager, mock_device):
+        """The result dict is updated in place; copies keep earlier samples."""
+        first = manager.read_gpio_states()
+        kept = first.copy()
+        mock_device.GPIO_read.return_value = (0, 0, 0, 0)
+
+        second = manager.read_gpio_states()
+
+        assert second is first
+        assert second == {"GP0": 0, "GP1": 0, "GP2": 0, "GP3": 0}
+        assert kept == {"GP0": 1, "GP1": 0, "GP2": 1, "GP3": 1}
+
+    def test_read_gpio_states_usb_error_marks_disconnected(self, manager, mock_device):
+        """A USB I/O error is re-raised and clears the connected flag."""
+        mock_device.GPIO_read.side_effect = OSError("read error")
+
+        with pytest.raises(OSError):
+            manager.read_gpio_states()
+
+        assert manager.is_connected() is False
+
+    def test_read_gpio_bits_packs_pins(self, manager):
+        """Bit N of the packed read holds GPN."""
+        assert manager.read_gpio_bits() == 0b1101
+
+    def test_gp_bits_from_report_decodes_pin_values(self):
+        """GET_GPIO_VALUES pin bytes 2/4/6/8 map to bits 0-3."""
+        report = [0x51, 0x00, 1, 1, 0, 1, 1, 1, 1, 1] + [0] * 54
+
+        assert _gp_bits_from_report(report) == 0b1101
+
+    def test_read_gpio_bits_without_easymcp2221_uses_gpio_read(self, manager, mock_device):
+        """Non-EasyMCP2221 devices keep the GPIO_read() path."""
+        assert manager._read_bits_fn is None
+        assert manager.read_gpio_bits() == 0b1101
+        mock_device.send_cmd.assert_not_called()
+
+    def test_read_gpio_state_object_defers_timestamp(self, manager):
+        """State objects carry a monotonic time and convert it on demand."""
+        state = manager.read_gpio_state_object()
+
+        assert isinstance(state, GPIOState)
+        assert (state.GP0, state.GP1, state.GP2, state.GP3) == (True, False, True, True)
+        assert state.timestamp is None
+        assert "timestamp" in state.to_dict()
+
+    def test_gpio_state_is_slotted_and_frozen(self, manager):
+        """Samples carry no per-instance __dict__ and cannot be mutated."""
+        state = manager.read_gpio_state_object()
+
+        assert not hasattr(state, "__dict__")
+        with pytest.raises(AttributeError):
+            state.GP0 = False
+
+    def test_enumerate_devices_cached_until_disconnect(self, manager):
+        """Back-to-back scans share one hid.enumerate() call."""
+        hid = MagicMock()
+        hid.enumerate.return_value = [
+            {"vendor_id": MCP2221Manager.VID, "product_id": MCP2221Manager.PID}
+        ]
+
+        with patch.dict("sys.modules", {"hid": hid}):
+            manager.disconnect()
+            first = MCP2221Manager.enumerate_devices()
+            second = MCP2221Manager.enumerate_devices()
+            assert first == second and len(first) == 1
+            assert hid.enumerate.call_count == 1
+
+            manager._device = MagicMock()
+            manager.disconnect()
+            MCP2221Manager.enumerate_devices()
+            assert hid.enumerate.call_count == 2
+
+
+class TestPulseDetector:
+    """Tests for PulseDetector edge detection."""
+
+    @pytest.fixture
+    def detector(self):
+        """Detector with GP0 and GP2 registered, debouncing disabled."""
+        detector = PulseDetector(debounce_ms=0)
+        detector.register_pin(0, initial_state=True)
+        detector.register_pin(2, initial_state=True)
+        return detector
+
+    def test_update_bits_detects_falling_edge(self, detector):
+        """Clearing a pin bit produces a pulse on that pin only."""
+        events = detector.update_bits(0b1110)
+
+        assert events[0] is not None and events[0].is_falling_edge
+        assert 2 not in events
+        assert detector.get_pulse_count(0) == 1
+        assert detector.get_pulse_count(2) == 0
+
+    def test_callbacks_run_outside_detector_lock(self, detector):
+        """Pulse callbacks can be swapped and are invoked without the lock held."""
+        seen = []
+
+        def callback(event):
+            seen.append((event.pin, detector._lock._is_owned()))
+
+        detector.register_pulse_callback(0, lambda event: None)
+        detector.register_pulse_callback(0, callback)
+        detector.update_bits(0b1110)
+
+        assert seen == [(0, False)]
+
+    def test_update_bits_batch_debounces_across_samples(self):
+        """A batch yields the edges that survive debouncing, in sample order."""
+        detector = PulseDetector(debounce_ms=2)
+        detector.register_pin(0, initial_state=True)
+        t0 = time.monotonic_ns() + 10_000_000
+        ms = 1_000_000
+
+        events = detector.update_bits_batch([
+            (0b0, t0),            # falling edge
+            (0b1, t0 + ms),       # bounce, ignored
+            (0b1, t0 + 2 * ms),   # no change
+            (0b0, t0 + 5 * ms),   # falling edge
+        ])
+
+        assert [(e.timestamp_ns - t0) // ms for e in events] == [0, 5]
+        assert detector.get_pulse_count(0) == 2
+
+    def test_update_bits_unchanged_sample_is_noop(self, detector):
+        """Repeating the current state or touching unregistered pins yields no events."""
+        assert detector.update_bits(0b1111) == {}
+        assert detector.update_bits(0b0101) == {}
+        assert detector.update_pin_mask(0b0101, time.monotonic_ns()) == {}
+
+    def test_update_all_pins_adapter(self, detector):
+        """update_all_pins reports only changed pins; missing pins keep their state."""
+        assert detector.update_all_pins({"GP0": 1, "GP1": 0, "GP2": 1, "GP3": 0}) == {}
+
+        events = detector.update_all_pins({"GP2": 0})
+
+        assert list(events) == [2]
+        assert events[2] is not None and events[2].is_falling_edge
+        assert detector.get_pin_state(0) is True
+
+    def test_pulse_rate_tracks_interval_average(self):
+        """Steady 10 ms pulses give 100 Hz; the average then moves 1/8 per pulse."""
+        stats = PulseStats(pin=0)
+        for i in range(5):
+            stats.add_pulse(i * 10_000_000)
+
+        assert stats.pulse_rate_hz == pytest.approx(100.0)
+
+        stats.add_pulse(4 * 10_000_000 + 90_000_000)
+        assert stats.interval_ewma_ns == pytest.approx(20_000_000)
+        assert stats.debounced_pulses == 6
+
+    def test_pulse_event_times_are_monotonic(self, detector):
+        """Events carry monotonic ns and convert to wall-clock on request."""
+        before = datetime.now()
+        event = detector.update_pin_state(0, False)
+        after = datetime.now()
+
+        assert isinstance(event.timestamp_ns, int)
+        assert not hasattr(event, "__dict__")
+        assert before - timedelta(seconds=1) <= event.wall_clock() <= after + timedelta(seconds=1)
+        stats = detector.get_statistics(0)
+        assert stats.last_pulse_ns == event.timestamp_ns
+        assert stats.time_since_last_pulse >= timedelta(0)
+
+
+class TestConnectionManager:
+    """Tests for ConnectionManager state signalling."""
+
+    def test_connection_lost_reconnects_in_background(self):
+        """A reported loss clears the connected event until reconnection succeeds."""
+        connector = MagicMock(return_value=True)
+        conn = ConnectionManager(connector, health_checker=lambda: True)
+
+        assert conn.connect()
+        assert conn.wait_for_connection(timeout=0)
+
+        conn.connection_lost()
+
+        assert conn.wait_for_connection(timeout=2.0)
+        assert conn.get_state() == ConnectionState.CONNECTED
+        assert connector.call_count == 2
+        conn.disconnect()
+        assert not conn.wait_for_connection(timeout=0)
+
+    def test_context_manager_closes_monitor(self):
+        """Leaving the with block stops the monitor thread and disconnects."""
+        with ConnectionManager(MagicMock(return_value=True), health_checker=lambda: True) as conn:
+            conn.add_consumer()
+            assert conn.connect()
+            monitor = conn._monitor_thread
+            assert monitor is not None and monitor.is_alive()
+
+        assert conn.get_state() == ConnectionState.DISCONNECTED
+        assert not monitor.is_alive()
+
+    def test_disconnect_cancels_pending_retry(self):
+        """A retry backoff wait does not hold the lock and is cut short by disconnect()."""
+        conn = ConnectionManager(
+            MagicMock(return_value=False),
+            health_checker=lambda: True,
+            initial_retry_delay=30.0,
+            max_retry_attempts=3
+        )
+        conn._cancel_retry.wait = MagicMock(side_effect=conn._cancel_retry.wait)
+        result = []
+        worker = threading.Thread(target=lambda: result.append(conn.connect()))
+        worker.start()
+
+        while not conn._cancel_retry.wait.called:
+            time.sleep(0.01)
+        assert conn.get_stats().failed_attempts >= 1
+        conn.disconnect()
+        worker.join(timeout=2.0)
+
+        assert not worker.is_alive()
+        assert result == [False]
+        assert conn.get_state() == ConnectionState.DISCONNECTED
+
+    def test_disconnect_during_reconnect_wins(self):
+        """A disconnect() while reconnect() stops the monitor is not undone."""
+        connector = MagicMock(return_value=True)
+        conn = ConnectionManager(connector, health_checker=lambda: True)
+        assert conn.connect()
+        conn._stop_monitoring_thread = MagicMock(side_effect=conn.disconnect)
+
+        assert not conn.reconnect()
+        assert conn.get_state() == ConnectionState.DISCONNECTED
+        assert connector.call_count == 1
+
+    def test_disconnect_before_background_reconnect_wins(self):
+        """A disconnect() after a reported loss cancels the pending reconnect."""
+        connector = MagicMock(return_value=True)
+        conn = ConnectionManager(connector, health_checker=lambda: True)
+        assert conn.connect()
+
+        with conn._connect_lock:
+            conn.connection_lost()
+            conn.disconnect()
+        deadline = time.monotonic() + 2.0
+        while conn._reconnecting.is_set() and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert not conn._reconnecting.is_set()
+        assert conn.get_state() == ConnectionState.DISCONNECTED
+        assert connector.call_count == 1
+
+    def test_health_checks_only_run_with_consumers(self):
+        """The monitor does not poll the device until a consumer registers."""
+        health_checker = MagicMock(return_value=True)
+        conn = ConnectionManager(lambda: True, health_checker)
+
+        module_globals = ConnectionManager._monitor_connection.__globals__
+        with patch.dict(module_globals, {"HEALTH_CHECK_ACTIVE_S": 0.01}):
+            assert conn.connect()
+            time.sleep(0.1)
+            assert health_checker.call_count == 0
+
+            conn.add_consumer()
+            conn.notify_activity()
+            time.sleep(0.1)
+            assert health_checker.call_count > 0
+
+        conn.disconnect()
+
+    def test_get_stats_cached_until_next_attempt(self):
+        """Repeated get_stats() calls share a snapshot until stats change."""
+        conn = ConnectionManager(MagicMock(return_value=True), health_checker=lambda: True)
+        conn.connect()
+
+        first = conn.get_stats()
+        first_uptime = first.current_uptime
+        again = conn.get_stats()
+        assert again is not first
+        assert again.recent_attempts is first.recent_attempts
+        assert first_uptime is not None
+        assert first.current_uptime is first_uptime
+
+        conn.disconnect()
+        second = conn.get_stats()
+        assert second.recent_attempts is not first.recent_attempts
+        assert second.current_uptime is None
+        assert first.current_uptime is first_uptime
+
+    def test_recent_attempts_window(self):
+        """Only the last 20 attempts are kept and averaged."""
+        conn = ConnectionManager(lambda: True, health_checker=lambda: True)
+        for i in range(25):
+            conn._record_attempt(ConnectionAttempt(i + 1, datetime.now(), True, duration_ms=float(i)))
+
+        stats = conn.get_stats()
+        assert [a.attempt_number for a in stats.recent_attempts] == list(range(6, 26))
+        assert stats.average_connection_time_ms == pytest.approx(sum(range(5, 25)) / 20)
+
+    def test_monitor_thread_started_only_when_observed(self):
+        """No monitor thread runs until a consumer or callback is registered."""
+        conn = ConnectionManager(lambda: True, health_checker=lambda: True)
+        conn.connect()
+
+        assert conn._monitor_thread is None
+
+        conn.register_state_callback(lambda state: None)
+        assert conn._monitor_thread is not None and conn._monitor_thread.is_alive()
+
+        conn.disconnect()
+
+    def test_connection_lost_coalesces_reconnects(self):
+        """Repeated loss reports while reconnecting start a single reconnect."""
+        release = threading.Event()
+        calls = []
+
+        def connector():
+            calls.append(1)
+            return len(calls) == 1 or release.wait(2.0)
+
+        conn = ConnectionManager(connector, health_checker=lambda: True)
+        conn.connect()
+
+        for _ in range(5):
+            conn.connection_lost()
+        release.set()
+
+        assert conn.wait_for_connection(timeout=2.0)
+        assert len(calls) == 2
+        conn.disconnect()
@@ -0,0 +1,321 @@
+"""Unit tests for the SensorMonitor service using a mocked USB device."""
+
+import asyncio
+import gc
+import itertools
+from datetime import datetime, timedelta
+
+import pytest
+from unittest.mock import MagicMock
+
+from src.lib.mcp2221_sensor import MCP2221Manager
+from src.models import AlertType, SensorConfiguration, SensorReading, SystemStatus
+from src.models.session_metrics import SensorMetrics
+from src.services.sensor_monitor import SensorMonitor, _backoff_delay
+
+
+# GPIO_read() values (GP0-GP3) with filament present on both sensors and the
+# sensor 2 movement pin idle high; only the sensor 1 movement pin toggles
+IDLE = (1, 0, 1, 0)
+PULSE_LOW = (0, 0, 1, 0)
+
+
+def make_configuration() -> SensorConfiguration:
+    """Fastest polling and shortest debounce the configuration allows."""
+    return SensorConfiguration(
+        calibration={"mm_per_pulse": 2.88, "debounce_ms": 1, "runout_threshold_ms": 100},
+        polling={"polling_interval_ms": 10}
+    )
+
+
+@pytest.fixture
+def mock_device():
+    """Mock EasyMCP2221 device reading idle pins."""
+    device = MagicMock()
+    device.VID = MCP2221Manager.VID
+    device.PID = MCP2221Manager.PID
+    device.GPIO_read.return_value = IDLE
+    return device
+
+
+@pytest.fixture
+def manager(mock_device):
+    """Manager bound to the mocked device."""
+    manager = MCP2221Manager()
+    manager._device = mock_device
+    manager._connected = True
+    return manager
+
+
+def make_reading(has_filament: bool = True, is_moving: bool = False) -> SensorReading:
+    """Reading for sensor 1 with the given state."""
+    return SensorReading.from_poll(
+        sensor_id=1, has_filament=has_filament, is_moving=is_moving,
+        pulse_count=0, distance_mm=0.0
+    )
+
+
+async def wait_for(condition, timeout: float = 2.0) -> None:
+    """Poll a condition on the event loop until it holds."""
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        assert asyncio.get_running_loop().time() < deadline, "condition not reached"
+        await asyncio.sleep(0.01)
+
+
+class TestBackoffDelay:
+    """Tests for the monitor's error backoff."""
+
+    def test_doubles_per_failure(self):
+        """The delay doubles from 0.5s, plus at most 0.25s of jitter."""
+        for failures, base in ((0, 0.5), (1, 1.0), (3, 4.0)):
+            delay = _backoff_delay(failures)
+            assert base <= delay <= base + 0.25
+
+    def test_capped(self):
+        """The delay never exceeds the 30s cap plus jitter."""
+        assert 30.0 <= _backoff_delay(20) <= 30.25
+
+
+class TestSensorAlerts:
+    """Tests for transition-only sensor alerts."""
+
+    def test_runout_alert_once_per_runout(self):
+        """A sustained runout raises one alert; refilling re-arms it."""
+        status = SystemStatus()
+        monitor = SensorMonitor(status)
+        metrics = SensorMetrics(sensor_id=1)
+
+        started = [monitor._check_sensor_alerts(make_reading(has_filament=False), metrics)
+                   for _ in range(5)]
+        monitor._check_sensor_alerts(make_reading(has_filament=True), metrics)
+        monitor._check_sensor_alerts(make_reading(has_filament=False), metrics)
+
+        runouts = [a for a in status.recent_alerts if a.alert_type == AlertType.RUNOUT_DETECTED]
+        assert started == [True, False, False, False, False]
+        assert len(runouts) == 2
+        assert runouts[0].sensor_id == 1
+
+    def test_movement_resumed_alert_on_start_only(self):
+        """Movement after a long idle spell raises one alert when it starts."""
+        status = SystemStatus()
+        monitor = SensorMonitor(status)
+        metrics = SensorMetrics(sensor_id=1, last_activity=datetime.now() - timedelta(minutes=11))
+
+        for _ in range(3):
+            monitor._check_sensor_alerts(make_reading(is_moving=True), metrics)
+
+        resumed = [a for a in status.recent_alerts if a.alert_type == AlertType.MOVEMENT_STARTED]
+        assert len(resumed) == 1
+
+    def test_no_movement_alert_after_recent_activity(self):
+        """Movement shortly after the last activity raises nothing."""
+        status = SystemStatus()
+        monitor = SensorMonitor(status)
+        metrics = SensorMetrics(sensor_id=1, last_activity=datetime.now())
+
+        monitor._check_sensor_alerts(make_reading(is_moving=True), metrics)
+
+        assert not any(a.alert_type == AlertType.MOVEMENT_STARTED for a in status.recent_alerts)
+
+
+class TestUpdateCallbacks:
+    """Tests for update callback registration."""
+
+    @pytest.mark.asyncio
+    async def test_bound_methods_are_notified(self):
+        """Bound methods stay registered while their instance is alive."""
+        class Listener:
+            def __init__(self):
+                self.readings = []
+
+            def on_update(self, reading):
+                self.readings.append(reading)
+
+            async def on_update_async(self, reading):
+                self.readings.append(reading)
+
+        monitor = SensorMonitor(SystemStatus())
+        listener = Listener()
+        monitor.add_update_callback(listener.on_update)
+        monitor.add_update_callback(listener.on_update_async)
+        monitor.add_update_callback(listener.on_update)
+        reading = make_reading()
+
+        await monitor._notify_callbacks_batch([reading])
+        assert listener.readings == [reading, reading]
+
+        monitor.remove_update_callback(listener.on_update)
+        await monitor._notify_callbacks_batch([reading])
+        assert listener.readings == [reading, reading, reading]
+
+    @pytest.mark.asyncio
+    async def test_dead_callbacks_are_dropped(self):
+        """Callbacks are held weakly and dropped once collected."""
+        class Listener:
+            def on_update(self, reading):
+                pass
+
+        monitor = SensorMonitor(SystemStatus())
+        listener = Listener()
+        monitor.add_update_callback(listener.on_update)
+        del listener
+        gc.collect()
+
+        await monitor._notify_callbacks_batch([make_reading()])
+        monitor.add_update_callback(print)
+        assert len(monitor._sync_snapshot) == 1
+
+
+class TestMonitorLoop:
+    """Tests for the monitor loop scheduling."""
+
+    @pytest.mark.asyncio
+    async def test_polls_on_fixed_deadlines(self):
+        """Time spent polling does not push later polls back."""
+        monitor = SensorMonitor(SystemStatus())
+        monitor.polling_interval_ms = 20
+        monitor._loop = asyncio.get_running_loop()
+        monitor.is_running = True
+        starts = []
+
+        async def slow_poll():
+            starts.append(monitor._loop.time())
+            await asyncio.sleep(0.01)
+            if len(starts) == 11:
+                monitor.is_running = False
+
+        monitor._poll_sensors = slow_poll
+        await monitor._monitor_loop()
+
+        # Sleeping a full interval after each poll would take 10 * 30ms
+        assert starts[-1] - starts[0] == pytest.approx(0.2, abs=0.05)
+        assert monitor.poll_count == 11
+
+
+class TestSensorMonitor:
+    """Tests for SensorMonitor against MCP2221Manager and PulseDetector."""
+
+    @pytest.mark.asyncio
+    async def test_polls_pulses_into_readings(self, manager, mock_device):
+        """Movement pin pulses become readings, distance and session metrics."""
+        # Idle first: an edge within debounce_ms of pin registration is a bounce
+        script = itertools.chain([IDLE, IDLE], [PULSE_LOW, IDLE] * 3, itertools.repeat(IDLE))
+        mock_device.GPIO_read.side_effect = lambda: next(script)
+
+        status = SystemStatus()
+        monitor = SensorMonitor(status, manager)
+        received = []
+
+        def on_update(reading):
+            received.append(reading)
+
+        monitor.add_update_callback(on_update)
+        await monitor.start_monitoring(make_configuration())
+        try:
+            await wait_for(lambda: mock_device.GPIO_read.call_count >= 12)
+        finally:
+            await monitor.stop_monitoring()
+
+        reading = status.get_sensor_reading(1)
+        assert reading.pulse_count == 3
+        assert reading.distance_mm == pytest.approx(8.64)
+        assert reading.has_filament is True
+        assert status.get_sensor_reading(2).pulse_count == 0
+        assert status.metrics.sensor1.total_pulses == 3
+        assert status.metrics.sensor1.total_distance_mm == pytest.approx(8.64)
+        assert {r.sensor_id for r in received} == {1, 2}
+        assert status.health.hardware_connected is True
+
+    @pytest.mark.asyncio
+    async def test_runout_after_debounce(self, manager, mock_device):
+        """A runout pin held high past the threshold raises a single alert."""
+        script = itertools.chain([IDLE] * 3, itertools.repeat((1, 1, 1, 0)))
+        mock_device.GPIO_read.side_effect = lambda: next(script)
+
+        status = SystemStatus()
+        monitor = SensorMonitor(status, manager)
+        await monitor.start_monitoring(make_configuration())
+        try:
+            await wait_for(lambda: status.get_sensor_reading(1) is not None)
+            assert status.get_sensor_reading(1).has_filament is True
+
+            await wait_for(lambda: not status.get_sensor_reading(1).has_filament)
+            await asyncio.sleep(0.05)
+        finally:
+            await monitor.stop_monitoring()
+
+        runouts = [a for a in status.recent_alerts if a.alert_type == AlertType.RUNOUT_DETECTED]
+        assert [a.sensor_id for a in runouts] == [1]
+        assert status.metrics.sensor1.runout_events == 1
+        assert status.get_sensor_reading(2).has_filament is True
+
+    @pytest.mark.asyncio
+    async def test_polls_past_ten_meters(self, manager, mock_device):
+        """Cumulative distance beyond 10m still produces readings and alerts."""
+        samples = {"script": itertools.repeat(IDLE)}
+        mock_device.GPIO_read.side_effect = lambda: next(samples["script"])
+
+        status = SystemStatus()
+        monitor = SensorMonitor(status, manager)
+        await monitor.start_monitoring(make_configuration())
+        try:
+            await wait_for(lambda: status.get_sensor_reading(1) is not None)
+            # As if about 10m of filament had already been fed
+            monitor._channels[1].stats.debounced_pulses = 3500
+            samples["script"] = itertools.chain([PULSE_LOW, IDLE] * 2,
+                                                itertools.repeat((1, 1, 1, 0)))
+
+            await wait_for(lambda: not status.get_sensor_reading(1).has_filament)
+        finally:
+            await monitor.stop_monitoring()
+
+        reading = status.get_sensor_reading(1)
+        assert reading.pulse_count == 3502
+        assert reading.distance_mm == pytest.approx(3502 * 2.88)
+        assert status.metrics.sensor1.total_distance_mm == pytest.approx(3502 * 2.88)
+        assert status.metrics.sensor1.runout_events == 1
+        assert [a.sensor_id for a in status.recent_alerts
+                if a.alert_type == AlertType.RUNOUT_DETECTED] == [1]
+
+    @pytest.mark.asyncio
+    async def test_configures_pins_from_configuration(self, manager, mock_device):
+        """The configured pin mapping is applied to the hardware."""
+        monitor = SensorMonitor(SystemStatus(), manager)
+
+        await monitor.start_monitoring(make_configuration())
+        await monitor.stop_monitoring()
+
+        assert manager.gpio_config == {
+            "sensor1": {"movement_pin": 0, "runout_pin": 1},
+            "sensor2": {"movement_pin": 2, "runout_pin": 3}
+        }
+
+    @pytest.mark.asyncio
+    async def test_concurrent_starts_run_once(self, manager, mock_device):
+        """Overlapping start_monitoring calls start a single monitor loop."""
+        monitor = SensorMonitor(SystemStatus(), manager)
+        configuration = make_configuration()
+
+        await asyncio.gather(monitor.start_monitoring(configuration),
+                             monitor.start_monitoring(configuration))
+        try:
+            assert monitor.is_running
+            assert mock_device.set_pin_function.call_count == 1
+        finally:
+            await asyncio.gather(monitor.stop_monitoring(), monitor.stop_monitoring())
+
+        assert not monitor.is_running
+        assert monitor._monitor_task is None
+
+    @pytest.mark.asyncio
+    async def test_start_fails_without_device(self):
+        """No device: monitoring does not start and a hardware alert is raised."""
+        status = SystemStatus()
+        monitor = SensorMonitor(status, MCP2221Manager())
+
+        await monitor.start_monitoring(make_configuration())
+
+        assert not monitor.is_running
+        assert status.health.hardware_connected is False
+        assert any(a.alert_type == AlertType.HARDWARE_ERROR for a in status.recent_alerts)
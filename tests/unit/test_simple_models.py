@@ -55,6 +55,26 @@ class TestSensorConfigurationBasic:
                 sensor2_gpio=GPIOMapping(movement_pin=0, runout_pin=2)  # Pin 0 reused
             )
 
+    def test_gpio_pin_map_follows_reassignment(self):
+        """The cached pin map is rebuilt when a sensor mapping is replaced."""
+        config = SensorConfiguration()
+        assert config.gpio_pin_map is config.gpio_pin_map
+
+        config.sensor1_gpio = GPIOMapping(movement_pin=1, runout_pin=0)
+
+        assert config.gpio_pin_map[1] == "sensor1_movement"
+        assert config.gpio_pin_map[0] == "sensor1_runout"
+        assert config.model_dump()["gpio_pin_map"] == config.gpio_pin_map
+
+    def test_gpio_mapping_is_frozen(self):
+        """Pins cannot be changed in place behind the cached pin map."""
+        config = SensorConfiguration().model_copy(deep=True)
+
+        with pytest.raises(ValueError):
+            config.sensor1_gpio.movement_pin = 3
+
+        assert config.gpio_pin_map[0] == "sensor1_movement"
+
     def test_polling_settings(self):
         """Test polling settings validation."""
         # Valid polling interval
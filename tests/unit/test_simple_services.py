@@ -46,6 +46,67 @@ class TestSensorReadingSimple:
         assert reading.pulse_count == 0
         assert reading.filament_status == "runout"
 
+    def test_sensor_reading_dump_excludes_age(self):
+        """Serialized readings keep the status but not the time-dependent age."""
+        reading = SensorReading(
+            sensor_id=1,
+            has_filament=True,
+            is_moving=False,
+            distance_mm=0.0,
+            pulse_count=0
+        )
+
+        data = reading.model_dump()
+        assert data["filament_status"] == "present"
+        assert "age_seconds" not in data
+        assert reading.age_seconds >= 0.0
+
+    def test_sensor_reading_is_frozen(self):
+        """Readings cannot be mutated; changes go through model_copy."""
+        reading = SensorReading(
+            sensor_id=1,
+            has_filament=True,
+            is_moving=True,
+            distance_mm=1.0,
+            pulse_count=1
+        )
+
+        with pytest.raises(ValueError):
+            reading.pulse_count = 2
+
+        updated = reading.model_copy(update={"raw_gpio_state": {"GP0": True}})
+        assert updated.raw_gpio_state == {"GP0": True}
+        assert reading.raw_gpio_state is None
+
+    def test_from_poll_matches_validated_reading(self):
+        """Poll-loop readings carry the same values as validated ones."""
+        timestamp = datetime.now()
+        fields = dict(sensor_id=2, has_filament=True, is_moving=True,
+                      pulse_count=7, distance_mm=20.16049)
+
+        reading = SensorReading.from_poll(timestamp=timestamp, **fields)
+
+        assert reading == SensorReading(timestamp=timestamp, **fields)
+        with pytest.raises(ValueError):
+            SensorReading.from_poll(**{**fields, "distance_mm": -1.0})
+        # Distance is cumulative, so long sessions exceed 10m
+        assert SensorReading.from_poll(**{**fields, "distance_mm": 20000.0}).distance_mm == 20000.0
+
+    def test_validate_json_bulk(self):
+        """A JSON array of readings decodes to validated models."""
+        readings = [
+            SensorReading(sensor_id=i, has_filament=True, is_moving=False,
+                          distance_mm=1.5 * i, pulse_count=i)
+            for i in (1, 2)
+        ]
+        payload = "[" + ",".join(r.model_dump_json() for r in readings) + "]"
+
+        decoded = SensorReading.validate_json_bulk(payload)
+
+        assert decoded == readings
+        with pytest.raises(ValueError):
+            SensorReading.validate_json_bulk(payload.replace('"filament_status"', '"unknown"'))
+
 
 class TestSessionMetricsSimple:
     """Simple tests for SessionMetrics model."""
@@ -95,6 +156,64 @@ class TestSessionMetricsSimple:
         assert metrics.total_distance_mm == 250.0
         assert metrics.total_distance_m == 0.25
 
+    def test_update_uses_single_timestamp(self):
+        """Activity and last-updated times come from the same clock read."""
+        metrics = SessionMetrics()
+        metrics.update_sensor_metrics(sensor_id=2, pulses_delta=1)
+
+        assert metrics.sensor2.last_activity == metrics.last_updated
+
+    def test_update_performance_rejects_negative_poll_time(self):
+        """Poll times are range-checked before the unvalidated model is updated."""
+        metrics = SessionMetrics()
+
+        with pytest.raises(ValueError):
+            metrics.update_performance(poll_time_ms=-1.0)
+        assert metrics.performance.polling_cycles == 0
+
+    def test_average_poll_time_from_running_total(self):
+        """The average poll time is the summed poll time over the cycle count."""
+        metrics = SessionMetrics()
+        for poll_time_ms in (2.0, 4.0, 9.0):
+            metrics.update_performance(poll_time_ms=poll_time_ms)
+
+        assert metrics.performance.total_poll_time_us == 15000
+        assert metrics.performance.average_poll_time_ms == pytest.approx(5.0)
+        assert metrics.performance.model_dump()["average_poll_time_ms"] == pytest.approx(5.0)
+
+    def test_system_status_tracks_active_sensors(self):
+        """Status follows the number of recently active sensors."""
+        metrics = SessionMetrics()
+        assert (metrics.active_sensors, metrics.system_status) == (0, "idle")
+
+        metrics.update_sensor_metrics(sensor_id=1, pulses_delta=1)
+        assert (metrics.active_sensors, metrics.system_status) == (1, "single")
+
+        metrics.update_sensor_metrics(sensor_id=2, pulses_delta=1)
+        summary = metrics.export_summary()
+        assert (summary["active_sensors"], summary["system_status"]) == (2, "dual")
+
+    def test_export_summary_matches_properties(self):
+        """The fused summary reports the same values as the computed properties."""
+        metrics = SessionMetrics()
+        metrics.update_sensor_metrics(sensor_id=1, pulses_delta=10, distance_delta_mm=28.8)
+        metrics.update_sensor_metrics(sensor_id=2, pulses_delta=3, distance_delta_mm=8.64)
+        metrics.update_performance(poll_time_ms=2.0)
+
+        summary = metrics.export_summary()
+
+        assert summary == {
+            "session_hours": metrics.session_duration_hours,
+            "total_distance_m": metrics.total_distance_m,
+            "total_pulses": metrics.total_pulses,
+            "active_sensors": metrics.active_sensors,
+            "system_status": metrics.system_status,
+            "sensor1_distance_m": metrics.sensor1.total_distance_m,
+            "sensor2_distance_m": metrics.sensor2.total_distance_m,
+            "poll_success_rate": metrics.performance.poll_success_rate,
+            "system_healthy": metrics.performance.is_healthy
+        }
+
 
 class TestAlertEventSimple:
     """Simple tests for AlertEvent model."""
@@ -129,4 +248,182 @@ class TestAlertEventSimple:
 
         assert alert.alert_type == "movement_started"
         assert alert.severity == "info"
-        assert alert.sensor_id == 1
\ No newline at end of file
+        assert alert.sensor_id == 1
+
+    def test_runout_factory_matches_validated_alert(self):
+        """The unvalidated runout factory produces the same fields as validation."""
+        alert = AlertEvent.create_runout_alert(sensor_id=2)
+        validated = AlertEvent.model_validate(alert.model_dump())
+
+        assert alert.model_dump() == validated.model_dump()
+        assert alert.to_log_entry() == validated.to_log_entry()
+
+        with pytest.raises(ValueError):
+            AlertEvent.create_runout_alert(sensor_id=3)
+
+    def test_fixed_message_factories_match_validated_alerts(self):
+        """Shutdown and disconnect alerts built without validation still validate."""
+        for alert in (AlertEvent.create_system_shutdown(),
+                      AlertEvent.create_hardware_disconnected()):
+            validated = AlertEvent.model_validate(alert.model_dump())
+            assert alert.model_dump() == validated.model_dump()
+
+        assert AlertEvent.create_hardware_disconnected().requires_attention
+
+    def test_alert_literals_match_enums(self):
+        """The Literal field types accept exactly the enum values."""
+        from typing import get_args
+        from src.models.alert_event import (
+            AlertType, AlertSeverity, AlertTypeLiteral, AlertSeverityLiteral
+        )
+
+        assert get_args(AlertTypeLiteral) == tuple(t.value for t in AlertType)
+        assert get_args(AlertSeverityLiteral) == tuple(s.value for s in AlertSeverity)
+
+        with pytest.raises(ValueError):
+            AlertEvent(alert_type="not_a_type", severity="info", message="x")
+
+    def test_validate_json_bulk(self):
+        """A JSON list of alerts decodes to validated alerts."""
+        alerts = [AlertEvent.create_runout_alert(sensor_id=2), AlertEvent.create_hardware_error("usb")]
+        payload = "[" + ",".join(alert.model_dump_json() for alert in alerts) + "]"
+
+        decoded = AlertEvent.validate_json_bulk(payload)
+
+        assert [alert.model_dump() for alert in decoded] == [alert.model_dump() for alert in alerts]
+        assert decoded[0].requires_attention == alerts[0].requires_attention
+
+        with pytest.raises(ValueError):
+            AlertEvent.validate_json_bulk('[{"alert_type": "runout_detected", '
+                                          '"severity": "warning", "message": "x"}]')
+
+    def test_requires_attention_follows_severity(self):
+        """Attention tracks severity changes and acknowledgement."""
+        alert = AlertEvent.create_runout_alert(sensor_id=1)
+        assert not alert.requires_attention
+
+        alert.severity = "critical"
+        assert alert.requires_attention
+
+        alert.acknowledge()
+        assert not alert.requires_attention
+
+    def test_export_dict_tracks_acknowledgement(self):
+        """Cached export matches model_dump and refreshes on acknowledge."""
+        alert = AlertEvent.create_hardware_error("test", details={"error": "usb"})
+        exported = alert.export_dict()
+        assert exported == alert.model_dump()
+
+        exported["message"] = "changed"
+        assert alert.export_dict()["message"] == "Hardware error: test"
+        exported["details"]["error"] = "changed"
+        assert alert.export_dict()["details"] == {"error": "usb"}
+
+        alert.acknowledge()
+        assert alert.export_dict() == alert.model_dump()
+        assert alert.export_dict()["acknowledged"] is True
+
+
+class TestSystemStatusSimple:
+    """Test SystemStatus singleton behaviour."""
+
+    def test_constructor_returns_shared_instance(self):
+        """Repeat construction returns the same instance without resetting it."""
+        from src.models.system_status import SystemStatus
+
+        SystemStatus.reset_instance()
+        status = SystemStatus.get_instance()
+        status.is_running = True
+
+        assert SystemStatus() is status
+        assert status.is_running
+
+        SystemStatus.reset_instance()
+        assert SystemStatus.get_instance() is not status
+
+    def test_summary_reflects_state_changes(self):
+        """Cached summary and health are refreshed by the mutating methods."""
+        from src.models.system_status import SystemStatus
+        from src.models.sensor_reading import SensorReading
+
+        SystemStatus.reset_instance()
+        status = SystemStatus.get_instance()
+        assert status.system_summary["health"] == "disconnected"
+
+        status.health.hardware_connected = True
+        status.add_alert(AlertEvent.create_hardware_error("test"))
+        assert status.system_summary["health"] == "no_sensors"
+        assert status.system_summary["unacknowledged_alerts"] == 1
+
+        status.update_sensor_reading(SensorReading(
+            sensor_id=1, has_filament=True, is_moving=False, pulse_count=0, distance_mm=0.0
+        ))
+        summary = status.system_summary
+        assert summary["health"] == "partial"
+        assert summary["sensors_active"] == 1
+        assert summary["last_update"] == status.last_update.isoformat()
+
+        status.health.error_count_24h = 11
+        assert status.health.overall_health == "degraded"
+        SystemStatus.reset_instance()
+
+    def test_uptime_counts_from_start(self):
+        """Uptime starts at zero and is measured from start_system."""
+        from src.models.system_status import SystemStatus
+        from src.models.sensor_configuration import SensorConfiguration
+
+        SystemStatus.reset_instance()
+        status = SystemStatus.get_instance()
+        assert status.uptime_seconds == 0.0
+
+        status.start_system(SensorConfiguration())
+        first = status.uptime_seconds
+        assert 0.0 <= first < 1.0
+        assert status.uptime_seconds >= first
+        SystemStatus.reset_instance()
+
+    def test_export_status_json_matches_export_status(self):
+        """JSON export has the export_status shape with ISO timestamps."""
+        import json
+        from src.models.system_status import SystemStatus
+        from src.models.sensor_reading import SensorReading
+
+        SystemStatus.reset_instance()
+        status = SystemStatus.get_instance()
+        reading = SensorReading(
+            sensor_id=2, has_filament=True, is_moving=True, pulse_count=5, distance_mm=14.4
+        )
+        status.update_sensor_reading(reading)
+        status.add_alert(AlertEvent.create_runout_alert(sensor_id=2))
+
+        exported = json.loads(status.export_status_json())
+        expected = status.export_status()
+
+        assert exported.keys() == expected.keys()
+        assert exported["system_summary"] == expected["system_summary"]
+        assert exported["current_readings"]["1"] is None
+        assert exported["current_readings"]["2"] == reading.model_dump(mode="json")
+        assert exported["health"] == status.health.model_dump(mode="json")
+        assert [a["alert_type"] for a in exported["recent_alerts"]] == ["runout_detected"]
+        SystemStatus.reset_instance()
+
+    def test_diagnostics_metrics_follow_updates(self):
+        """Reused metric dumps are refreshed when the metrics change."""
+        from src.models.system_status import SystemStatus
+
+        SystemStatus.reset_instance()
+        status = SystemStatus.get_instance()
+
+        first = status.get_system_diagnostics()
+        assert first["sensors"]["sensor1"]["metrics"] == status.metrics.sensor1.model_dump()
+        first["performance"]["polling_cycles"] = 99
+
+        status.metrics.update_sensor_metrics(sensor_id=1, pulses_delta=4, distance_delta_mm=11.52)
+        status.metrics.update_performance(poll_time_ms=2.0)
+
+        second = status.get_system_diagnostics()
+        sensor1 = second["sensors"]["sensor1"]["metrics"]
+        assert sensor1.pop("time_since_activity") is not None
+        assert sensor1 == status.metrics.sensor1.model_dump(exclude={"time_since_activity"})
+        assert second["performance"] == status.metrics.performance.model_dump()
+        SystemStatus.reset_instance()